@@ -1,21 +1,41 @@
 """Physics Engine Module - Procedural noise, particles, and atmospheric simulation."""
 
-from engine.physics.noise import PerlinNoise, SimplexNoise, FractalNoise, DomainWarp, NoiseConfig
+from engine.physics.noise import (
+    PerlinNoise, SimplexNoise, SimplexNoise3D, FractalNoise, DomainWarp, NoiseConfig,
+    ScrollingFieldCache, NoiseAtlas, NoiseSliceCache, CurlNoiseField,
+    ParallelGridSampler, VectorField
+)
 from engine.physics.particles import (
     Vector2, Particle, ParticleSystem, PhysicsConfig,
     GravityForce, DragForce, WindForce, TurbulenceForce,
-    ForceGenerator, IntegrationType
+    ForceGenerator, IntegrationType,
+    ParticleArrays, ParticleView, ArrayParticleSystem, ParticlePool,
+    FusedForce, compile_force_kernel, FieldForce, SpatialHash,
+    Emitter, EmitterShape, FixedTimestep,
+    SharedParticleArrays, ParallelParticleSystem, create_particle_system,
+    CollisionSurface, FlatGround, CollisionEvents
 )
+from engine.physics.ground import Heightfield, PUDDLE_GLYPHS, DRIFT_GLYPHS
+from engine.physics.simulation import SimulationRunner, Snapshot
 from engine.physics.atmosphere import (
     AtmosphericModel, AtmosphericState, StabilityClass,
     WindModel, calculate_wind_chill, calculate_heat_index
 )
 
 __all__ = [
-    'PerlinNoise', 'SimplexNoise', 'FractalNoise', 'DomainWarp', 'NoiseConfig',
+    'PerlinNoise', 'SimplexNoise', 'SimplexNoise3D', 'FractalNoise', 'DomainWarp', 'NoiseConfig',
+    'ScrollingFieldCache', 'NoiseAtlas', 'NoiseSliceCache', 'CurlNoiseField',
+    'ParallelGridSampler', 'VectorField',
     'Vector2', 'Particle', 'ParticleSystem', 'PhysicsConfig',
     'GravityForce', 'DragForce', 'WindForce', 'TurbulenceForce',
     'ForceGenerator', 'IntegrationType',
+    'ParticleArrays', 'ParticleView', 'ArrayParticleSystem', 'ParticlePool',
+    'FusedForce', 'compile_force_kernel', 'FieldForce', 'SpatialHash',
+    'Emitter', 'EmitterShape', 'FixedTimestep',
+    'SharedParticleArrays', 'ParallelParticleSystem', 'create_particle_system',
+    'CollisionSurface', 'FlatGround', 'CollisionEvents',
+    'Heightfield', 'PUDDLE_GLYPHS', 'DRIFT_GLYPHS',
+    'SimulationRunner', 'Snapshot',
     'AtmosphericModel', 'AtmosphericState', 'StabilityClass',
     'WindModel', 'calculate_wind_chill', 'calculate_heat_index',
 ]
@@ -0,0 +1,171 @@
+"""
+Ground Heightfield Module
+=========================
+Per-column ground layer - puddles, snow cover - driven by particle impacts.
+
+This module provides:
+- Batched impact deposition (one ``np.add.at`` per frame)
+- Evaporation, melting and settling as whole-array operations, with one
+  RNG batch per frame instead of a ``random.random()`` per column
+- Avalanche smoothing: a sand-pile cellular automaton that slides snow
+  off columns steeper than the angle of repose, conserving volume
+- Glyph rendering through a lookup table, as runs of text per row
+
+Heights are in terminal cells above ``base_y`` (the row the layer sits
+on); ``surface_y`` gives the y a falling particle lands at, so a
+Heightfield can be registered as a ``ParticleSystem`` collision surface.
+"""
+from __future__ import annotations
+import math
+import re
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from engine.physics.particles import CollisionSurface
+
+
+# Glyph ramps indexed by whole height (index 0 is bare ground)
+PUDDLE_GLYPHS = (" ", "~", "≈", "∿", "≋")
+DRIFT_GLYPHS = (" ", "░", "▒", "▓", "█")
+
+_GLYPH_RUN = re.compile(r"[^ ]+")
+
+
+class Heightfield(CollisionSurface):
+    """
+    Accumulation height for each of ``width`` columns starting at ``x0``.
+    
+    ``deposit`` takes impact x positions in bulk; each sticks with
+    probability ``capture`` and adds ``amount``. ``step`` runs the
+    per-frame decay: each column evaporates ``evaporation_amount`` with
+    probability ``evaporation``, everything melts by ``melt``, and when
+    ``repose`` is set, ``avalanche`` relaxes slopes steeper than it.
+    Heights are clamped to [0, ``max_height``].
+    
+    With ``wrap`` set, columns outside the strip wrap around (as the
+    ``% width`` indexing in the animations did) and the avalanche treats
+    the strip as a ring; otherwise off-strip impacts are ignored.
+    """
+    
+    def __init__(self, width: int, x0: float = 0.0, base_y: float = 0.0,
+                 max_height: float = 5.0, amount: float = 1.0, capture: float = 1.0,
+                 evaporation: float = 0.0, evaporation_amount: float = 0.1,
+                 melt: float = 0.0, repose: Optional[float] = None,
+                 wrap: bool = False, seed: Optional[int] = None):
+        self.width = width
+        self.x0 = x0
+        self.base_y = base_y
+        self.max_height = max_height
+        self.amount = amount
+        self.capture = capture
+        self.evaporation = evaporation
+        self.evaporation_amount = evaporation_amount
+        self.melt = melt
+        self.repose = repose
+        self.wrap = wrap
+        self.rng = np.random.default_rng(seed)
+        self.heights = np.zeros(width, dtype=np.float64)
+        
+        # Statistics
+        self.impacts = 0
+        self.captured = 0
+    
+    def __len__(self) -> int:
+        return self.width
+    
+    def reset(self):
+        self.heights[:] = 0.0
+    
+    def columns(self, xs: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Column index for each x, and a mask of those on the strip."""
+        cols = np.floor(np.asarray(xs, dtype=np.float64) - self.x0).astype(np.int64)
+        if self.wrap:
+            return cols % self.width, np.ones(cols.shape, dtype=bool)
+        valid = (cols >= 0) & (cols < self.width)
+        return np.where(valid, cols, 0), valid
+    
+    def deposit(self, xs: Union[Sequence[float], np.ndarray],
+                amounts: Union[float, np.ndarray, None] = None) -> int:
+        """Add a batch of impacts at ``xs``; returns how many stuck."""
+        cols, valid = self.columns(xs)
+        self.impacts += len(cols)
+        if self.capture < 1.0:
+            valid &= self.rng.random(len(cols)) < self.capture
+        
+        amount = self.amount if amounts is None else np.asarray(amounts, dtype=np.float64)
+        if np.ndim(amount):
+            amount = amount[valid]
+        cols = cols[valid]
+        np.add.at(self.heights, cols, amount)
+        np.minimum(self.heights, self.max_height, out=self.heights)
+        
+        self.captured += len(cols)
+        return len(cols)
+    
+    def step(self):
+        """One frame of evaporation, melting and (if ``repose`` is set) settling."""
+        heights = self.heights
+        if self.evaporation > 0:
+            drying = self.rng.random(self.width) < self.evaporation
+            heights[drying] -= self.evaporation_amount
+        if self.melt > 0:
+            heights -= self.melt
+        np.maximum(heights, 0.0, out=heights)
+        if self.repose is not None:
+            self.avalanche()
+    
+    def avalanche(self, iterations: int = 1, rate: float = 0.25):
+        """
+        Relax slopes steeper than ``repose``: across each such pair of
+        neighbours ``rate`` of the excess slides downhill. ``rate`` <= 0.25
+        keeps a column from giving away more than it has to spare.
+        """
+        repose = self.repose or 0.0
+        heights = self.heights
+        for _ in range(iterations):
+            if self.wrap:
+                # Flow from column i+1 into column i (negative: i into i+1)
+                slope = np.roll(heights, -1) - heights
+                flow = np.sign(slope) * np.maximum(np.abs(slope) - repose, 0.0) * rate
+                heights += flow - np.roll(flow, 1)
+            else:
+                slope = heights[1:] - heights[:-1]
+                flow = np.sign(slope) * np.maximum(np.abs(slope) - repose, 0.0) * rate
+                heights[:-1] += flow
+                heights[1:] -= flow
+    
+    def levels(self) -> np.ndarray:
+        """Whole-cell height of each column."""
+        return self.heights.astype(np.int64)
+    
+    def surface_y(self, xs: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """Landing y for particles at ``xs`` (``base_y`` minus whole-cell height)."""
+        cols, valid = self.columns(xs)
+        return np.where(valid, self.base_y - self.levels()[cols], self.base_y)
+    
+    def landing_y(self, x: float) -> float:
+        """Scalar ``surface_y``, for the per-particle integration pass."""
+        col = math.floor(x - self.x0)
+        if self.wrap:
+            col %= self.width
+        elif not 0 <= col < self.width:
+            return self.base_y
+        return self.base_y - int(self.heights[col])
+    
+    def glyph_row(self, glyphs: Sequence[str] = DRIFT_GLYPHS) -> str:
+        """One character per column: ``glyphs[level]``, the last for anything taller."""
+        lut = np.asarray(glyphs)
+        return "".join(lut[np.minimum(self.levels(), len(lut) - 1)].tolist())
+    
+    def stacked_rows(self, char: str = "█") -> List[str]:
+        """Rows of ``char`` stacked to each column's level, bottom row first."""
+        levels = self.levels()
+        top = int(levels.max()) if self.width else 0
+        lut = np.array([" ", char])
+        return ["".join(lut[(levels > row).astype(np.int64)].tolist()) for row in range(top)]
+    
+    @staticmethod
+    def runs(row: str) -> List[Tuple[int, str]]:
+        """(column, text) for each run of non-blank glyphs, to print without erasing gaps."""
+        return [(match.start(), match.group()) for match in _GLYPH_RUN.finditer(row)]
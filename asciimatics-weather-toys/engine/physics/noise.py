@@ -5,9 +5,18 @@ Professional-grade noise implementations for natural pattern generation.
 
 This module provides:
 - Perlin Noise (gradient noise with smooth interpolation)
-- Simplex Noise (faster, fewer directional artifacts)
+- Simplex Noise (faster, fewer directional artifacts), 2D and 3D
 - Fractal Brownian Motion (fBm) for multi-scale detail
 - Domain Warping for organic distortion effects
+- Batched (NumPy-vectorized) sampling over grids and point sets
+- Scroll-aware caching of horizontally translating noise fields
+- Pre-baked tileable noise atlases with bilinear lookup
+- Per-frame time-slice caching of 3D (x, y, t) noise
+- Analytic-gradient Perlin noise and divergence-free curl-noise velocity fields
+- Per-frame sampled vector field grids with bilinear particle lookup
+- Frequency-aware octave level-of-detail for fBm
+- Reduced-resolution grid evaluation with bilinear upsampling
+- Process-pool row-parallel grid evaluation via shared memory
 
 Mathematical Foundation:
 - Perlin: Ken Perlin (1983), improved in 2002
@@ -20,11 +29,17 @@ References:
 """
 from __future__ import annotations
 import math
+import os
 import random
-from typing import Tuple, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Tuple, List, Optional, Sequence, Callable, Hashable
 from dataclasses import dataclass
 from functools import lru_cache
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class NoiseConfig:
@@ -36,7 +51,127 @@ class NoiseConfig:
     scale: float = 1.0
 
 
-class PerlinNoise:
+def grid_footprint(xs: Sequence[float], ys: Sequence[float], step: int = 1) -> Optional[float]:
+    """
+    Sampling footprint of a lattice: the finest spacing along either axis,
+    times ``step`` when only every ``step``-th cell is evaluated.
+    Returns None if neither axis has two samples.
+    """
+    spacings = [float(np.min(np.abs(np.diff(axis))))
+                for axis in (np.asarray(xs), np.asarray(ys)) if axis.size > 1]
+    spacings = [d for d in spacings if d > 0]
+    return min(spacings) * max(1, step) if spacings else None
+
+
+def _coarse_axis(n: int, step: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Plan reduced-resolution sampling along one axis of ``n`` cells.
+    
+    Returns (coarse, lo, hi, frac): the indices to evaluate (every
+    ``step``-th cell plus the last one), and for every full-resolution
+    index the bracketing positions into ``coarse`` and the blend weight.
+    """
+    coarse = np.arange(0, n, step)
+    if coarse[-1] != n - 1:
+        coarse = np.append(coarse, n - 1)
+    
+    full = np.arange(n)
+    if len(coarse) == 1:
+        zeros = np.zeros(n, dtype=np.intp)
+        return coarse, zeros, zeros, np.zeros(n)
+    
+    lo = np.clip(np.searchsorted(coarse, full, side='right') - 1, 0, len(coarse) - 2)
+    hi = lo + 1
+    frac = (full - coarse[lo]) / (coarse[hi] - coarse[lo])
+    return coarse, lo, hi, frac
+
+
+def upsample_bilinear(coarse_values: np.ndarray,
+                      x_plan: Tuple[np.ndarray, ...],
+                      y_plan: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Bilinearly expand a coarse (rows, cols) grid to full resolution using
+    per-axis plans from ``_coarse_axis``. Coarse samples are kept exactly.
+    """
+    _, xlo, xhi, xf = x_plan
+    _, ylo, yhi, yf = y_plan
+    
+    rows = coarse_values[:, xlo] * (1.0 - xf) + coarse_values[:, xhi] * xf
+    yf = yf[:, np.newaxis]
+    return rows[ylo, :] * (1.0 - yf) + rows[yhi, :] * yf
+
+
+class _BatchSampling:
+    """
+    Batched entry points shared by all noise generators.
+    
+    Subclasses implement ``sample_array(x, y)`` over broadcastable float64
+    arrays, performing exactly the same floating-point operations as their
+    scalar ``sample()`` so batched and scalar results are bit-identical.
+    """
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
+        raise NotImplementedError
+    
+    def sample_grid(self, xs: Sequence[float], ys: Sequence[float],
+                    lod: bool = False, step: int = 1, **kwargs) -> np.ndarray:
+        """
+        Sample the lattice xs × ys in one vectorized pass.
+        
+        With ``lod=True`` the grid spacing (times ``step``: the spacing
+        actually evaluated) is passed on as the sampling ``footprint``
+        (generators that support octave LOD only).
+        
+        With ``step > 1`` only every ``step``-th row and column (plus the
+        last of each) is evaluated and the rest is bilinearly upsampled,
+        cutting noise cost by roughly step². See ``FrameBudget.noise_step``.
+        
+        Returns array of shape (len(ys), len(xs)), indexed [row][column].
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if lod:
+            kwargs.setdefault('footprint', grid_footprint(xs, ys, step))
+        
+        if step <= 1 or xs.size == 0 or ys.size == 0:
+            return self.sample_array(xs[np.newaxis, :], ys[:, np.newaxis], **kwargs)
+        
+        x_plan = _coarse_axis(xs.size, step)
+        y_plan = _coarse_axis(ys.size, step)
+        coarse = self.sample_array(xs[x_plan[0]][np.newaxis, :],
+                                   ys[y_plan[0]][:, np.newaxis], **kwargs)
+        return upsample_bilinear(coarse, x_plan, y_plan)
+    
+    def sample_many(self, points: Sequence[Tuple[float, float]], **kwargs) -> np.ndarray:
+        """Sample an (N, 2) sequence of (x, y) points. Returns shape (N,)."""
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return self.sample_array(pts[:, 0], pts[:, 1], **kwargs)
+
+
+class _PermutationState:
+    """
+    Compact pickling for permutation-table generators.
+    
+    Only the seed and the 256-entry permutation travel (as ``bytes``); the
+    doubled lists and NumPy lookup arrays are rebuilt on unpickling, so a
+    generator shipped to a worker process costs a few hundred bytes.
+    """
+    
+    def _set_permutation(self, perm: Sequence[int]) -> None:
+        """Install a 0-255 permutation, doubled for overflow-free indexing."""
+        base = list(perm[:256])
+        self._perm = base + base
+        self._perm_array = np.array(self._perm, dtype=np.intp)
+    
+    def __getstate__(self) -> dict:
+        return {'seed': self.seed, 'perm': bytes(self._perm[:256])}
+    
+    def __setstate__(self, state: dict) -> None:
+        self.seed = state['seed']
+        self._set_permutation(state['perm'])
+
+
+class PerlinNoise(_BatchSampling, _PermutationState):
     """
     2D Perlin Noise Generator
     
@@ -55,10 +190,13 @@ class PerlinNoise:
         (1, 0), (-1, 0), (0, 1), (0, -1)
     ]
     
+    _GRAD_X = np.array([g[0] for g in _GRADIENTS_2D], dtype=np.float64)
+    _GRAD_Y = np.array([g[1] for g in _GRADIENTS_2D], dtype=np.float64)
+    
     def __init__(self, seed: Optional[int] = None):
         """Initialize with optional seed for reproducibility."""
         self.seed = seed if seed is not None else int(random.random() * 2**31)
-        self._perm = self._generate_permutation_table()
+        self._set_permutation(self._generate_permutation_table())
     
     def _generate_permutation_table(self) -> List[int]:
         """Generate shuffled permutation table (0-255, doubled for overflow)."""
@@ -131,12 +269,170 @@ class PerlinNoise:
         
         return self._lerp(v, x1, x2)
     
+    @staticmethod
+    def _fade_derivative(t: float) -> float:
+        """Derivative of the fade curve: 30t⁴ - 60t³ + 30t² = 30t²(t - 1)²"""
+        return 30.0 * t * t * (t * (t - 2.0) + 1.0)
+    
+    def sample_with_gradient(self, x: float, y: float) -> Tuple[float, float, float]:
+        """
+        Sample noise and its analytic partial derivatives in one pass.
+        
+        Returns (value, d/dx, d/dy). The value is identical to ``sample()``.
+        
+        With n = g00 + u·(g10-g00) + v·(g01-g00) + uv·(g00-g10-g01+g11),
+        the product rule gives each partial from the corner gradients and
+        the fade derivative, reusing the hashes and dot products.
+        """
+        fx = math.floor(x)
+        fy = math.floor(y)
+        xi = int(fx) & 255
+        yi = int(fy) & 255
+        xf = x - fx
+        yf = y - fy
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        du = self._fade_derivative(xf)
+        dv = self._fade_derivative(yf)
+        
+        perm = self._perm
+        g00 = self._GRADIENTS_2D[perm[perm[xi] + yi] & 7]
+        g01 = self._GRADIENTS_2D[perm[perm[xi] + yi + 1] & 7]
+        g10 = self._GRADIENTS_2D[perm[perm[xi + 1] + yi] & 7]
+        g11 = self._GRADIENTS_2D[perm[perm[xi + 1] + yi + 1] & 7]
+        
+        n00 = g00[0] * xf + g00[1] * yf
+        n10 = g10[0] * (xf - 1) + g10[1] * yf
+        n01 = g01[0] * xf + g01[1] * (yf - 1)
+        n11 = g11[0] * (xf - 1) + g11[1] * (yf - 1)
+        
+        x1 = self._lerp(u, n00, n10)
+        x2 = self._lerp(u, n01, n11)
+        value = self._lerp(v, x1, x2)
+        
+        k1 = n10 - n00
+        k2 = n01 - n00
+        k3 = n00 - n10 - n01 + n11
+        
+        dx = (g00[0] + u * (g10[0] - g00[0]) + v * (g01[0] - g00[0])
+              + u * v * (g00[0] - g10[0] - g01[0] + g11[0]) + du * (k1 + v * k3))
+        dy = (g00[1] + u * (g10[1] - g00[1]) + v * (g01[1] - g00[1])
+              + u * v * (g00[1] - g10[1] - g01[1] + g11[1]) + dv * (k2 + u * k3))
+        
+        return value, dx, dy
+    
+    def sample_with_gradient_array(self, x: np.ndarray, y: np.ndarray
+                                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized ``sample_with_gradient()``. Returns (value, d/dx, d/dy) arrays."""
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                   np.asarray(y, dtype=np.float64))
+        perm = self._perm_array
+        
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        xi = x0.astype(np.intp) & 255
+        yi = y0.astype(np.intp) & 255
+        xf = x - x0
+        yf = y - y0
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        du = self._fade_derivative(xf)
+        dv = self._fade_derivative(yf)
+        
+        h00 = perm[perm[xi] + yi] & 7
+        h01 = perm[perm[xi] + yi + 1] & 7
+        h10 = perm[perm[xi + 1] + yi] & 7
+        h11 = perm[perm[xi + 1] + yi + 1] & 7
+        gx, gy = self._GRAD_X, self._GRAD_Y
+        g00x, g00y = gx[h00], gy[h00]
+        g01x, g01y = gx[h01], gy[h01]
+        g10x, g10y = gx[h10], gy[h10]
+        g11x, g11y = gx[h11], gy[h11]
+        
+        n00 = g00x * xf + g00y * yf
+        n10 = g10x * (xf - 1) + g10y * yf
+        n01 = g01x * xf + g01y * (yf - 1)
+        n11 = g11x * (xf - 1) + g11y * (yf - 1)
+        
+        value = self._lerp(v, self._lerp(u, n00, n10), self._lerp(u, n01, n11))
+        
+        k1 = n10 - n00
+        k2 = n01 - n00
+        k3 = n00 - n10 - n01 + n11
+        uv = u * v
+        
+        dx = (g00x + u * (g10x - g00x) + v * (g01x - g00x)
+              + uv * (g00x - g10x - g01x + g11x) + du * (k1 + v * k3))
+        dy = (g00y + u * (g10y - g00y) + v * (g01y - g00y)
+              + uv * (g00y - g10y - g01y + g11y) + dv * (k2 + u * k3))
+        
+        return value, dx, dy
+    
+    def _gradient_array(self, hash_val: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized gradient dot product."""
+        h = hash_val & 7
+        return self._GRAD_X[h] * x + self._GRAD_Y[h] * y
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray,
+                     period: Optional[int] = None) -> np.ndarray:
+        """
+        Vectorized ``sample()`` over broadcastable coordinate arrays.
+        
+        Row/column broadcasting (as used by ``sample_grid``) keeps the floor,
+        fade and first permutation lookup per-axis rather than per-cell.
+        
+        If ``period`` (lattice cells, at most 256) is given, lattice
+        coordinates wrap at that period so the noise tiles seamlessly.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        perm = self._perm_array
+        
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        xf = x - x0
+        yf = y - y0
+        
+        if period:
+            xi = x0.astype(np.intp) % period
+            yi = y0.astype(np.intp) % period
+            xi1 = (xi + 1) % period
+            yi1 = (yi + 1) % period
+        else:
+            xi = x0.astype(np.intp) & 255
+            yi = y0.astype(np.intp) & 255
+            xi1 = xi + 1
+            yi1 = yi + 1
+        
+        u = self._fade(xf)
+        v = self._fade(yf)
+        
+        pa = perm[xi]
+        pb = perm[xi1]
+        aa = perm[pa + yi]
+        ab = perm[pa + yi1]
+        ba = perm[pb + yi]
+        bb = perm[pb + yi1]
+        
+        x1 = self._lerp(u,
+            self._gradient_array(aa, xf, yf),
+            self._gradient_array(ba, xf - 1, yf)
+        )
+        x2 = self._lerp(u,
+            self._gradient_array(ab, xf, yf - 1),
+            self._gradient_array(bb, xf - 1, yf - 1)
+        )
+        
+        return self._lerp(v, x1, x2)
+    
     def __call__(self, x: float, y: float) -> float:
         """Convenience method: noise(x, y)"""
         return self.sample(x, y)
 
 
-class SimplexNoise:
+class SimplexNoise(_BatchSampling, _PermutationState):
     """
     2D Simplex Noise Generator
     
@@ -162,10 +458,14 @@ class SimplexNoise:
     def __init__(self, seed: Optional[int] = None):
         self.seed = seed if seed is not None else int(random.random() * 2**31)
         rng = random.Random(self.seed)
-        self._perm = list(range(256))
-        rng.shuffle(self._perm)
-        self._perm = self._perm + self._perm
+        perm = list(range(256))
+        rng.shuffle(perm)
+        self._set_permutation(perm)
+    
+    def _set_permutation(self, perm: Sequence[int]) -> None:
+        super()._set_permutation(perm)
         self._perm_mod12 = [x % 12 for x in self._perm]
+        self._perm_mod12_array = np.array(self._perm_mod12, dtype=np.intp)
     
     def sample(self, x: float, y: float) -> float:
         """Sample 2D simplex noise. Returns value in [-1, 1]."""
@@ -223,11 +523,240 @@ class SimplexNoise:
         # Scale to [-1, 1]
         return 70.0 * (n0 + n1 + n2)
     
+    _GRAD3_X = np.array([g[0] for g in _GRAD3], dtype=np.float64)
+    _GRAD3_Y = np.array([g[1] for g in _GRAD3], dtype=np.float64)
+    
+    def _corner_array(self, gi: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized corner contribution (zero outside the kernel radius)."""
+        t = 0.5 - x*x - y*y
+        inside = t >= 0
+        t = t * t
+        n = t * t * (self._GRAD3_X[gi]*x + self._GRAD3_Y[gi]*y)
+        return np.where(inside, n, 0.0)
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized ``sample()`` over broadcastable coordinate arrays."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        x, y = np.broadcast_arrays(x, y)
+        perm = self._perm_array
+        perm12 = self._perm_mod12_array
+        
+        s = (x + y) * self._F2
+        i = np.floor(x + s)
+        j = np.floor(y + s)
+        
+        t = (i + j) * self._G2
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        
+        # Lower triangle when x0 > y0, upper otherwise
+        i1 = (x0 > y0).astype(np.intp)
+        j1 = 1 - i1
+        
+        x1 = x0 - i1 + self._G2
+        y1 = y0 - j1 + self._G2
+        x2 = x0 - 1.0 + 2.0 * self._G2
+        y2 = y0 - 1.0 + 2.0 * self._G2
+        
+        ii = i.astype(np.intp) & 255
+        jj = j.astype(np.intp) & 255
+        gi0 = perm12[ii + perm[jj]]
+        gi1 = perm12[ii + i1 + perm[jj + j1]]
+        gi2 = perm12[ii + 1 + perm[jj + 1]]
+        
+        n0 = self._corner_array(gi0, x0, y0)
+        n1 = self._corner_array(gi1, x1, y1)
+        n2 = self._corner_array(gi2, x2, y2)
+        
+        return 70.0 * (n0 + n1 + n2)
+    
     def __call__(self, x: float, y: float) -> float:
         return self.sample(x, y)
 
 
-class FractalNoise:
+class SimplexNoise3D(_PermutationState):
+    """
+    3D Simplex Noise Generator
+    
+    Typically used as animated 2D noise: sample(x, y, t) with t as time,
+    which evolves the field smoothly instead of just translating it.
+    Same permutation scheme as SimplexNoise; the simplex is a tetrahedron.
+    
+    Returns values in approximately [-1, 1].
+    """
+    
+    # Skewing factors for 3D
+    _F3 = 1.0 / 3.0
+    _G3 = 1.0 / 6.0
+    
+    # Gradient vectors: midpoints of the 12 cube edges
+    _GRAD3: List[Tuple[float, float, float]] = [
+        (1, 1, 0), (-1, 1, 0), (1, -1, 0), (-1, -1, 0),
+        (1, 0, 1), (-1, 0, 1), (1, 0, -1), (-1, 0, -1),
+        (0, 1, 1), (0, -1, 1), (0, 1, -1), (0, -1, -1)
+    ]
+    
+    _GRAD3_X = np.array([g[0] for g in _GRAD3], dtype=np.float64)
+    _GRAD3_Y = np.array([g[1] for g in _GRAD3], dtype=np.float64)
+    _GRAD3_Z = np.array([g[2] for g in _GRAD3], dtype=np.float64)
+    
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed if seed is not None else int(random.random() * 2**31)
+        rng = random.Random(self.seed)
+        perm = list(range(256))
+        rng.shuffle(perm)
+        self._set_permutation(perm)
+    
+    def _set_permutation(self, perm: Sequence[int]) -> None:
+        super()._set_permutation(perm)
+        self._perm_mod12 = [x % 12 for x in self._perm]
+        self._perm_mod12_array = np.array(self._perm_mod12, dtype=np.intp)
+    
+    def _corner(self, gi: int, x: float, y: float, z: float) -> float:
+        t = 0.6 - x*x - y*y - z*z
+        if t < 0:
+            return 0.0
+        t *= t
+        g = self._GRAD3[gi]
+        return t * t * (g[0]*x + g[1]*y + g[2]*z)
+    
+    def sample(self, x: float, y: float, z: float) -> float:
+        """Sample 3D simplex noise. Returns value in [-1, 1]."""
+        G3 = self._G3
+        
+        # Skew input to simplex cell
+        s = (x + y + z) * self._F3
+        i = math.floor(x + s)
+        j = math.floor(y + s)
+        k = math.floor(z + s)
+        
+        # Unskew back
+        t = (i + j + k) * G3
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        z0 = z - (k - t)
+        
+        # Determine which of the six tetrahedra we're in
+        if x0 >= y0:
+            if y0 >= z0:
+                i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 1, 0
+            elif x0 >= z0:
+                i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 0, 1
+            else:
+                i1, j1, k1, i2, j2, k2 = 0, 0, 1, 1, 0, 1
+        else:
+            if y0 < z0:
+                i1, j1, k1, i2, j2, k2 = 0, 0, 1, 0, 1, 1
+            elif x0 < z0:
+                i1, j1, k1, i2, j2, k2 = 0, 1, 0, 0, 1, 1
+            else:
+                i1, j1, k1, i2, j2, k2 = 0, 1, 0, 1, 1, 0
+        
+        x1 = x0 - i1 + G3
+        y1 = y0 - j1 + G3
+        z1 = z0 - k1 + G3
+        x2 = x0 - i2 + 2.0 * G3
+        y2 = y0 - j2 + 2.0 * G3
+        z2 = z0 - k2 + 2.0 * G3
+        x3 = x0 - 1.0 + 3.0 * G3
+        y3 = y0 - 1.0 + 3.0 * G3
+        z3 = z0 - 1.0 + 3.0 * G3
+        
+        # Hash coordinates
+        perm = self._perm
+        perm12 = self._perm_mod12
+        ii = int(i) & 255
+        jj = int(j) & 255
+        kk = int(k) & 255
+        gi0 = perm12[ii + perm[jj + perm[kk]]]
+        gi1 = perm12[ii + i1 + perm[jj + j1 + perm[kk + k1]]]
+        gi2 = perm12[ii + i2 + perm[jj + j2 + perm[kk + k2]]]
+        gi3 = perm12[ii + 1 + perm[jj + 1 + perm[kk + 1]]]
+        
+        n0 = self._corner(gi0, x0, y0, z0)
+        n1 = self._corner(gi1, x1, y1, z1)
+        n2 = self._corner(gi2, x2, y2, z2)
+        n3 = self._corner(gi3, x3, y3, z3)
+        
+        # Scale to [-1, 1]
+        return 32.0 * (n0 + n1 + n2 + n3)
+    
+    def _corner_array(self, gi: np.ndarray, x: np.ndarray, y: np.ndarray,
+                      z: np.ndarray) -> np.ndarray:
+        t = 0.6 - x*x - y*y - z*z
+        inside = t >= 0
+        t = t * t
+        n = t * t * (self._GRAD3_X[gi]*x + self._GRAD3_Y[gi]*y + self._GRAD3_Z[gi]*z)
+        return np.where(inside, n, 0.0)
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """Vectorized ``sample()`` over broadcastable coordinate arrays."""
+        x, y, z = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                      np.asarray(y, dtype=np.float64),
+                                      np.asarray(z, dtype=np.float64))
+        G3 = self._G3
+        perm = self._perm_array
+        perm12 = self._perm_mod12_array
+        
+        s = (x + y + z) * self._F3
+        i = np.floor(x + s)
+        j = np.floor(y + s)
+        k = np.floor(z + s)
+        
+        t = (i + j + k) * G3
+        x0 = x - (i - t)
+        y0 = y - (j - t)
+        z0 = z - (k - t)
+        
+        # Branch-free tetrahedron selection (same cases as sample())
+        xy = x0 >= y0
+        yz = y0 >= z0
+        xz = x0 >= z0
+        i1 = xy & (yz | xz)
+        j1 = ~xy & yz
+        k1 = ~(i1 | j1)
+        i2 = xy | (yz & xz)
+        j2 = ~xy | yz
+        k2 = ~yz | (~xy & ~xz)
+        i1, j1, k1, i2, j2, k2 = (a.astype(np.intp) for a in (i1, j1, k1, i2, j2, k2))
+        
+        x1 = x0 - i1 + G3
+        y1 = y0 - j1 + G3
+        z1 = z0 - k1 + G3
+        x2 = x0 - i2 + 2.0 * G3
+        y2 = y0 - j2 + 2.0 * G3
+        z2 = z0 - k2 + 2.0 * G3
+        x3 = x0 - 1.0 + 3.0 * G3
+        y3 = y0 - 1.0 + 3.0 * G3
+        z3 = z0 - 1.0 + 3.0 * G3
+        
+        ii = i.astype(np.intp) & 255
+        jj = j.astype(np.intp) & 255
+        kk = k.astype(np.intp) & 255
+        gi0 = perm12[ii + perm[jj + perm[kk]]]
+        gi1 = perm12[ii + i1 + perm[jj + j1 + perm[kk + k1]]]
+        gi2 = perm12[ii + i2 + perm[jj + j2 + perm[kk + k2]]]
+        gi3 = perm12[ii + 1 + perm[jj + 1 + perm[kk + 1]]]
+        
+        n0 = self._corner_array(gi0, x0, y0, z0)
+        n1 = self._corner_array(gi1, x1, y1, z1)
+        n2 = self._corner_array(gi2, x2, y2, z2)
+        n3 = self._corner_array(gi3, x3, y3, z3)
+        
+        return 32.0 * (n0 + n1 + n2 + n3)
+    
+    def sample_grid(self, xs: Sequence[float], ys: Sequence[float], z: float) -> np.ndarray:
+        """Sample the (x, y) lattice at a single z. Returns shape (len(ys), len(xs))."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        return self.sample_array(xs[np.newaxis, :], ys[:, np.newaxis], z)
+    
+    def __call__(self, x: float, y: float, z: float) -> float:
+        return self.sample(x, y, z)
+
+
+class FractalNoise(_BatchSampling):
     """
     Fractal Brownian Motion (fBm) Noise
     
@@ -241,36 +770,80 @@ class FractalNoise:
     - octaves: Number of noise layers (detail levels)
     - persistence: Amplitude multiplier per octave (typically 0.5)
     - lacunarity: Frequency multiplier per octave (typically 2.0)
+    
+    Level of detail:
+    Octaves whose features are smaller than the sampling footprint (the
+    distance between neighbouring samples, e.g. one terminal cell) only
+    alias, so passing ``footprint`` skips octaves beyond the Nyquist limit.
+    ``max_octaves`` (see ``set_quality``) caps the count further. Skipped
+    octaves still count towards normalization, so the visible structure
+    keeps its amplitude.
     """
     
     def __init__(self, base_noise: Optional[PerlinNoise] = None, 
-                 config: Optional[NoiseConfig] = None):
+                 config: Optional[NoiseConfig] = None,
+                 max_octaves: Optional[int] = None):
         self.config = config or NoiseConfig()
         self.base_noise = base_noise or PerlinNoise(self.config.seed)
+        self.max_octaves = max_octaves
+    
+    def set_quality(self, quality_level: float):
+        """
+        Cap octaves by a FrameBudget quality level (1.0 = all octaves).
+        """
+        if quality_level >= 1.0:
+            self.max_octaves = None
+        else:
+            self.max_octaves = max(1, int(round(self.config.octaves * quality_level)))
+    
+    def visible_octaves(self, octaves: int, lacunarity: float,
+                        footprint: Optional[float] = None) -> int:
+        """Number of leading octaves worth evaluating (at least 1)."""
+        count = octaves
+        if self.max_octaves is not None:
+            count = min(count, self.max_octaves)
+        
+        if footprint:
+            # Octave i has ~scale·lacunarity^i features per unit; it aliases
+            # once that exceeds half a feature per sample
+            cycles_per_sample = self.config.scale * footprint
+            resolvable = 0
+            while resolvable < count and cycles_per_sample <= 0.5:
+                resolvable += 1
+                cycles_per_sample *= lacunarity
+            count = resolvable
+        
+        return max(1, count)
     
     def sample(self, x: float, y: float, 
                octaves: Optional[int] = None,
                persistence: Optional[float] = None,
-               lacunarity: Optional[float] = None) -> float:
+               lacunarity: Optional[float] = None,
+               footprint: Optional[float] = None) -> float:
         """
         Sample fractal noise at (x, y).
         
+        ``footprint`` is the spacing between neighbouring samples; octaves
+        finer than it are skipped.
+        
         Returns normalized value in approximately [-1, 1].
         """
         octaves = octaves or self.config.octaves
         persistence = persistence or self.config.persistence
         lacunarity = lacunarity or self.config.lacunarity
+        visible = self.visible_octaves(octaves, lacunarity, footprint)
         
         total = 0.0
         frequency = 1.0
         amplitude = 1.0
         max_amplitude = 0.0
         
-        for _ in range(octaves):
-            total += self.base_noise.sample(
-                x * frequency * self.config.scale,
-                y * frequency * self.config.scale
-            ) * amplitude
+        for i in range(octaves):
+            if i < visible:
+                total += self.base_noise.sample(
+                    x * frequency * self.config.scale,
+                    y * frequency * self.config.scale
+                ) * amplitude
             
             max_amplitude += amplitude
             amplitude *= persistence
@@ -279,11 +852,47 @@ class FractalNoise:
         # Normalize to [-1, 1]
         return total / max_amplitude
     
+    def sample_array(self, x: np.ndarray, y: np.ndarray,
+                     octaves: Optional[int] = None,
+                     persistence: Optional[float] = None,
+                     lacunarity: Optional[float] = None,
+                     footprint: Optional[float] = None) -> np.ndarray:
+        """
+        Vectorized ``sample()``: one batched base-noise call per visible octave.
+        
+        The base noise must provide ``sample_array`` (Perlin and Simplex do).
+        """
+        octaves = octaves or self.config.octaves
+        persistence = persistence or self.config.persistence
+        lacunarity = lacunarity or self.config.lacunarity
+        visible = self.visible_octaves(octaves, lacunarity, footprint)
+        
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        total = 0.0
+        frequency = 1.0
+        amplitude = 1.0
+        max_amplitude = 0.0
+        
+        for i in range(octaves):
+            if i < visible:
+                total = total + self.base_noise.sample_array(
+                    x * frequency * self.config.scale,
+                    y * frequency * self.config.scale
+                ) * amplitude
+            
+            max_amplitude += amplitude
+            amplitude *= persistence
+            frequency *= lacunarity
+        
+        return total / max_amplitude
+    
     def __call__(self, x: float, y: float) -> float:
         return self.sample(x, y)
 
 
-class DomainWarp:
+class DomainWarp(_BatchSampling):
     """
     Domain Warping for organic distortion effects.
     
@@ -298,22 +907,730 @@ class DomainWarp:
         self.noise = noise or FractalNoise()
         self.warp_strength = warp_strength
     
-    def sample(self, x: float, y: float) -> float:
-        """Sample domain-warped noise."""
+    def sample(self, x: float, y: float, footprint: Optional[float] = None) -> float:
+        """
+        Sample domain-warped noise. ``footprint`` is forwarded to the
+        underlying fractal for octave LOD.
+        """
+        lod = {} if footprint is None else {'footprint': footprint}
+        
         # First warp pass
-        wx = self.noise.sample(x, y) * self.warp_strength
-        wy = self.noise.sample(x + 5.2, y + 1.3) * self.warp_strength
+        wx = self.noise.sample(x, y, **lod) * self.warp_strength
+        wy = self.noise.sample(x + 5.2, y + 1.3, **lod) * self.warp_strength
         
         # Second warp pass for more organic feel
-        wx2 = self.noise.sample(x + wx, y + wy) * self.warp_strength * 0.5
-        wy2 = self.noise.sample(x + wx + 1.7, y + wy + 9.2) * self.warp_strength * 0.5
+        wx2 = self.noise.sample(x + wx, y + wy, **lod) * self.warp_strength * 0.5
+        wy2 = self.noise.sample(x + wx + 1.7, y + wy + 9.2, **lod) * self.warp_strength * 0.5
+        
+        return self.noise.sample(x + wx + wx2, y + wy + wy2, **lod)
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray,
+                     footprint: Optional[float] = None) -> np.ndarray:
+        """
+        Vectorized ``sample()`` over broadcastable coordinate arrays.
+        
+        The paired lookups of each warp pass are stacked into a single
+        batched noise call, and the first-pass displaced coordinates are
+        computed once and shared by both second-pass lookups and the final
+        sample. Three batched fractal calls replace five scalar ones per point.
+        """
+        lod = {} if footprint is None else {'footprint': footprint}
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                   np.asarray(y, dtype=np.float64))
+        
+        # First warp pass: (x, y) and (x + 5.2, y + 1.3) in one call
+        w = self.noise.sample_array(
+            np.stack((x, x + 5.2)), np.stack((y, y + 1.3)), **lod
+        ) * self.warp_strength
+        px = x + w[0]
+        py = y + w[1]
+        
+        # Second warp pass, reusing the displaced coordinates
+        w2 = self.noise.sample_array(
+            np.stack((px, px + 1.7)), np.stack((py, py + 9.2)), **lod
+        ) * self.warp_strength * 0.5
+        
+        return self.noise.sample_array(px + w2[0], py + w2[1], **lod)
+    
+    def __call__(self, x: float, y: float) -> float:
+        return self.sample(x, y)
+
+
+class ScrollingFieldCache:
+    """
+    Incremental cache for a 2D field that scrolls horizontally over time.
+    
+    Fields like the dashboard cloud band are f(x + offset, y) with a slowly
+    advancing offset. Rather than re-evaluating every cell each frame, the
+    cache keeps a strip of columns sampled on a fixed lattice
+    (x = k * column_step) and, as the offset advances, shifts the strip and
+    evaluates only the newly exposed columns.
+    
+    The visible window snaps to whole lattice columns, so the field moves
+    one character cell at a time. The strip is rebuilt when the width,
+    row coordinates or ``key`` change, on ``invalidate()``, or every
+    ``refresh_interval`` calls (0 = never) for fields that also evolve.
+    
+    Cost: O(rows × width) on rebuild, O(rows × columns scrolled) otherwise.
+    """
+    
+    def __init__(self, field: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                 column_step: float, refresh_interval: int = 0):
+        """
+        Args:
+            field: Batched sampler ``field(xs, ys)`` taking a (1, N) column
+                row and an (R, 1) row column, returning an (R, N) array.
+            column_step: Field-space distance between adjacent columns.
+            refresh_interval: Force a full rebuild every N calls (0 = never).
+        """
+        self.field = field
+        self.column_step = column_step
+        self.refresh_interval = refresh_interval
+        
+        self._strip: Optional[np.ndarray] = None
+        self._start = 0
+        self._rows: Tuple[float, ...] = ()
+        self._key: Hashable = None
+        self._calls_since_rebuild = 0
+        
+        # Statistics
+        self.evaluated_cells = 0
+        self.rebuilds = 0
+    
+    def invalidate(self):
+        """Drop the cached strip; the next ``get`` rebuilds it."""
+        self._strip = None
+    
+    def _evaluate(self, first: int, last: int) -> np.ndarray:
+        """Evaluate lattice columns [first, last) for the cached rows."""
+        xs = np.arange(first, last, dtype=np.float64) * self.column_step
+        ys = np.asarray(self._rows, dtype=np.float64)
+        values = self.field(xs[np.newaxis, :], ys[:, np.newaxis])
+        self.evaluated_cells += values.size
+        return values
+    
+    def get(self, offset: float, width: int, rows: Sequence[float],
+            key: Hashable = None) -> np.ndarray:
+        """
+        Get field values for the window starting at ``offset``.
+        
+        Args:
+            offset: Current scroll position in field-space units.
+            width: Number of columns in the window.
+            rows: Field-space y coordinate of each row.
+            key: Anything whose change should invalidate the cache
+                (e.g. the weather condition).
+        
+        Returns:
+            Array of shape (len(rows), width), indexed [row][column].
+        """
+        start = int(math.floor(offset / self.column_step))
+        rows = tuple(rows)
+        self._calls_since_rebuild += 1
+        
+        stale = (
+            self._strip is None or
+            self._strip.shape[1] != width or
+            rows != self._rows or
+            key != self._key or
+            (self.refresh_interval > 0 and
+             self._calls_since_rebuild >= self.refresh_interval)
+        )
+        shift = start - self._start
+        
+        if stale or abs(shift) >= width:
+            self._rows = rows
+            self._key = key
+            self._strip = self._evaluate(start, start + width)
+            self._calls_since_rebuild = 0
+            self.rebuilds += 1
+        elif shift > 0:
+            exposed = self._evaluate(start + width - shift, start + width)
+            self._strip = np.concatenate((self._strip[:, shift:], exposed), axis=1)
+        elif shift < 0:
+            exposed = self._evaluate(start, self._start)
+            self._strip = np.concatenate((exposed, self._strip[:, :width + shift]), axis=1)
+        
+        self._start = start
+        return self._strip
+
+
+class CurlNoiseField:
+    """
+    Divergence-free 2D velocity field from curl noise.
+    
+    Treats fBm Perlin noise ψ as a stream function and returns its curl,
+    v = (∂ψ/∂y, -∂ψ/∂x). Both components come from one analytic-gradient
+    evaluation per octave (instead of two independent noise fields), and
+    the result is incompressible, so particles swirl rather than bunching
+    up or thinning out.
+    
+    Reference: "Curl-Noise for Procedural Fluid Flow" - Bridson et al., 2007
+    """
+    
+    def __init__(self, noise: Optional[PerlinNoise] = None, octaves: int = 3,
+                 persistence: float = 0.5, lacunarity: float = 2.0,
+                 scale: float = 1.0, strength: float = 1.0):
+        """
+        Args:
+            noise: Base gradient noise (must provide ``sample_with_gradient``).
+            octaves: fBm octaves in the stream function.
+            persistence: Amplitude multiplier per octave.
+            lacunarity: Frequency multiplier per octave.
+            scale: World-to-noise coordinate scale.
+            strength: Velocity multiplier.
+        """
+        self.noise = noise or PerlinNoise()
+        self.octaves = octaves
+        self.persistence = persistence
+        self.lacunarity = lacunarity
+        self.scale = scale
+        self.strength = strength
+    
+    def velocity(self, x: float, y: float, t: float = 0.0) -> Tuple[float, float]:
+        """
+        Velocity at world position (x, y). ``t`` scrolls the stream
+        function along x in noise space, animating the flow.
+        """
+        nx = x * self.scale + t
+        ny = y * self.scale
+        
+        dpsi_dx = 0.0
+        dpsi_dy = 0.0
+        frequency = 1.0
+        amplitude = 1.0
+        max_amplitude = 0.0
+        
+        for _ in range(self.octaves):
+            _, dx, dy = self.noise.sample_with_gradient(nx * frequency, ny * frequency)
+            dpsi_dx += dx * frequency * amplitude
+            dpsi_dy += dy * frequency * amplitude
+            
+            max_amplitude += amplitude
+            amplitude *= self.persistence
+            frequency *= self.lacunarity
+        
+        k = self.strength / max_amplitude
+        return dpsi_dy * k, -dpsi_dx * k
+    
+    def velocity_array(self, x: np.ndarray, y: np.ndarray,
+                       t: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Batched ``velocity()`` for whole particle arrays."""
+        nx = np.asarray(x, dtype=np.float64) * self.scale + t
+        ny = np.asarray(y, dtype=np.float64) * self.scale
+        
+        dpsi_dx = 0.0
+        dpsi_dy = 0.0
+        frequency = 1.0
+        amplitude = 1.0
+        max_amplitude = 0.0
+        
+        for _ in range(self.octaves):
+            _, dx, dy = self.noise.sample_with_gradient_array(nx * frequency, ny * frequency)
+            dpsi_dx = dpsi_dx + dx * frequency * amplitude
+            dpsi_dy = dpsi_dy + dy * frequency * amplitude
+            
+            max_amplitude += amplitude
+            amplitude *= self.persistence
+            frequency *= self.lacunarity
+        
+        k = self.strength / max_amplitude
+        return dpsi_dy * k, -dpsi_dx * k
+    
+    def __call__(self, x: float, y: float) -> Tuple[float, float]:
+        """Convenience: usable directly as ``WindForce(turbulence_func=...)``."""
+        return self.velocity(x, y)
+
+
+class VectorField:
+    """
+    Per-frame sampled 2D vector field.
+    
+    Evaluates a batched source on a node lattice covering ``bounds`` once
+    per ``update(t)``, then serves any number of particle lookups by
+    bilinear interpolation. Source cost scales with the number of grid
+    nodes rather than particles × octaves; ``cell_size`` trades detail for
+    speed (smooth fields such as curl noise need only a few cells per node).
+    Lookups outside the bounds clamp to the edge.
+    
+    Usage:
+        field = VectorField(curl.velocity_array, bounds=(0, 0, 80, 24), cell_size=4)
+        field.update(t)          # once per frame
+        u, v = field(x, y)       # per particle (usable as a turbulence_func)
+    """
+    
+    def __init__(self, source: Callable[[np.ndarray, np.ndarray, float],
+                                        Tuple[np.ndarray, np.ndarray]],
+                 bounds: Tuple[float, float, float, float], cell_size: float = 1.0):
+        """
+        Args:
+            source: Batched field ``source(x, y, t) -> (u, v)`` over 2D arrays,
+                e.g. ``CurlNoiseField.velocity_array``.
+            bounds: (x_min, y_min, x_max, y_max) region to cover.
+            cell_size: Node spacing in world units (terminal cells).
+        """
+        self.source = source
+        self.cell_size = cell_size
+        self.resize(bounds)
+        
+        # Statistics
+        self.updates = 0
+        self.evaluated_nodes = 0
+    
+    def resize(self, bounds: Tuple[float, float, float, float]):
+        """Cover a new region (e.g. after a terminal resize). Field reads zero until updated."""
+        x_min, y_min, x_max, y_max = bounds
+        self.bounds = bounds
+        self.columns = max(2, int(math.ceil((x_max - x_min) / self.cell_size)) + 1)
+        self.rows = max(2, int(math.ceil((y_max - y_min) / self.cell_size)) + 1)
+        self.xs = x_min + np.arange(self.columns) * self.cell_size
+        self.ys = y_min + np.arange(self.rows) * self.cell_size
+        self.u = np.zeros((self.rows, self.columns))
+        self.v = np.zeros((self.rows, self.columns))
+        self._u_flat = self.u.ravel().tolist()
+        self._v_flat = self.v.ravel().tolist()
+        self.time = None
+    
+    def update(self, t: float = 0.0):
+        """Re-evaluate the source on the node lattice at time ``t``."""
+        x = np.broadcast_to(self.xs[np.newaxis, :], (self.rows, self.columns))
+        y = np.broadcast_to(self.ys[:, np.newaxis], (self.rows, self.columns))
+        u, v = self.source(x, y, t)
+        self.u = np.ascontiguousarray(np.broadcast_to(u, x.shape), dtype=np.float64)
+        self.v = np.ascontiguousarray(np.broadcast_to(v, x.shape), dtype=np.float64)
+        # Flat Python lists for fast scalar lookups (NumPy scalar indexing is slow)
+        self._u_flat = self.u.ravel().tolist()
+        self._v_flat = self.v.ravel().tolist()
+        self.time = t
+        self.updates += 1
+        self.evaluated_nodes += self.rows * self.columns
+    
+    def sample(self, x: float, y: float) -> Tuple[float, float]:
+        """Bilinearly interpolated field value at world position (x, y)."""
+        gx = (x - self.bounds[0]) / self.cell_size
+        gy = (y - self.bounds[1]) / self.cell_size
+        last_x = self.columns - 2
+        last_y = self.rows - 2
+        
+        if gx <= 0.0:
+            i, fx = 0, 0.0
+        elif gx >= last_x + 1:
+            i, fx = last_x, 1.0
+        else:
+            i = int(gx)
+            if i > last_x:
+                i = last_x
+            fx = gx - i
+        if gy <= 0.0:
+            j, fy = 0, 0.0
+        elif gy >= last_y + 1:
+            j, fy = last_y, 1.0
+        else:
+            j = int(gy)
+            if j > last_y:
+                j = last_y
+            fy = gy - j
+        
+        k = j * self.columns + i
+        k2 = k + self.columns
+        u, v = self._u_flat, self._v_flat
+        u0 = u[k] + (u[k + 1] - u[k]) * fx
+        u1 = u[k2] + (u[k2 + 1] - u[k2]) * fx
+        v0 = v[k] + (v[k + 1] - v[k]) * fx
+        v1 = v[k2] + (v[k2 + 1] - v[k2]) * fx
+        return u0 + (u1 - u0) * fy, v0 + (v1 - v0) * fy
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Batched ``sample()``: same interpolation over position arrays."""
+        gx = np.clip((np.asarray(x, dtype=np.float64) - self.bounds[0]) / self.cell_size,
+                     0.0, self.columns - 1)
+        gy = np.clip((np.asarray(y, dtype=np.float64) - self.bounds[1]) / self.cell_size,
+                     0.0, self.rows - 1)
+        i = np.minimum(gx.astype(np.intp), self.columns - 2)
+        j = np.minimum(gy.astype(np.intp), self.rows - 2)
+        fx = gx - i
+        fy = gy - j
         
-        return self.noise.sample(x + wx + wx2, y + wy + wy2)
+        results = []
+        for grid in (self.u, self.v):
+            g00 = grid[j, i]
+            g01 = grid[j, i + 1]
+            g10 = grid[j + 1, i]
+            g11 = grid[j + 1, i + 1]
+            top = g00 + (g01 - g00) * fx
+            bottom = g10 + (g11 - g10) * fx
+            results.append(top + (bottom - top) * fy)
+        return results[0], results[1]
+    
+    def __call__(self, x: float, y: float) -> Tuple[float, float]:
+        return self.sample(x, y)
+
+
+class NoiseSliceCache:
+    """
+    Per-frame cache of a time slice of 3D noise, served by bilinear lookup.
+    
+    Drop-in ``noise_func(x, y, t)`` for ``TurbulenceForce``. The first lookup
+    at a new ``t`` discards the previous slice; the (x, y) plane at that ``t``
+    is then evaluated lazily in batched tiles of ``tile_size``² lattice
+    points spaced ``cell_size`` apart, and every particle lookup in the same
+    frame is a bilinear read from those tiles. Noise cost becomes
+    proportional to the area the particles cover rather than their count.
+    
+    ``cell_size`` is in noise units; choose it to match one screen cell
+    (e.g. 0.1 when positions are scaled by 0.1 before sampling).
+    """
+    
+    def __init__(self, noise: Optional[SimplexNoise3D] = None,
+                 cell_size: float = 0.1, tile_size: int = 16):
+        self.noise = noise or SimplexNoise3D()
+        self.cell_size = cell_size
+        self.tile_size = tile_size
+        
+        self.time: Optional[float] = None
+        self._tiles: dict = {}
+        
+        # Statistics
+        self.evaluated_points = 0
+        self.slices = 0
+    
+    def _set_time(self, t: float):
+        if t != self.time:
+            self.time = t
+            self._tiles.clear()
+            self.slices += 1
+    
+    def _tile(self, tx: int, ty: int) -> List[float]:
+        """Evaluate (or fetch) a tile as a flat row-major list."""
+        key = (tx, ty)
+        tile = self._tiles.get(key)
+        if tile is None:
+            n = self.tile_size
+            coords = np.arange(n + 1, dtype=np.float64)
+            xs = (tx * n + coords) * self.cell_size
+            ys = (ty * n + coords) * self.cell_size
+            values = self.noise.sample_grid(xs, ys, self.time)
+            self.evaluated_points += values.size
+            tile = values.ravel().tolist()
+            self._tiles[key] = tile
+        return tile
+    
+    def sample(self, x: float, y: float, t: float) -> float:
+        """Bilinear lookup in the slice at time t."""
+        self._set_time(t)
+        n = self.tile_size
+        gx = x / self.cell_size
+        gy = y / self.cell_size
+        fx = math.floor(gx)
+        fy = math.floor(gy)
+        u = gx - fx
+        v = gy - fy
+        
+        tx = int(fx) // n
+        ty = int(fy) // n
+        tile = self._tile(tx, ty)
+        
+        stride = n + 1
+        i = (int(fy) - ty * n) * stride + (int(fx) - tx * n)
+        top = tile[i] + u * (tile[i + 1] - tile[i])
+        bottom = tile[i + stride] + u * (tile[i + stride + 1] - tile[i + stride])
+        return top + v * (bottom - top)
+    
+    def __call__(self, x: float, y: float, t: float) -> float:
+        return self.sample(x, y, t)
+
+
+DEFAULT_ATLAS_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'asciimatics-weather-toys'
+
+
+class NoiseAtlas(_BatchSampling):
+    """
+    Pre-baked, seamlessly tileable fractal noise texture.
+    
+    Bakes ``octaves`` of periodic Perlin noise once into a float32
+    ``resolution × resolution`` texture covering ``period`` noise units,
+    then serves samples by wrapped bilinear interpolation. A lookup is four
+    texel reads instead of several octaves of gradient noise, at the cost
+    of detail finer than one texel.
+    
+    The result has the character of ``FractalNoise`` with the same seed and
+    octave settings, but repeats every ``period`` units on both axes.
+    
+    Usage:
+        atlas = NoiseAtlas.load_or_bake(seed=42)
+        value = atlas.sample(x * 0.02 + t, y * 0.02)
+    """
+    
+    def __init__(self, seed: int = 42, resolution: int = 256, period: int = 8,
+                 octaves: int = 4, persistence: float = 0.5, lacunarity: int = 2,
+                 texture: Optional[np.ndarray] = None):
+        """
+        Args:
+            seed: Permutation seed for the underlying Perlin noise.
+            resolution: Texels per side.
+            period: Noise units covered by one tile (lattice cells at octave 0).
+            octaves: Octaves baked into the texture.
+            persistence: Amplitude multiplier per octave.
+            lacunarity: Integer frequency multiplier per octave (keeps tiling).
+            texture: Pre-baked texture to adopt instead of baking.
+        """
+        if period * lacunarity ** (octaves - 1) > 256:
+            raise ValueError("period * lacunarity^(octaves-1) must not exceed 256")
+        
+        self.seed = seed
+        self.resolution = resolution
+        self.period = period
+        self.octaves = octaves
+        self.persistence = persistence
+        self.lacunarity = int(lacunarity)
+        
+        if texture is None:
+            texture = self._bake()
+        self.texture = np.ascontiguousarray(texture, dtype=np.float32)
+        
+        # Flat Python list for fast scalar lookups (NumPy scalar indexing is slow)
+        self._texels = self.texture.ravel().tolist()
+        self._texel_scale = resolution / period
+    
+    def __getstate__(self) -> dict:
+        # The texel list is a cache of the texture; rebuild it on unpickling
+        state = self.__dict__.copy()
+        del state['_texels']
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._texels = self.texture.ravel().tolist()
+    
+    @staticmethod
+    def cache_name(seed: int, resolution: int, period: int, octaves: int,
+                   persistence: float, lacunarity: int) -> str:
+        """File name identifying an atlas by its bake parameters."""
+        return (f"noise_atlas_s{seed}_r{resolution}_p{period}"
+                f"_o{octaves}_g{persistence}_l{int(lacunarity)}.npy")
+    
+    @property
+    def cache_key(self) -> str:
+        return self.cache_name(self.seed, self.resolution, self.period,
+                               self.octaves, self.persistence, self.lacunarity)
+    
+    def _bake(self) -> np.ndarray:
+        """Sum periodic Perlin octaves over one tile."""
+        noise = PerlinNoise(self.seed)
+        coords = np.arange(self.resolution, dtype=np.float64) * (self.period / self.resolution)
+        
+        total = np.zeros((self.resolution, self.resolution))
+        frequency = 1
+        amplitude = 1.0
+        max_amplitude = 0.0
+        
+        for _ in range(self.octaves):
+            total += noise.sample_array(
+                coords[np.newaxis, :] * frequency,
+                coords[:, np.newaxis] * frequency,
+                period=self.period * frequency
+            ) * amplitude
+            
+            max_amplitude += amplitude
+            amplitude *= self.persistence
+            frequency *= self.lacunarity
+        
+        return total / max_amplitude
+    
+    def sample(self, x: float, y: float) -> float:
+        """Wrapped bilinear lookup at noise coordinates (x, y)."""
+        res = self.resolution
+        tx = x * self._texel_scale
+        ty = y * self._texel_scale
+        fx = math.floor(tx)
+        fy = math.floor(ty)
+        u = tx - fx
+        v = ty - fy
+        
+        x0 = int(fx) % res
+        y0 = int(fy) % res
+        x1 = (x0 + 1) % res
+        row0 = y0 * res
+        row1 = ((y0 + 1) % res) * res
+        
+        t = self._texels
+        top = t[row0 + x0] + u * (t[row0 + x1] - t[row0 + x0])
+        bottom = t[row1 + x0] + u * (t[row1 + x1] - t[row1 + x0])
+        return top + v * (bottom - top)
+    
+    def sample_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized wrapped bilinear lookup."""
+        res = self.resolution
+        tx = np.asarray(x, dtype=np.float64) * self._texel_scale
+        ty = np.asarray(y, dtype=np.float64) * self._texel_scale
+        fx = np.floor(tx)
+        fy = np.floor(ty)
+        u = tx - fx
+        v = ty - fy
+        
+        x0 = fx.astype(np.intp) % res
+        y0 = fy.astype(np.intp) % res
+        x1 = (x0 + 1) % res
+        y1 = (y0 + 1) % res
+        
+        # Gather in float64 so results match the scalar path
+        tex = self.texture
+        t00 = tex[y0, x0].astype(np.float64)
+        t01 = tex[y0, x1].astype(np.float64)
+        t10 = tex[y1, x0].astype(np.float64)
+        t11 = tex[y1, x1].astype(np.float64)
+        
+        top = t00 + u * (t01 - t00)
+        bottom = t10 + u * (t11 - t10)
+        return top + v * (bottom - top)
+    
+    def save(self, cache_dir: Optional[Path] = None) -> Optional[Path]:
+        """Persist the texture. Returns the file path, or None on failure."""
+        cache_dir = Path(cache_dir or DEFAULT_ATLAS_CACHE_DIR)
+        path = cache_dir / self.cache_key
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, self.texture)
+            os.replace(tmp, path)
+            return path
+        except OSError:
+            return None
+    
+    @classmethod
+    def load_or_bake(cls, cache_dir: Optional[Path] = None, **params) -> 'NoiseAtlas':
+        """
+        Load a previously baked atlas with matching parameters, or bake and
+        persist a new one. Unreadable or mismatched cache files are rebaked.
+        """
+        atlas_params = dict(seed=42, resolution=256, period=8,
+                            octaves=4, persistence=0.5, lacunarity=2)
+        atlas_params.update(params)
+        
+        path = Path(cache_dir or DEFAULT_ATLAS_CACHE_DIR) / cls.cache_name(**atlas_params)
+        
+        try:
+            texture = np.load(path, allow_pickle=False)
+            res = atlas_params['resolution']
+            if texture.shape == (res, res):
+                return cls(texture=texture, **atlas_params)
+        except (OSError, ValueError):
+            pass
+        
+        atlas = cls(**atlas_params)
+        atlas.save(cache_dir)
+        return atlas
     
     def __call__(self, x: float, y: float) -> float:
         return self.sample(x, y)
 
 
+def _sample_band(generator: _BatchSampling, xs: np.ndarray, ys: np.ndarray,
+                 shm_name: str, shape: Tuple[int, int], row: int,
+                 kwargs: dict) -> int:
+    """Worker: evaluate one row band straight into the shared result grid."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        out[row:row + ys.size] = generator.sample_grid(xs, ys, **kwargs)
+        del out  # release the buffer export before closing
+    finally:
+        shm.close()
+    return ys.size
+
+
+class ParallelGridSampler:
+    """
+    Row-parallel grid evaluation on a process pool.
+    
+    Splits ``sample_grid`` into horizontal bands, evaluates each band in a
+    worker process and collects the values through a shared-memory block,
+    so only the (compactly pickled) generator and the axis coordinates
+    cross the process boundary. Grids below ``min_cells`` are evaluated
+    in-process, where pool dispatch would cost more than it saves.
+    
+    Results are identical to ``generator.sample_grid`` for ``step=1``; with
+    ``step > 1`` each band is upsampled separately.
+    
+    Usage:
+        with ParallelGridSampler(max_workers=4) as sampler:
+            field = sampler.sample_grid(fractal, xs, ys)
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None,
+                 min_cells: int = 40000, min_band_rows: int = 8):
+        """
+        Args:
+            max_workers: Worker processes (default: CPU count).
+            min_cells: Smallest grid (rows × columns) sent to the pool.
+            min_band_rows: Smallest band handed to a single worker.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_cells = min_cells
+        self.min_band_rows = max(1, min_band_rows)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        # Statistics
+        self.parallel_calls = 0
+        self.inline_calls = 0
+    
+    def bands(self, rows: int) -> List[Tuple[int, int]]:
+        """Split ``rows`` into contiguous [start, stop) bands, one per worker."""
+        count = max(1, min(self.max_workers, rows // self.min_band_rows))
+        edges = np.linspace(0, rows, count + 1).round().astype(int)
+        return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+    
+    def sample_grid(self, generator: _BatchSampling, xs: Sequence[float],
+                    ys: Sequence[float], **kwargs) -> np.ndarray:
+        """
+        Evaluate ``generator.sample_grid(xs, ys, **kwargs)``, in parallel
+        when the grid is large enough. Returns shape (len(ys), len(xs)).
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if kwargs.pop('lod', False):
+            kwargs.setdefault('footprint', grid_footprint(xs, ys, kwargs.get('step', 1)))
+        
+        shape = (ys.size, xs.size)
+        bands = self.bands(ys.size)
+        if xs.size * ys.size < self.min_cells or len(bands) < 2:
+            self.inline_calls += 1
+            return generator.sample_grid(xs, ys, **kwargs)
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        
+        shm = shared_memory.SharedMemory(create=True, size=8 * shape[0] * shape[1])
+        try:
+            futures = [self._executor.submit(_sample_band, generator, xs, ys[a:b],
+                                             shm.name, shape, a, kwargs)
+                       for a, b in bands]
+            for future in futures:
+                future.result()
+            result = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        self.parallel_calls += 1
+        return result
+    
+    def close(self) -> None:
+        """Shut down the worker pool (restarted lazily on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self) -> 'ParallelGridSampler':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 # Convenience factory functions
 def create_perlin(seed: int = None) -> PerlinNoise:
     """Create a Perlin noise generator."""
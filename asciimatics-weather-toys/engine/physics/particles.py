@@ -5,9 +5,17 @@ Physically accurate particle simulation with configurable integrators.
 
 This module provides:
 - Multiple integration methods (Euler, Verlet, RK4)
+- Adaptive (CFL-bounded) substepping
 - Proper force accumulation (gravity, drag, buoyancy, wind)
 - Collision detection and response
-- Spatial partitioning for performance
+- Ground collision surfaces (flat / per-column), hits reported as a
+  batch of events from the integration pass
+- Spatial partitioning for performance (uniform grid / spatial hash)
+- Structure-of-arrays NumPy backend for large particle counts
+- Fused per-step force kernel compiled from the registered generators
+- Rate-based emitters (point / line / rect) spawning in batches
+- Fixed-timestep clock with render interpolation between steps
+- Multi-process band-parallel backend over shared-memory arrays
 
 Physics Model:
 - Newtonian mechanics: F = ma
@@ -21,16 +29,25 @@ References:
 """
 from __future__ import annotations
 import math
-from typing import Tuple, List, Optional, Callable
-from dataclasses import dataclass, field
+import os
+import textwrap
+import time
+import weakref
+from typing import Tuple, List, Optional, Callable, Sequence, Union
+from dataclasses import dataclass, field, fields, MISSING
 from enum import Enum, auto
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
 
 
 # Physical constants (SI units, scaled for terminal animation)
 EARTH_GRAVITY = 9.81  # m/s² (scaled down for visual appeal)
 AIR_DENSITY = 1.225   # kg/m³ at sea level
 TERMINAL_SCALE = 0.1  # Scale factor for terminal display
+EXPIRY_MARGIN = 5     # Cells beyond the bounds before a particle is culled
 
 
 class IntegrationType(Enum):
@@ -51,14 +68,61 @@ class PhysicsConfig:
     substeps: int = 1                         # Physics substeps per frame
     max_velocity: float = 10.0                # Velocity clamp
     bounds_check: bool = True
+    fused_forces: bool = True                 # Compiled force kernel vs per-generator apply()
+    adaptive_substeps: bool = False           # Pick substeps per frame from particle speed
+    max_substeps: int = 8                     # Upper bound for adaptive substeps
+    max_step_distance: float = 0.5            # CFL bound: cells moved per substep
+    interpolate: bool = False                 # Record last_position each update for rendering
+    parallel_workers: int = 0                 # >1: band-parallel worker processes (see create_particle_system)
+
 
+def _slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` (``@dataclass(slots=True)`` for
+    Python < 3.10): no per-instance ``__dict__``, faster attribute access.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
+
+@_slotted
 @dataclass
 class Vector2:
-    """2D vector with common operations."""
+    """
+    2D vector with common operations.
+    
+    Operators return new vectors; the in-place mutators (``set``, ``iadd``,
+    ``iscale``, ``add_scaled``) update and return ``self`` and are what the
+    force generators and integrators use, so stepping allocates nothing.
+    """
     x: float = 0.0
     y: float = 0.0
     
+    def set(self, x: float, y: float) -> 'Vector2':
+        self.x = x
+        self.y = y
+        return self
+    
+    def iadd(self, other: 'Vector2') -> 'Vector2':
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def iscale(self, scalar: float) -> 'Vector2':
+        self.x *= scalar
+        self.y *= scalar
+        return self
+    
+    def add_scaled(self, other: 'Vector2', k: float) -> 'Vector2':
+        """self += other * k"""
+        self.x += other.x * k
+        self.y += other.y * k
+        return self
+    
     def __add__(self, other: 'Vector2') -> 'Vector2':
         return Vector2(self.x + other.x, self.y + other.y)
     
@@ -107,6 +171,7 @@ class Vector2:
         return cls(math.cos(angle) * magnitude, math.sin(angle) * magnitude)
 
 
+@_slotted
 @dataclass
 class Particle:
     """
@@ -121,6 +186,9 @@ class Particle:
     # Previous position for Verlet integration
     prev_position: Vector2 = field(default_factory=Vector2)
     
+    # Position before the last system update (render interpolation)
+    last_position: Vector2 = field(default_factory=Vector2)
+    
     # Physical properties
     mass: float = 1.0
     inverse_mass: float = 1.0  # Cached for efficiency
@@ -146,41 +214,70 @@ class Particle:
     # Force accumulator (reset each frame)
     _accumulated_force: Vector2 = field(default_factory=Vector2)
     
+    # ParticlePool that handed this particle out (None: caller-owned)
+    _pool: Optional['ParticlePool'] = field(default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         self.inverse_mass = 1.0 / self.mass if self.mass > 0 else 0.0
         self.prev_position = Vector2(self.position.x, self.position.y)
+        self.last_position = Vector2(self.position.x, self.position.y)
+    
+    def reset(self, x: float = 0.0, y: float = 0.0, vx: float = 0.0, vy: float = 0.0,
+              **properties):
+        """
+        Re-initialize in place for reuse from a ``ParticlePool``: default
+        properties, then ``properties`` overrides. Keeps the vector objects.
+        """
+        self.position.set(x, y)
+        self.prev_position.set(x, y)
+        self.last_position.set(x, y)
+        self.velocity.set(vx, vy)
+        self.acceleration.set(0.0, 0.0)
+        self._accumulated_force.set(0.0, 0.0)
+        for name, value in _PARTICLE_DEFAULTS.items():
+            setattr(self, name, value)
+        for name, value in properties.items():
+            setattr(self, name, value)
+        self.inverse_mass = 1.0 / self.mass if self.mass > 0 else 0.0
     
     def apply_force(self, force: Vector2):
         """Accumulate force for this frame."""
-        self._accumulated_force = self._accumulated_force + force
+        self._accumulated_force.iadd(force)
+    
+    def apply_scaled_force(self, direction: Vector2, magnitude: float):
+        """Accumulate ``direction * magnitude`` without building the force vector."""
+        self._accumulated_force.add_scaled(direction, magnitude)
     
     def apply_impulse(self, impulse: Vector2):
         """Apply instantaneous change in momentum."""
-        self.velocity = self.velocity + impulse * self.inverse_mass
+        self.velocity.add_scaled(impulse, self.inverse_mass)
     
     def clear_forces(self):
         """Reset force accumulator."""
-        self._accumulated_force = Vector2()
+        self._accumulated_force.set(0.0, 0.0)
     
     def integrate_euler(self, dt: float):
         """Simple Euler integration. Fast but least accurate."""
+        force = self._accumulated_force
+        
         # a = F/m
-        self.acceleration = self._accumulated_force * self.inverse_mass
+        self.acceleration.set(force.x * self.inverse_mass, force.y * self.inverse_mass)
         
         # v += a * dt
-        self.velocity = self.velocity + self.acceleration * dt
+        self.velocity.add_scaled(self.acceleration, dt)
         
         # x += v * dt
-        self.position = self.position + self.velocity * dt
+        self.position.add_scaled(self.velocity, dt)
     
     def integrate_semi_implicit(self, dt: float):
         """
         Semi-implicit Euler (Symplectic Euler).
         Updates velocity first, then position. Better energy conservation.
         """
-        self.acceleration = self._accumulated_force * self.inverse_mass
-        self.velocity = self.velocity + self.acceleration * dt
-        self.position = self.position + self.velocity * dt
+        force = self._accumulated_force
+        self.acceleration.set(force.x * self.inverse_mass, force.y * self.inverse_mass)
+        self.velocity.add_scaled(self.acceleration, dt)
+        self.position.add_scaled(self.velocity, dt)
     
     def integrate_verlet(self, dt: float):
         """
@@ -188,32 +285,79 @@ class Particle:
         Excellent for constraints, doesn't store velocity explicitly.
         x(t+dt) = 2x(t) - x(t-dt) + a*dt²
         """
-        self.acceleration = self._accumulated_force * self.inverse_mass
+        force = self._accumulated_force
+        self.acceleration.set(force.x * self.inverse_mass, force.y * self.inverse_mass)
         
         # Store current position
-        temp = Vector2(self.position.x, self.position.y)
+        position, previous = self.position, self.prev_position
+        x, y = position.x, position.y
         
         # Verlet step
-        self.position = (
-            self.position * 2 - 
-            self.prev_position + 
-            self.acceleration * (dt * dt)
-        )
+        dt_sq = dt * dt
+        position.set(x * 2 - previous.x + self.acceleration.x * dt_sq,
+                     y * 2 - previous.y + self.acceleration.y * dt_sq)
         
         # Update previous position
-        self.prev_position = temp
+        previous.set(x, y)
         
         # Derive velocity for other calculations
-        self.velocity = (self.position - self.prev_position) / dt
+        self.velocity.set((position.x - x) / dt, (position.y - y) / dt)
+    
+    def integrate_rk4(self, dt: float,
+                      acceleration_func: Optional[Callable[['Particle'], Tuple[float, float]]] = None):
+        """
+        Classical 4th-order Runge-Kutta on (position, velocity).
+        
+        The first slope comes from the accumulated force. For the other
+        three, the particle is moved to each trial state and
+        ``acceleration_func(particle)`` is called there. Without it the
+        force is held constant, which RK4 integrates exactly.
+        """
+        position, velocity = self.position, self.velocity
+        x0, y0, vx0, vy0 = position.x, position.y, velocity.x, velocity.y
+        force = self._accumulated_force
+        a1x, a1y = force.x * self.inverse_mass, force.y * self.inverse_mass
+        half = dt * 0.5
+        
+        if acceleration_func is None:
+            a2x, a2y = a3x, a3y = a4x, a4y = a1x, a1y
+        else:
+            # Trial states: position advanced by the previous slope's velocity
+            position.set(x0 + vx0 * half, y0 + vy0 * half)
+            velocity.set(vx0 + a1x * half, vy0 + a1y * half)
+            a2x, a2y = acceleration_func(self)
+            
+            position.set(x0 + (vx0 + a1x * half) * half, y0 + (vy0 + a1y * half) * half)
+            velocity.set(vx0 + a2x * half, vy0 + a2y * half)
+            a3x, a3y = acceleration_func(self)
+            
+            position.set(x0 + (vx0 + a2x * half) * dt, y0 + (vy0 + a2y * half) * dt)
+            velocity.set(vx0 + a3x * dt, vy0 + a3y * dt)
+            a4x, a4y = acceleration_func(self)
+        
+        # Velocity slopes: k1 = v0, k2 = v0 + a1·h/2, k3 = v0 + a2·h/2, k4 = v0 + a3·h
+        sixth = dt / 6.0
+        position.set(
+            x0 + sixth * (6.0 * vx0 + (a1x + a2x) * dt + a3x * dt),
+            y0 + sixth * (6.0 * vy0 + (a1y + a2y) * dt + a3y * dt))
+        self.acceleration.set((a1x + 2.0 * a2x + 2.0 * a3x + a4x) / 6.0,
+                              (a1y + 2.0 * a2y + 2.0 * a3y + a4y) / 6.0)
+        velocity.set(vx0 + self.acceleration.x * dt, vy0 + self.acceleration.y * dt)
     
-    def integrate(self, dt: float, method: IntegrationType = IntegrationType.SEMI_IMPLICIT):
-        """Integrate using specified method."""
+    def integrate(self, dt: float, method: IntegrationType = IntegrationType.SEMI_IMPLICIT,
+                  acceleration_func: Optional[Callable[['Particle'], Tuple[float, float]]] = None):
+        """
+        Integrate using specified method. ``acceleration_func`` lets RK4
+        re-evaluate forces at its trial states (see ``integrate_rk4``).
+        """
         if method == IntegrationType.EULER:
             self.integrate_euler(dt)
         elif method == IntegrationType.SEMI_IMPLICIT:
             self.integrate_semi_implicit(dt)
         elif method == IntegrationType.VERLET:
             self.integrate_verlet(dt)
+        elif method == IntegrationType.RK4:
+            self.integrate_rk4(dt, acceleration_func)
         
         self.age += 1
         
@@ -227,7 +371,7 @@ class Particle:
             return True
         
         x_min, y_min, x_max, y_max = bounds
-        margin = 5
+        margin = EXPIRY_MARGIN
         
         return (
             self.position.x < x_min - margin or
@@ -237,13 +381,121 @@ class Particle:
         )
 
 
+_PARTICLE_DEFAULTS = {f.name: f.default for f in fields(Particle)
+                      if f.default is not MISSING and f.name != '_pool'}
+
+
+class ParticlePool:
+    """
+    Free-list recycler for short-lived particles.
+    
+    Pre-allocates ``capacity`` objects; ``spawn`` hands one out after
+    ``reset(*args, **kwargs)`` and ``release`` puts it back. When the free
+    list is empty a new object is built (a miss); released objects beyond
+    ``capacity`` are dropped for the GC. Works with any class providing
+    ``reset`` (``Particle`` by default).
+    
+    Handed-out objects are tagged with their pool (``_pool``); ``release``
+    ignores anything this pool did not hand out (caller-built particles)
+    or has already taken back, so those are never recycled under their
+    owner's reference.
+    """
+    
+    def __init__(self, capacity: int = 256, factory: Callable[[], object] = Particle):
+        self.capacity = capacity
+        self.factory = factory
+        self._free = [factory() for _ in range(capacity)]
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+    
+    def spawn(self, *args, **kwargs):
+        """Take a particle from the free list (or build one) and reset it."""
+        if self._free:
+            obj = self._free.pop()
+            self.hits += 1
+        else:
+            obj = self.factory()
+            self.misses += 1
+        obj.reset(*args, **kwargs)
+        obj._pool = self
+        
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+    
+    def release(self, obj):
+        """Return a particle to the free list (if it came from this pool)."""
+        if getattr(obj, '_pool', None) is not self:
+            return
+        obj._pool = None
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+    
+    @property
+    def available(self) -> int:
+        return len(self._free)
+    
+    def get_stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 1.0,
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'available': self.available,
+        }
+
+
+@dataclass
+class FusedForce:
+    """
+    Source fragments a force generator contributes to the fused kernel.
+    
+    ``setup`` runs once per step and ``body`` once per particle. Both are
+    ``str.format`` templates: ``{gen}`` names the generator object and
+    ``{v}`` is a prefix for the generator's private locals. The body may
+    read ``p``, ``x``, ``y``, ``vx``, ``vy``, ``dt`` and ``sqrt`` and must
+    add its force to ``fx`` and ``fy``.
+    """
+    setup: str = ""
+    body: str = ""
+
+
 class ForceGenerator(ABC):
     """Abstract base class for force generators."""
     
+    def begin_step(self, dt: float):
+        """Called once per (sub)step before any particle is processed."""
+        pass
+    
+    def fused_source(self) -> Optional[FusedForce]:
+        """
+        Inline source for ``compile_force_kernel``, or None to have the
+        kernel call ``apply`` for this generator instead.
+        """
+        return None
+    
     @abstractmethod
     def apply(self, particle: Particle, dt: float):
         """Apply force to particle."""
         pass
+    
+    def apply_batch(self, arrays: 'ParticleArrays', dt: float):
+        """
+        Accumulate force into ``arrays.force`` for every live particle.
+        
+        Generic fallback: calls ``apply`` on a per-particle view. Override
+        with whole-array operations for speed.
+        """
+        for view in arrays.views():
+            self.apply(view, dt)
 
 
 class GravityForce(ForceGenerator):
@@ -259,8 +511,27 @@ class GravityForce(ForceGenerator):
     def apply(self, particle: Particle, dt: float):
         # Effective gravity accounting for buoyancy
         effective_g = self.gravity * (1.0 - particle.buoyancy_factor)
-        force = self.direction * (particle.mass * effective_g)
-        particle.apply_force(force)
+        particle.apply_scaled_force(self.direction, particle.mass * effective_g)
+    
+    def fused_source(self) -> FusedForce:
+        return FusedForce(
+            setup="""
+                {v}g = {gen}.gravity
+                {v}dx = {gen}.direction.x
+                {v}dy = {gen}.direction.y
+            """,
+            body="""
+                {v}k = p.mass * ({v}g * (1.0 - p.buoyancy_factor))
+                fx += {v}dx * {v}k
+                fy += {v}dy * {v}k
+            """)
+    
+    def apply_batch(self, arrays: 'ParticleArrays', dt: float):
+        n = arrays.count
+        effective_g = self.gravity * (1.0 - arrays.buoyancy_factor[:n])
+        weight = arrays.mass[:n] * effective_g
+        arrays.force[:n, 0] += self.direction.x * weight
+        arrays.force[:n, 1] += self.direction.y * weight
 
 
 class DragForce(ForceGenerator):
@@ -281,14 +552,44 @@ class DragForce(ForceGenerator):
             # Drag magnitude proportional to v²
             drag_magnitude = self.coefficient * speed_sq * particle.drag_coefficient
             
-            # Drag direction opposite to velocity
-            drag_direction = -velocity.normalized()
-            
             # Limit drag to not exceed current momentum
             max_drag = speed_sq / dt * particle.mass
             drag_magnitude = min(drag_magnitude, max_drag * 0.99)
             
-            particle.apply_force(drag_direction * drag_magnitude)
+            # Drag direction opposite to velocity: -v/|v| * magnitude
+            particle.apply_scaled_force(velocity, -(drag_magnitude / math.sqrt(speed_sq)))
+    
+    def fused_source(self) -> FusedForce:
+        return FusedForce(
+            setup="""
+                {v}c = {gen}.coefficient
+            """,
+            body="""
+                {v}sq = vx * vx + vy * vy
+                if {v}sq > 0.0001:
+                    {v}m = min({v}c * {v}sq * p.drag_coefficient, {v}sq / dt * p.mass * 0.99)
+                    {v}s = -({v}m / sqrt({v}sq))
+                    fx += vx * {v}s
+                    fy += vy * {v}s
+            """)
+    
+    def apply_batch(self, arrays: 'ParticleArrays', dt: float):
+        n = arrays.count
+        vx = arrays.velocity[:n, 0]
+        vy = arrays.velocity[:n, 1]
+        speed_sq = vx * vx + vy * vy
+        
+        drag_magnitude = np.minimum(
+            self.coefficient * speed_sq * arrays.drag_coefficient[:n],
+            speed_sq / dt * arrays.mass[:n] * 0.99
+        )
+        drag_magnitude *= speed_sq > 0.0001
+        # Floor only affects the (zeroed) slow particles; avoids 0/0
+        speed = np.sqrt(np.maximum(speed_sq, 0.0001))
+        
+        scale = drag_magnitude / speed
+        arrays.force[:n, 0] -= vx * scale
+        arrays.force[:n, 1] -= vy * scale
 
 
 class WindForce(ForceGenerator):
@@ -299,25 +600,82 @@ class WindForce(ForceGenerator):
     """
     
     def __init__(self, base_velocity: Vector2 = None, 
-                 turbulence_func: Callable[[float, float], Tuple[float, float]] = None):
+                 turbulence_func: Callable[[float, float], Tuple[float, float]] = None,
+                 turbulence_many: Callable[[np.ndarray, np.ndarray],
+                                           Tuple[Sequence[float], Sequence[float]]] = None):
+        """
+        Args:
+            base_velocity: Uniform wind velocity.
+            turbulence_func: Per-position wind offset, (x, y) -> (tx, ty).
+            turbulence_many: Batched form of ``turbulence_func`` taking
+                position arrays; used by ``apply_batch`` when provided.
+                Defaults to ``turbulence_func.sample_array`` if it has one
+                (e.g. a ``VectorField``).
+        """
         self.base_velocity = base_velocity or Vector2()
         self.turbulence_func = turbulence_func
+        if turbulence_many is None:
+            # A sampled VectorField is its own batched form
+            turbulence_many = getattr(turbulence_func, 'sample_array', None)
+        self.turbulence_many = turbulence_many
+        self._relative = Vector2()  # Scratch vector reused across particles
     
     def apply(self, particle: Particle, dt: float):
         # Get wind at particle position
-        wind = Vector2(self.base_velocity.x, self.base_velocity.y)
+        wind_x, wind_y = self.base_velocity.x, self.base_velocity.y
         
         # Add turbulence if available
         if self.turbulence_func:
             tx, ty = self.turbulence_func(particle.position.x, particle.position.y)
-            wind = wind + Vector2(tx, ty)
+            wind_x += tx
+            wind_y += ty
         
         # Relative velocity (wind - particle velocity)
-        relative = wind - particle.velocity
+        velocity = particle.velocity
+        relative = self._relative.set(wind_x - velocity.x, wind_y - velocity.y)
         
         # Force proportional to relative velocity
-        force = relative * 0.1 * particle.drag_coefficient
-        particle.apply_force(force)
+        particle.apply_scaled_force(relative, 0.1 * particle.drag_coefficient)
+    
+    def fused_source(self) -> FusedForce:
+        return FusedForce(
+            setup="""
+                {v}bx = {gen}.base_velocity.x
+                {v}by = {gen}.base_velocity.y
+                {v}tf = {gen}.turbulence_func
+            """,
+            body="""
+                {v}wx = {v}bx
+                {v}wy = {v}by
+                if {v}tf:
+                    {v}tx, {v}ty = {v}tf(x, y)
+                    {v}wx += {v}tx
+                    {v}wy += {v}ty
+                {v}k = 0.1 * p.drag_coefficient
+                fx += ({v}wx - vx) * {v}k
+                fy += ({v}wy - vy) * {v}k
+            """)
+    
+    def apply_batch(self, arrays: 'ParticleArrays', dt: float):
+        n = arrays.count
+        position = arrays.position[:n]
+        wind_x = np.full(n, float(self.base_velocity.x))
+        wind_y = np.full(n, float(self.base_velocity.y))
+        
+        if self.turbulence_many:
+            tx, ty = self.turbulence_many(position[:, 0], position[:, 1])
+            wind_x += np.asarray(tx, dtype=np.float64)
+            wind_y += np.asarray(ty, dtype=np.float64)
+        elif self.turbulence_func:
+            offsets = [self.turbulence_func(x, y) for x, y in position.tolist()]
+            if offsets:
+                turbulence = np.asarray(offsets, dtype=np.float64)
+                wind_x += turbulence[:, 0]
+                wind_y += turbulence[:, 1]
+        
+        k = 0.1 * arrays.drag_coefficient[:n]
+        arrays.force[:n, 0] += (wind_x - arrays.velocity[:n, 0]) * k
+        arrays.force[:n, 1] += (wind_y - arrays.velocity[:n, 1]) * k
 
 
 class TurbulenceForce(ForceGenerator):
@@ -325,6 +683,9 @@ class TurbulenceForce(ForceGenerator):
     Turbulent force using noise function.
     
     Applies semi-random forces based on position for natural-looking motion.
+    The field time advances once per step (not per particle), so a
+    ``NoiseSliceCache`` over ``SimplexNoise3D`` can serve every particle
+    from a single slice of (x, y, t) noise.
     """
     
     def __init__(self, noise_func: Callable[[float, float, float], float] = None,
@@ -333,10 +694,12 @@ class TurbulenceForce(ForceGenerator):
         self.strength = strength
         self.time_scale = time_scale
         self.time = 0.0
+        self._force = Vector2()  # Scratch vector reused across particles
     
-    def apply(self, particle: Particle, dt: float):
+    def begin_step(self, dt: float):
         self.time += dt * self.time_scale
-        
+    
+    def apply(self, particle: Particle, dt: float):
         if self.noise_func:
             # Sample noise for x and y force components
             fx = self.noise_func(
@@ -351,7 +714,488 @@ class TurbulenceForce(ForceGenerator):
                 self.time
             ) * self.strength
             
-            particle.apply_force(Vector2(fx, fy))
+            particle.apply_force(self._force.set(fx, fy))
+    
+    def fused_source(self) -> FusedForce:
+        return FusedForce(
+            setup="""
+                {v}nf = {gen}.noise_func
+                {v}s = {gen}.strength
+                {v}t = {gen}.time
+            """,
+            body="""
+                if {v}nf:
+                    {v}fx = {v}nf(x * 0.1, y * 0.1, {v}t) * {v}s
+                    {v}fy = {v}nf(x * 0.1 + 100, y * 0.1, {v}t) * {v}s
+                    fx += {v}fx
+                    fy += {v}fy
+            """)
+
+
+class FieldForce(ForceGenerator):
+    """
+    Force sampled from a precomputed vector field: F = strength · field(x, y).
+    
+    Pair with ``engine.physics.noise.VectorField`` so turbulence is
+    evaluated once per frame on a grid instead of per particle; the
+    field's owner calls ``field.update(t)`` each frame.
+    """
+    
+    def __init__(self, field: Callable[[float, float], Tuple[float, float]],
+                 strength: float = 1.0):
+        """
+        Args:
+            field: ``field(x, y) -> (fx, fy)``; ``field.sample_array`` is
+                used for the array backend when available.
+            strength: Force multiplier.
+        """
+        self.field = field
+        self.strength = strength
+        self._force = Vector2()  # Scratch vector reused across particles
+    
+    def apply(self, particle: Particle, dt: float):
+        fx, fy = self.field(particle.position.x, particle.position.y)
+        particle.apply_scaled_force(self._force.set(fx, fy), self.strength)
+    
+    def fused_source(self) -> FusedForce:
+        return FusedForce(
+            setup="""
+                {v}f = {gen}.field
+                {v}s = {gen}.strength
+            """,
+            body="""
+                {v}fx, {v}fy = {v}f(x, y)
+                fx += {v}fx * {v}s
+                fy += {v}fy * {v}s
+            """)
+    
+    def apply_batch(self, arrays: 'ParticleArrays', dt: float):
+        sample_array = getattr(self.field, 'sample_array', None)
+        if sample_array is None:
+            super().apply_batch(arrays, dt)
+            return
+        n = arrays.count
+        fx, fy = sample_array(arrays.position[:n, 0], arrays.position[:n, 1])
+        arrays.force[:n, 0] += fx * self.strength
+        arrays.force[:n, 1] += fy * self.strength
+
+
+def _defining_class(cls: type, name: str) -> type:
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
+def _fused_source(generator: ForceGenerator) -> Optional[FusedForce]:
+    """
+    ``generator.fused_source()``, unless a subclass overrides ``apply``
+    without also overriding ``fused_source`` (the inherited source would
+    silently replace the new ``apply``).
+    """
+    cls = type(generator)
+    if not issubclass(_defining_class(cls, 'fused_source'), _defining_class(cls, 'apply')):
+        return None
+    return generator.fused_source()
+
+
+def compile_force_kernel(generators: Sequence[ForceGenerator]) -> Callable:
+    """
+    Fuse ``generators`` into one per-step particle loop.
+    
+    Generators that provide ``fused_source`` are inlined, accumulating the
+    net force in two local floats; the rest (including subclasses that
+    override only ``apply``) get a generic ``apply`` call.
+    Each particle is then integrated and velocity-clamped in the same pass.
+    Floating-point operations match the per-generator path exactly.
+    
+    Returns ``kernel(particles, dt, method, max_velocity, acceleration_func=None,
+    cull=None, collide=None)``; generator parameters are read once per call,
+    so they may change between steps. ``acceleration_func`` is passed
+    through to RK4. ``cull`` is an optional ``(x_lo, y_lo, x_hi, y_hi,
+    release)``: dead or out-of-window particles are then handed to
+    ``release`` and compacted out of ``particles`` in place, in the same
+    pass. ``collide`` is an optional ``(landing_y, hits, release)``: live
+    particles at or below ``landing_y(x)`` are appended to ``hits`` as
+    ``(index, x, vx, vy)`` and compacted out the same way.
+    """
+    setup: List[str] = []
+    body: List[str] = []
+    namespace = {'sqrt': math.sqrt}
+    
+    for i, generator in enumerate(generators):
+        gen = f"_gen{i}"
+        namespace[gen] = generator
+        fused = _fused_source(generator)
+        if fused is None:
+            body.append(textwrap.dedent(f"""
+                force.set(fx, fy)
+                {gen}.apply(p, dt)
+                fx = force.x
+                fy = force.y
+                x = pos.x
+                y = pos.y
+                vx = vel.x
+                vy = vel.y
+            """).strip("\n"))
+            continue
+        v = f"_g{i}_"
+        setup.append(textwrap.dedent(fused.setup).strip("\n").format(gen=gen, v=v))
+        body.append(textwrap.dedent(fused.body).strip("\n").format(gen=gen, v=v))
+    
+    source = "\n".join([
+        "def kernel(particles, dt, method, max_velocity, acceleration_func=None, cull=None,",
+        "           collide=None):",
+        textwrap.indent("\n".join(setup), "    "),
+        "    compact = cull is not None or collide is not None",
+        "    if cull is not None:",
+        "        x_lo, y_lo, x_hi, y_hi, release = cull",
+        "    if collide is not None:",
+        "        landing_y, hits, release = collide",
+        "    kept = 0",
+        "    for i, p in enumerate(particles):",
+        "        pos = p.position",
+        "        vel = p.velocity",
+        "        force = p._accumulated_force",
+        "        x = pos.x",
+        "        y = pos.y",
+        "        vx = vel.x",
+        "        vy = vel.y",
+        "        fx = 0.0",
+        "        fy = 0.0",
+        textwrap.indent("\n".join(body), "        "),
+        "        force.set(fx, fy)",
+        "        p.integrate(dt, method, acceleration_func)",
+        "        speed = vel.magnitude",
+        "        if speed > max_velocity:",
+        "            vel.iscale(max_velocity / speed)",
+        "        if compact:",
+        "            if collide is not None and p.alive and pos.y >= landing_y(pos.x):",
+        "                hits.append((i, pos.x, vel.x, vel.y))",
+        "                release(p)",
+        "                continue",
+        "            if cull is not None and (not p.alive or pos.x < x_lo or pos.x > x_hi or",
+        "                                     pos.y < y_lo or pos.y > y_hi):",
+        "                release(p)",
+        "                continue",
+        "            particles[kept] = p",
+        "            kept += 1",
+        "    if compact:",
+        "        del particles[kept:]",
+    ])
+    exec(compile(source, "<fused force kernel>", "exec"), namespace)
+    kernel = namespace['kernel']
+    kernel.source = source
+    return kernel
+
+
+class FixedTimestep:
+    """
+    Accumulator clock that decouples simulation rate from render rate.
+    
+    Real time is accumulated and consumed in fixed steps of ``1 / hz``
+    seconds, each advancing the simulation by ``dt``; weather speed then
+    no longer depends on how long frames take. ``alpha`` is the fraction
+    of a step left over, for interpolating between the last two states.
+    At most ``max_steps`` run per call: time beyond that is dropped so a
+    stall cannot trigger an ever-growing catch-up.
+    """
+    
+    def __init__(self, hz: float = 30.0, dt: float = 1.0, max_steps: int = 5):
+        self.hz = hz
+        self.step = 1.0 / hz
+        self.dt = dt
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self._last_tick: Optional[float] = None
+        
+        # Statistics
+        self.steps = 0
+        self.dropped = 0.0  # seconds discarded by the max_steps cap
+    
+    @property
+    def alpha(self) -> float:
+        """Progress towards the next step, in [0, 1)."""
+        return self.accumulator / self.step
+    
+    def advance(self, elapsed: float) -> int:
+        """Add ``elapsed`` seconds; returns how many steps are now due."""
+        self.accumulator += max(0.0, elapsed)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step
+        else:
+            self.accumulator -= steps * self.step
+        self.steps += steps
+        return steps
+    
+    def tick(self, now: Optional[float] = None) -> int:
+        """``advance`` by the wall time since the previous tick (none on the first)."""
+        now = time.perf_counter() if now is None else now
+        elapsed = 0.0 if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        return self.advance(elapsed)
+    
+    def until_next(self, now: Optional[float] = None) -> float:
+        """Seconds from ``now`` until the next step is due."""
+        remaining = self.step - self.accumulator
+        if self._last_tick is not None:
+            now = time.perf_counter() if now is None else now
+            remaining -= now - self._last_tick
+        return max(0.0, remaining)
+    
+    def reset(self):
+        self.accumulator = 0.0
+        self._last_tick = None
+
+
+def _particle_position(particle) -> Tuple[float, float]:
+    position = particle.position
+    return position.x, position.y
+
+
+class SpatialHash:
+    """
+    Uniform grid over particle positions, one bucket per occupied cell.
+    
+    With the default ``cell_size`` of 1.0 a cell is a terminal cell, so
+    renderers and ground checks can ask for "what is in this row / this
+    rectangle" without scanning every particle. Buckets are kept between
+    frames: ``update`` only moves particles whose cell changed and drops
+    those no longer in the system.
+    
+    ``position`` maps an item to its (x, y); the default reads
+    ``particle.position`` (engine particles), ``lambda p: (p.x, p.y)``
+    suits the simpler particle classes. Items are tracked by identity.
+    """
+    
+    def __init__(self, cell_size: float = 1.0,
+                 position: Callable[[object], Tuple[float, float]] = _particle_position):
+        self.cell_size = cell_size
+        self.position = position
+        self._inv_cell = 1.0 / cell_size
+        # rows[cy][cx] -> {id(item): item}; empty buckets and rows are pruned
+        self._rows: dict = {}
+        self._where: dict = {}
+        
+        # Statistics
+        self.moves = 0
+    
+    def __len__(self) -> int:
+        return len(self._where)
+    
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Cell (column, row) containing world point (x, y)."""
+        inv = self._inv_cell
+        return math.floor(x * inv), math.floor(y * inv)
+    
+    def _add(self, key: int, item, cx: int, cy: int):
+        row = self._rows.get(cy)
+        if row is None:
+            row = self._rows[cy] = {}
+        bucket = row.get(cx)
+        if bucket is None:
+            bucket = row[cx] = {}
+        bucket[key] = item
+    
+    def _discard(self, key: int, cx: int, cy: int):
+        row = self._rows[cy]
+        bucket = row[cx]
+        del bucket[key]
+        if not bucket:
+            del row[cx]
+            if not row:
+                del self._rows[cy]
+    
+    def insert(self, item):
+        """Add (or re-file) one item at its current position."""
+        x, y = self.position(item)
+        cell = self.cell_of(x, y)
+        key = id(item)
+        old = self._where.get(key)
+        if old == cell:
+            return
+        if old is not None:
+            self._discard(key, *old)
+        self._add(key, item, *cell)
+        self._where[key] = cell
+    
+    def remove(self, item):
+        """Forget an item (no-op if it is not in the hash)."""
+        cell = self._where.pop(id(item), None)
+        if cell is not None:
+            self._discard(id(item), *cell)
+    
+    def update(self, items: Sequence):
+        """
+        Bring the hash in line with ``items``: re-file the ones that moved
+        to another cell, drop the ones no longer present.
+        """
+        position = self.position
+        inv = self._inv_cell
+        floor = math.floor
+        old_where = self._where
+        where = {}
+        moves = 0
+        for item in items:
+            x, y = position(item)
+            cell = (floor(x * inv), floor(y * inv))
+            key = id(item)
+            old = old_where.pop(key, None)
+            if old != cell:
+                if old is not None:
+                    self._discard(key, *old)
+                self._add(key, item, *cell)
+                moves += 1
+            where[key] = cell
+        for key, cell in old_where.items():
+            self._discard(key, *cell)
+        self._where = where
+        self.moves = moves
+    
+    def rebuild(self, items: Sequence):
+        """Drop everything and file ``items`` from scratch."""
+        self.clear()
+        self.update(items)
+    
+    def clear(self):
+        self._rows.clear()
+        self._where.clear()
+    
+    def in_cell(self, cx: int, cy: int) -> List:
+        """Items in cell (cx, cy)."""
+        bucket = self._rows.get(cy, {}).get(cx)
+        return list(bucket.values()) if bucket else []
+    
+    def in_rect(self, x0: float, y0: float, x1: float, y1: float) -> List:
+        """
+        Items in the cells overlapping [x0, x1) × [y0, y1). Cell-granular:
+        exact for cell-aligned bounds, otherwise filter the result.
+        Unbounded sides may be given as ±inf.
+        """
+        inv = self._inv_cell
+        cy0 = -math.inf if y0 == -math.inf else math.floor(y0 * inv)
+        cy1 = math.inf if y1 == math.inf else math.ceil(y1 * inv)
+        cx0 = -math.inf if x0 == -math.inf else math.floor(x0 * inv)
+        cx1 = math.inf if x1 == math.inf else math.ceil(x1 * inv)
+        found = []
+        for cy, row in self._rows.items():
+            if cy0 <= cy < cy1:
+                for cx, bucket in row.items():
+                    if cx0 <= cx < cx1:
+                        found.extend(bucket.values())
+        return found
+    
+    def in_row(self, y: float) -> List:
+        """Items in the row of cells containing ``y``."""
+        row = self._rows.get(math.floor(y * self._inv_cell))
+        if not row:
+            return []
+        found = []
+        for bucket in row.values():
+            found.extend(bucket.values())
+        return found
+    
+    def near(self, x: float, y: float, r: float) -> List:
+        """Items within distance ``r`` of (x, y) (exact, not cell-granular)."""
+        inv = self._inv_cell
+        position = self.position
+        r2 = r * r
+        found = []
+        for cy in range(math.floor((y - r) * inv), math.floor((y + r) * inv) + 1):
+            row = self._rows.get(cy)
+            if not row:
+                continue
+            for cx in range(math.floor((x - r) * inv), math.floor((x + r) * inv) + 1):
+                bucket = row.get(cx)
+                if not bucket:
+                    continue
+                for item in bucket.values():
+                    px, py = position(item)
+                    dx = px - x
+                    dy = py - y
+                    if dx * dx + dy * dy <= r2:
+                        found.append(item)
+        return found
+    
+    def count(self, cx: int, cy: int) -> int:
+        """Number of items in cell (cx, cy)."""
+        bucket = self._rows.get(cy, {}).get(cx)
+        return len(bucket) if bucket else 0
+    
+    def counts(self) -> dict:
+        """Occupancy of every non-empty cell: {(cx, cy): count}."""
+        return {(cx, cy): len(bucket)
+                for cy, row in self._rows.items()
+                for cx, bucket in row.items()}
+
+
+class CollisionSurface(ABC):
+    """
+    Ground that falling particles land on.
+    
+    ``surface_y`` gives the landing y for a batch of x positions; a
+    particle at or below it (``y >= surface_y(x)``) has hit. Subclasses
+    may override ``landing_y`` with a cheaper scalar version for the
+    per-particle integration pass.
+    """
+    
+    @abstractmethod
+    def surface_y(self, xs: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """Landing y for each x in ``xs``."""
+        pass
+    
+    def landing_y(self, x: float) -> float:
+        """Landing y at a single ``x``."""
+        return float(self.surface_y(np.array([x]))[0])
+
+
+class FlatGround(CollisionSurface):
+    """Level ground at ``y``."""
+    
+    def __init__(self, y: float):
+        self.y = y
+    
+    def surface_y(self, xs: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        return np.full(np.shape(xs), self.y, dtype=np.float64)
+    
+    def landing_y(self, x: float) -> float:
+        return self.y
+
+
+@dataclass
+class CollisionEvents:
+    """
+    Particles that reached a collision surface during an update, one
+    entry per hit. ``index`` is the particle's position in ``particles``
+    at the start of the update (the particle itself has been removed).
+    """
+    index: np.ndarray      # int64, shape (n,)
+    x: np.ndarray          # impact x, shape (n,)
+    velocity: np.ndarray   # impact velocity, shape (n, 2)
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    @classmethod
+    def empty(cls) -> 'CollisionEvents':
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros((0, 2)))
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[int, float, float, float]]) -> 'CollisionEvents':
+        """Build from ``(index, x, vx, vy)`` rows, as the object path collects them."""
+        if not rows:
+            return cls.empty()
+        table = np.array(rows, dtype=np.float64)
+        return cls(table[:, 0].astype(np.int64), table[:, 1], table[:, 2:4])
+    
+    @classmethod
+    def concatenate(cls, batches: Sequence['CollisionEvents']) -> 'CollisionEvents':
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        return cls(np.concatenate([b.index for b in batches]),
+                   np.concatenate([b.x for b in batches]),
+                   np.concatenate([b.velocity for b in batches]))
 
 
 class ParticleSystem:
@@ -361,40 +1205,135 @@ class ParticleSystem:
     Features:
     - Force generator registry
     - Configurable integration method
-    - Particle pooling (optional)
+    - Particle pooling: expired particles go back to ``pool`` for reuse
+      by ``emit`` (don't hold on to them after they leave the system)
     - Bounds checking
+    - Optional ``SpatialHash`` kept current after every update, for
+      row / rectangle / radius queries without a full scan
+    - Collision surfaces: particles that land on one are removed during
+      the integration pass and reported in ``collisions``
     """
     
     def __init__(self, config: PhysicsConfig = None,
-                 bounds: Tuple[float, float, float, float] = (0, 0, 100, 50)):
+                 bounds: Tuple[float, float, float, float] = (0, 0, 100, 50),
+                 pool: Optional[ParticlePool] = None,
+                 spatial_hash: Optional[SpatialHash] = None):
         self.config = config or PhysicsConfig()
         self.bounds = bounds
         self.particles: List[Particle] = []
         self.force_generators: List[ForceGenerator] = []
+        self.pool = pool if pool is not None else ParticlePool()
+        self.spatial_hash = spatial_hash
+        
+        # Ground surfaces, and the hits on them during the last update
+        self.surfaces: List[CollisionSurface] = []
+        self.collisions = CollisionEvents.empty()
+        
+        # Fused force kernel, rebuilt when the generator list changes
+        self._kernel: Optional[Callable] = None
+        self._kernel_generators: Tuple[ForceGenerator, ...] = ()
         
         # Performance tracking
         self.frame_count = 0
         self.active_particle_count = 0
         self.peak_particle_count = 0
+        self.last_substeps = self.config.substeps
     
     def add_force_generator(self, generator: ForceGenerator):
         """Register a force generator."""
         self.force_generators.append(generator)
     
+    def add_surface(self, surface: CollisionSurface):
+        """Register a collision surface (the highest one at each x wins)."""
+        self.surfaces.append(surface)
+    
     def spawn(self, particle: Particle):
         """Add a particle to the system."""
         self.particles.append(particle)
         self.peak_particle_count = max(self.peak_particle_count, len(self.particles))
+        if self.spatial_hash is not None:
+            self.spatial_hash.insert(particle)
+    
+    def emit(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+             **properties) -> Particle:
+        """Spawn a recycled particle from the pool (see ``Particle.reset``)."""
+        particle = self.pool.spawn(x, y, vx, vy, **properties)
+        self.spawn(particle)
+        return particle
+    
+    def spawn_many(self, positions: np.ndarray, velocities: Optional[np.ndarray] = None,
+                   template: Optional[Particle] = None,
+                   properties: Optional[dict] = None) -> List[Particle]:
+        """
+        Emit a batch of pooled particles: per-particle positions (and
+        velocities, else ``template.velocity``), other attributes from
+        ``template`` unless given per particle in ``properties`` (name ->
+        sequence).
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2).tolist()
+        if velocities is None:
+            velocity = template.velocity.as_tuple() if template is not None else (0.0, 0.0)
+            velocities = [velocity] * len(positions)
+        else:
+            velocities = np.asarray(velocities, dtype=np.float64).reshape(-1, 2).tolist()
+        base = ({name: getattr(template, name) for name in _PARTICLE_DEFAULTS}
+                if template is not None else {})
+        columns = {name: values.tolist() if isinstance(values, np.ndarray) else values
+                   for name, values in (properties or {}).items()}
+        
+        spawned = []
+        spawn = self.pool.spawn
+        for i, ((x, y), (vx, vy)) in enumerate(zip(positions, velocities)):
+            attributes = dict(base)
+            for name, values in columns.items():
+                attributes[name] = values[i]
+            particle = spawn(x, y, vx, vy, **attributes)
+            self.spawn(particle)
+            spawned.append(particle)
+        return spawned
     
     def update(self, dt: float = 1.0):
         """Update all particles."""
         self.frame_count += 1
         
         # Substep loop for stability
-        sub_dt = dt / self.config.substeps
+        substeps = self.substeps_for(dt)
+        sub_dt = dt / substeps
+        self.last_substeps = substeps
         
-        for _ in range(self.config.substeps):
-            for particle in self.particles:
+        method = self.config.integration
+        kernel = self.force_kernel() if self.config.fused_forces else None
+        acceleration_func = (self._acceleration_func(sub_dt)
+                             if method == IntegrationType.RK4 else None)
+        
+        # Expired particles are culled (in place, back to the pool) during
+        # the last substep's integration pass rather than in a second scan;
+        # so are particles that hit a surface, collected as (i, x, vx, vy)
+        cull = self.expiry_window() if self.config.bounds_check else None
+        hits: List[Tuple[int, float, float, float]] = []
+        collide = (self.landing_func(), hits, self.pool.release) if self.surfaces else None
+        particles = self.particles
+        
+        if self.config.interpolate:
+            for particle in particles:
+                position = particle.position
+                particle.last_position.set(position.x, position.y)
+        
+        for step in range(substeps):
+            for generator in self.force_generators:
+                generator.begin_step(sub_dt)
+            last = step == substeps - 1
+            step_cull = cull if last else None
+            step_collide = collide if last else None
+            
+            if kernel is not None:
+                kernel(particles, sub_dt, method, self.config.max_velocity,
+                       acceleration_func, step_cull, step_collide)
+                continue
+            
+            compact = step_cull is not None or step_collide is not None
+            kept = 0
+            for i, particle in enumerate(particles):
                 # Clear accumulated forces
                 particle.clear_forces()
                 
@@ -403,54 +1342,1124 @@ class ParticleSystem:
                     generator.apply(particle, sub_dt)
                 
                 # Integrate motion
-                particle.integrate(sub_dt, self.config.integration)
+                particle.integrate(sub_dt, method, acceleration_func)
                 
                 # Clamp velocity
-                if particle.velocity.magnitude > self.config.max_velocity:
-                    particle.velocity = particle.velocity.clamped(self.config.max_velocity)
+                speed = particle.velocity.magnitude
+                if speed > self.config.max_velocity:
+                    particle.velocity.iscale(self.config.max_velocity / speed)
+                
+                if compact:
+                    position = particle.position
+                    if step_collide is not None:
+                        landing_y, _, release = step_collide
+                        if particle.alive and position.y >= landing_y(position.x):
+                            velocity = particle.velocity
+                            hits.append((i, position.x, velocity.x, velocity.y))
+                            release(particle)
+                            continue
+                    if step_cull is not None:
+                        x_lo, y_lo, x_hi, y_hi, release = step_cull
+                        if (not particle.alive or position.x < x_lo or position.x > x_hi or
+                                position.y < y_lo or position.y > y_hi):
+                            release(particle)
+                            continue
+                    particles[kept] = particle
+                    kept += 1
+            if compact:
+                del particles[kept:]
         
-        # Remove expired particles
-        if self.config.bounds_check:
-            self.particles = [p for p in self.particles if not p.is_expired(self.bounds)]
+        if hits or len(self.collisions):
+            self.collisions = CollisionEvents.from_rows(hits)
+        
+        if self.spatial_hash is not None:
+            self.spatial_hash.update(self.particles)
         
         self.active_particle_count = len(self.particles)
     
+    def advance(self, clock: 'FixedTimestep', elapsed: Optional[float] = None) -> int:
+        """
+        Run the fixed steps ``clock`` owes (see ``FixedTimestep.tick``),
+        each an ``update(clock.dt)``. Returns the number of steps run.
+        """
+        steps = clock.tick() if elapsed is None else clock.advance(elapsed)
+        for _ in range(steps):
+            self.update(clock.dt)
+        return steps
+    
+    def interpolated_positions(self, alpha: float) -> List[Tuple[float, float]]:
+        """
+        Render positions ``alpha`` of the way from each particle's
+        ``last_position`` to its current one (needs ``config.interpolate``).
+        """
+        positions = []
+        for particle in self.particles:
+            last, current = particle.last_position, particle.position
+            positions.append((last.x + (current.x - last.x) * alpha,
+                              last.y + (current.y - last.y) * alpha))
+        return positions
+    
+    def expiry_window(self) -> Tuple[float, float, float, float, Callable]:
+        """
+        ``(x_lo, y_lo, x_hi, y_hi, release)`` for in-pass culling: the
+        bounds widened by ``EXPIRY_MARGIN``, as ``Particle.is_expired``.
+        """
+        x_min, y_min, x_max, y_max = self.bounds
+        return (x_min - EXPIRY_MARGIN, y_min - EXPIRY_MARGIN,
+                x_max + EXPIRY_MARGIN, y_max + EXPIRY_MARGIN, self.pool.release)
+    
+    def landing_func(self) -> Callable[[float], float]:
+        """Scalar landing y over all ``surfaces`` (the highest wins), for the object path."""
+        if len(self.surfaces) == 1:
+            return self.surfaces[0].landing_y
+        surfaces = [surface.landing_y for surface in self.surfaces]
+        return lambda x: min(landing_y(x) for landing_y in surfaces)
+    
+    def collision_mask(self, arrays: ParticleArrays,
+                       offset: int = 0) -> Tuple[np.ndarray, CollisionEvents]:
+        """
+        Live particles in ``arrays`` at or below the surfaces, and their
+        events (indices shifted by ``offset``), for the array backends.
+        """
+        n = arrays.count
+        if not self.surfaces or n == 0:
+            return np.zeros(n, dtype=bool), CollisionEvents.empty()
+        xs = arrays.position[:n, 0]
+        ground = self.surfaces[0].surface_y(xs)
+        for surface in self.surfaces[1:]:
+            ground = np.minimum(ground, surface.surface_y(xs))
+        hit = arrays.alive[:n] & (arrays.position[:n, 1] >= ground)
+        rows = np.flatnonzero(hit)
+        return hit, CollisionEvents(rows + offset, xs[rows], arrays.velocity[rows])
+    
+    def max_speed_bound(self, dt: float) -> float:
+        """Largest speed any particle can reach this frame: |v| + |a|·dt."""
+        bound = 0.0
+        for particle in self.particles:
+            speed = particle.velocity.magnitude + particle.acceleration.magnitude * dt
+            if speed > bound:
+                bound = speed
+        return bound
+    
+    def substeps_for(self, dt: float) -> int:
+        """
+        Substep count for a frame of length ``dt``.
+        
+        Fixed at ``config.substeps`` unless ``adaptive_substeps`` is set, in
+        which case it is the fewest substeps keeping the fastest particle
+        within ``max_step_distance`` cells per substep (a CFL-style bound),
+        clamped to [substeps, max_substeps].
+        """
+        config = self.config
+        if not config.adaptive_substeps:
+            return config.substeps
+        speed = min(self.max_speed_bound(dt), config.max_velocity)
+        needed = math.ceil(speed * dt / config.max_step_distance)
+        return max(config.substeps, min(config.max_substeps, needed))
+    
+    def _acceleration_func(self, dt: float) -> Callable[[Particle], Tuple[float, float]]:
+        """Force evaluation at an arbitrary particle state, for RK4 trial states."""
+        generators = self.force_generators
+        
+        def acceleration(particle: Particle) -> Tuple[float, float]:
+            particle.clear_forces()
+            for generator in generators:
+                generator.apply(particle, dt)
+            force = particle._accumulated_force
+            return force.x * particle.inverse_mass, force.y * particle.inverse_mass
+        return acceleration
+    
+    def force_kernel(self) -> Callable:
+        """The fused kernel for the current generators (compiled on change)."""
+        generators = tuple(self.force_generators)
+        if self._kernel is None or generators != self._kernel_generators:
+            self._kernel = compile_force_kernel(generators)
+            self._kernel_generators = generators
+        return self._kernel
+    
     def clear(self):
         """Remove all particles."""
+        for particle in self.particles:
+            self.pool.release(particle)
         self.particles.clear()
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
     
     def get_stats(self) -> dict:
         """Get performance statistics."""
+        pool = self.pool.get_stats()
         return {
             'active': self.active_particle_count,
             'peak': self.peak_particle_count,
             'frames': self.frame_count,
-            'generators': len(self.force_generators)
+            'generators': len(self.force_generators),
+            'substeps': self.last_substeps,
+            'pool_hits': pool['hits'],
+            'pool_misses': pool['misses'],
+            'pool_high_water': pool['high_water'],
+            'pool_available': pool['available'],
         }
 
 
+class ParticleArrays:
+    """
+    Structure-of-arrays particle storage.
+    
+    Each particle attribute lives in its own contiguous NumPy array; live
+    particles occupy indices [0, count). Vector attributes have shape
+    (capacity, 2). Capacity doubles on demand.
+    """
+    
+    VECTOR_FIELDS = ('position', 'velocity', 'prev_position', 'last_position',
+                     'acceleration', 'force')
+    SCALAR_FIELDS = {
+        'mass': np.float64,
+        'inverse_mass': np.float64,
+        'radius': np.float64,
+        'drag_coefficient': np.float64,
+        'restitution': np.float64,
+        'friction': np.float64,
+        'buoyancy_factor': np.float64,
+        'colour': np.int64,
+        'age': np.int64,
+        'max_age': np.int64,
+        'alive': np.bool_,
+    }
+    
+    def __init__(self, capacity: int = 1024):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        for name in self.VECTOR_FIELDS:
+            setattr(self, name, np.zeros((self.capacity, 2)))
+        for name, dtype in self.SCALAR_FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        self.char: List[str] = []
+    
+    @classmethod
+    def layout(cls, capacity: int) -> Tuple[List[Tuple[str, tuple, type, int]], int]:
+        """
+        Packing of every numeric field into one flat buffer:
+        ``[(name, shape, dtype, byte offset)]`` and the total size.
+        """
+        fields_ = [(name, (capacity, 2), np.float64) for name in cls.VECTOR_FIELDS]
+        fields_ += [(name, (capacity,), dtype) for name, dtype in cls.SCALAR_FIELDS.items()]
+        layout = []
+        offset = 0
+        for name, shape, dtype in fields_:
+            layout.append((name, shape, dtype, offset))
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            offset += (nbytes + 7) // 8 * 8  # keep every field 8-byte aligned
+        return layout, offset
+    
+    @classmethod
+    def on_buffer(cls, buffer, capacity: int, count: int = 0) -> 'ParticleArrays':
+        """
+        Arrays laid out (see ``layout``) over an existing buffer, e.g. a
+        ``SharedMemory.buf``. Nothing is copied; ``char`` starts empty.
+        """
+        arrays = cls.__new__(cls)
+        arrays._bind(buffer, capacity)
+        arrays.count = count
+        arrays.char = []
+        return arrays
+    
+    def _bind(self, buffer, capacity: int):
+        for name, shape, dtype, offset in self.layout(capacity)[0]:
+            setattr(self, name, np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset))
+        self.capacity = capacity
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def reserve(self, capacity: int):
+        """Grow storage to hold at least ``capacity`` particles."""
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, self.capacity * 2)
+        for name in (*self.VECTOR_FIELDS, *self.SCALAR_FIELDS):
+            old = getattr(self, name)
+            grown = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+        self.capacity = new_capacity
+    
+    def append(self, particle: Particle) -> int:
+        """Copy a Particle into storage. Returns its index."""
+        self.reserve(self.count + 1)
+        i = self.count
+        self.position[i] = particle.position.as_tuple()
+        self.velocity[i] = particle.velocity.as_tuple()
+        self.prev_position[i] = particle.prev_position.as_tuple()
+        self.last_position[i] = particle.last_position.as_tuple()
+        self.acceleration[i] = particle.acceleration.as_tuple()
+        self.force[i] = particle._accumulated_force.as_tuple()
+        for name in self.SCALAR_FIELDS:
+            getattr(self, name)[i] = getattr(particle, name)
+        self.char.append(particle.char)
+        self.count += 1
+        return i
+    
+    def extend(self, positions: np.ndarray, velocities: Optional[np.ndarray] = None,
+               template: Optional[Particle] = None,
+               properties: Optional[dict] = None) -> slice:
+        """
+        Append particles in bulk: per-particle positions (and velocities),
+        every other attribute copied from ``template`` unless given as a
+        per-particle array (or list, for ``char``) in ``properties``.
+        Returns the slice of new indices.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        template = template or Particle()
+        k = positions.shape[0]
+        self.reserve(self.count + k)
+        new = slice(self.count, self.count + k)
+        
+        self.position[new] = positions
+        self.prev_position[new] = positions
+        self.last_position[new] = positions
+        if velocities is None:
+            self.velocity[new] = template.velocity.as_tuple()
+        else:
+            self.velocity[new] = np.asarray(velocities, dtype=np.float64).reshape(-1, 2)
+        self.acceleration[new] = 0.0
+        self.force[new] = 0.0
+        for name in self.SCALAR_FIELDS:
+            getattr(self, name)[new] = getattr(template, name)
+        properties = properties or {}
+        for name, values in properties.items():
+            if name != 'char':
+                getattr(self, name)[new] = values
+        if 'mass' in properties:
+            mass = self.mass[new]
+            self.inverse_mass[new] = np.divide(1.0, mass, out=np.zeros(k), where=mass > 0)
+        self.char.extend(properties['char'] if 'char' in properties else [template.char] * k)
+        self.count += k
+        return new
+    
+    def compact(self, keep: np.ndarray):
+        """
+        Drop particles where ``keep`` (length ``count``) is False.
+        
+        Holes are filled from the tail (swap-remove), so the cost scales
+        with the number of removed particles and order is not preserved.
+        """
+        removed = np.flatnonzero(~keep)
+        if removed.size == 0:
+            return
+        kept = self.count - removed.size
+        holes = removed[removed < kept]
+        tail = np.arange(kept, self.count)
+        sources = tail[keep[kept:]]
+        
+        for name in (*self.VECTOR_FIELDS, *self.SCALAR_FIELDS):
+            array = getattr(self, name)
+            array[holes] = array[sources]
+        char = self.char
+        for hole, source in zip(holes.tolist(), sources.tolist()):
+            char[hole] = char[source]
+        del char[kept:]
+        self.count = kept
+    
+    def move_to(self, target: 'ParticleArrays', mask: np.ndarray) -> int:
+        """
+        Append the particles where ``mask`` (length ``count``) is True to
+        ``target`` and compact them out of this storage. Returns how many moved.
+        """
+        rows = np.flatnonzero(mask)
+        k = rows.size
+        if k == 0:
+            return 0
+        target.reserve(target.count + k)
+        new = slice(target.count, target.count + k)
+        for name in (*self.VECTOR_FIELDS, *self.SCALAR_FIELDS):
+            getattr(target, name)[new] = getattr(self, name)[rows]
+        char = self.char
+        target.char.extend([char[i] for i in rows.tolist()])
+        target.count += k
+        self.compact(~mask)
+        return k
+    
+    def clear(self):
+        self.count = 0
+        self.char.clear()
+    
+    def view(self, index: int) -> 'ParticleView':
+        return ParticleView(self, index)
+    
+    def views(self) -> List['ParticleView']:
+        """Per-particle views, valid until the storage is next compacted."""
+        return [ParticleView(self, i) for i in range(self.count)]
+    
+    def to_particle(self, index: int) -> Particle:
+        """Materialize one particle as a standalone Particle."""
+        particle = Particle(position=Vector2(*self.position[index].tolist()),
+                            velocity=Vector2(*self.velocity[index].tolist()),
+                            char=self.char[index])
+        for name in self.SCALAR_FIELDS:
+            setattr(particle, name, getattr(self, name)[index].item())
+        particle.prev_position = Vector2(*self.prev_position[index].tolist())
+        particle.last_position = Vector2(*self.last_position[index].tolist())
+        particle.acceleration = Vector2(*self.acceleration[index].tolist())
+        return particle
+
+
+class ParticleView:
+    """
+    Particle-like handle onto one row of a ``ParticleArrays``.
+    
+    Reads and writes go straight to the arrays, so force generators and
+    rendering code written against ``Particle`` work unchanged. Vector
+    attributes return copies; assign to them to write back.
+    """
+    
+    __slots__ = ('_arrays', '_index')
+    
+    def __init__(self, arrays: ParticleArrays, index: int):
+        self._arrays = arrays
+        self._index = index
+    
+    def _vector(name: str):
+        def getter(self) -> Vector2:
+            x, y = getattr(self._arrays, name)[self._index].tolist()
+            return Vector2(x, y)
+        
+        def setter(self, value: Vector2):
+            getattr(self._arrays, name)[self._index] = (value.x, value.y)
+        return property(getter, setter)
+    
+    def _scalar(name: str):
+        def getter(self):
+            return getattr(self._arrays, name)[self._index].item()
+        
+        def setter(self, value):
+            getattr(self._arrays, name)[self._index] = value
+        return property(getter, setter)
+    
+    position = _vector('position')
+    velocity = _vector('velocity')
+    prev_position = _vector('prev_position')
+    last_position = _vector('last_position')
+    acceleration = _vector('acceleration')
+    
+    mass = _scalar('mass')
+    inverse_mass = _scalar('inverse_mass')
+    radius = _scalar('radius')
+    drag_coefficient = _scalar('drag_coefficient')
+    restitution = _scalar('restitution')
+    friction = _scalar('friction')
+    buoyancy_factor = _scalar('buoyancy_factor')
+    colour = _scalar('colour')
+    age = _scalar('age')
+    max_age = _scalar('max_age')
+    alive = _scalar('alive')
+    
+    del _vector, _scalar
+    
+    @property
+    def char(self) -> str:
+        return self._arrays.char[self._index]
+    
+    @char.setter
+    def char(self, value: str):
+        self._arrays.char[self._index] = value
+    
+    def apply_force(self, force: Vector2):
+        """Accumulate force for this frame."""
+        self._arrays.force[self._index] += (force.x, force.y)
+    
+    def apply_scaled_force(self, direction: Vector2, magnitude: float):
+        """Accumulate ``direction * magnitude``."""
+        self._arrays.force[self._index] += (direction.x * magnitude,
+                                            direction.y * magnitude)
+    
+    def apply_impulse(self, impulse: Vector2):
+        """Apply instantaneous change in momentum."""
+        inverse_mass = self._arrays.inverse_mass[self._index]
+        self._arrays.velocity[self._index] += (impulse.x * inverse_mass,
+                                               impulse.y * inverse_mass)
+
+
+def integrate_arrays(arrays: ParticleArrays, dt: float,
+                     method: IntegrationType = IntegrationType.SEMI_IMPLICIT,
+                     acceleration_func: Optional[Callable[[ParticleArrays], np.ndarray]] = None):
+    """
+    Whole-array counterpart of ``Particle.integrate``: same update rules,
+    same floating-point operations, applied to every live particle at once.
+    For RK4, ``acceleration_func(arrays)`` returns (count, 2) accelerations
+    at the arrays' current (trial) state.
+    """
+    n = arrays.count
+    position = arrays.position[:n]
+    velocity = arrays.velocity[:n]
+    acceleration = arrays.acceleration[:n]
+    
+    inverse_mass = arrays.inverse_mass[:n]
+    np.multiply(arrays.force[:n, 0], inverse_mass, out=acceleration[:, 0])
+    np.multiply(arrays.force[:n, 1], inverse_mass, out=acceleration[:, 1])
+    
+    if method in (IntegrationType.EULER, IntegrationType.SEMI_IMPLICIT):
+        velocity += acceleration * dt
+        position += velocity * dt
+    elif method == IntegrationType.VERLET:
+        previous = arrays.prev_position[:n]
+        current = position.copy()
+        position[:] = position * 2 - previous + acceleration * (dt * dt)
+        previous[:] = current
+        velocity[:] = (position - previous) / dt
+    elif method == IntegrationType.RK4:
+        evaluate = (lambda: acceleration_func(arrays)) if acceleration_func else None
+        _integrate_rk4_arrays(position, velocity, acceleration, dt, evaluate)
+    
+    age = arrays.age[:n]
+    age += 1
+    max_age = arrays.max_age[:n]
+    arrays.alive[:n] &= ~((max_age > 0) & (age >= max_age))
+
+
+def _integrate_rk4_arrays(position: np.ndarray, velocity: np.ndarray,
+                          acceleration: np.ndarray, dt: float,
+                          evaluate: Optional[Callable[[], np.ndarray]]):
+    """
+    Array form of ``Particle.integrate_rk4``. ``acceleration`` holds the
+    first slope on entry; ``evaluate()`` samples it at the trial state
+    currently written into ``position``/``velocity``.
+    """
+    x0 = position.copy()
+    v0 = velocity.copy()
+    a1 = acceleration.copy()
+    half = dt * 0.5
+    
+    if evaluate is None:
+        a2 = a3 = a4 = a1
+    else:
+        position[:] = x0 + v0 * half
+        velocity[:] = v0 + a1 * half
+        a2 = evaluate()
+        position[:] = x0 + (v0 + a1 * half) * half
+        velocity[:] = v0 + a2 * half
+        a3 = evaluate()
+        position[:] = x0 + (v0 + a2 * half) * dt
+        velocity[:] = v0 + a3 * dt
+        a4 = evaluate()
+    
+    sixth = dt / 6.0
+    position[:] = x0 + sixth * (6.0 * v0 + (a1 + a2) * dt + a3 * dt)
+    acceleration[:] = (a1 + 2.0 * a2 + 2.0 * a3 + a4) / 6.0
+    velocity[:] = v0 + acceleration * dt
+
+
+def _batch_acceleration(generators: Sequence[ForceGenerator],
+                        dt: float) -> Callable[[ParticleArrays], np.ndarray]:
+    """Whole-array force evaluation at the current state, for RK4 trial states."""
+    def acceleration(arrays: ParticleArrays) -> np.ndarray:
+        n = arrays.count
+        arrays.force[:n] = 0.0
+        for generator in generators:
+            generator.apply_batch(arrays, dt)
+        return arrays.force[:n] * arrays.inverse_mass[:n, np.newaxis]
+    return acceleration
+
+
+def _substep_arrays(arrays: ParticleArrays, generators: Sequence[ForceGenerator],
+                    dt: float, method: IntegrationType, max_velocity: float,
+                    acceleration_func: Optional[Callable] = None):
+    """One substep: accumulate forces, integrate, clamp velocity."""
+    arrays.force[:arrays.count] = 0.0
+    for generator in generators:
+        generator.apply_batch(arrays, dt)
+    
+    integrate_arrays(arrays, dt, method, acceleration_func)
+    
+    # Clamp velocity
+    velocity = arrays.velocity[:arrays.count]
+    speed = np.sqrt(velocity[:, 0] * velocity[:, 0] + velocity[:, 1] * velocity[:, 1])
+    fast = speed > max_velocity
+    if fast.any():
+        velocity[fast] *= (max_velocity / speed[fast])[:, np.newaxis]
+
+
+def step_arrays(arrays: ParticleArrays, generators: Sequence[ForceGenerator],
+                dt: float, substeps: int, method: IntegrationType,
+                max_velocity: float, interpolate: bool = False):
+    """
+    Advance every particle in ``arrays`` by ``dt`` in ``substeps`` equal
+    substeps (no culling). Calls each generator's ``begin_step`` once per
+    substep.
+    """
+    sub_dt = dt / substeps
+    acceleration_func = (_batch_acceleration(generators, sub_dt)
+                         if method == IntegrationType.RK4 else None)
+    
+    if interpolate:
+        arrays.last_position[:arrays.count] = arrays.position[:arrays.count]
+    
+    for _ in range(substeps):
+        for generator in generators:
+            generator.begin_step(sub_dt)
+        _substep_arrays(arrays, generators, sub_dt, method, max_velocity, acceleration_func)
+
+
+def _max_speed_bound(arrays: ParticleArrays, dt: float) -> float:
+    n = arrays.count
+    if n == 0:
+        return 0.0
+    velocity = arrays.velocity[:n]
+    acceleration = arrays.acceleration[:n]
+    bound = (np.sqrt(velocity[:, 0] * velocity[:, 0] + velocity[:, 1] * velocity[:, 1]) +
+             np.sqrt(acceleration[:, 0] * acceleration[:, 0] +
+                     acceleration[:, 1] * acceleration[:, 1]) * dt)
+    return float(bound.max())
+
+
+class ArrayParticleSystem(ParticleSystem):
+    """
+    ParticleSystem backed by ``ParticleArrays`` (structure of arrays).
+    
+    Forces come from each generator's ``apply_batch`` and integration is a
+    handful of whole-array operations, so cost per particle is a few
+    nanoseconds instead of several Python calls. ``particles`` returns
+    ``ParticleView`` handles for code written against the object API.
+    
+    Views are rebuilt after compaction, so a ``spatial_hash`` is refiled
+    from scratch once per update rather than incrementally.
+    """
+    
+    def __init__(self, config: PhysicsConfig = None,
+                 bounds: Tuple[float, float, float, float] = (0, 0, 100, 50),
+                 capacity: int = 1024, spatial_hash: Optional[SpatialHash] = None):
+        self.arrays = ParticleArrays(capacity)
+        # Particles are copied into the arrays on spawn, so emit() needs
+        # only a single scratch particle
+        super().__init__(config, bounds, pool=ParticlePool(capacity=1),
+                         spatial_hash=spatial_hash)
+    
+    @property
+    def particles(self) -> List[ParticleView]:
+        return self.arrays.views()
+    
+    @particles.setter
+    def particles(self, particles: Sequence[Particle]):
+        self.arrays.clear()
+        for particle in particles:
+            self.arrays.append(particle)
+    
+    def spawn(self, particle: Particle):
+        """Add a particle to the system."""
+        self.arrays.append(particle)
+        self.peak_particle_count = max(self.peak_particle_count, self.arrays.count)
+    
+    def emit(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+             **properties) -> ParticleView:
+        """Spawn one particle with the given properties."""
+        particle = self.pool.spawn(x, y, vx, vy, **properties)
+        self.spawn(particle)
+        self.pool.release(particle)
+        return self.arrays.view(self.arrays.count - 1)
+    
+    def spawn_many(self, positions: np.ndarray, velocities: Optional[np.ndarray] = None,
+                   template: Optional[Particle] = None,
+                   properties: Optional[dict] = None) -> slice:
+        """Add many particles sharing ``template``'s properties (see ``ParticleArrays.extend``)."""
+        new = self.arrays.extend(positions, velocities, template, properties)
+        self.peak_particle_count = max(self.peak_particle_count, self.arrays.count)
+        return new
+    
+    def update(self, dt: float = 1.0):
+        """Update all particles."""
+        self.frame_count += 1
+        arrays = self.arrays
+        config = self.config
+        substeps = self.substeps_for(dt)
+        self.last_substeps = substeps
+        
+        step_arrays(arrays, self.force_generators, dt, substeps,
+                    config.integration, config.max_velocity, config.interpolate)
+        
+        # Remove expired particles and those that hit a surface
+        hit, self.collisions = self.collision_mask(arrays)
+        if config.bounds_check:
+            hit |= self.expired_mask()
+        if hit.any():
+            arrays.compact(~hit)
+        
+        if self.spatial_hash is not None:
+            self.spatial_hash.rebuild(self.particles)
+        
+        self.active_particle_count = arrays.count
+    
+    def max_speed_bound(self, dt: float) -> float:
+        return _max_speed_bound(self.arrays, dt)
+    
+    def interpolated_positions(self, alpha: float) -> np.ndarray:
+        """Vectorized ``ParticleSystem.interpolated_positions``, shape (count, 2)."""
+        n = self.arrays.count
+        last = self.arrays.last_position[:n]
+        return last + (self.arrays.position[:n] - last) * alpha
+    
+    def expired_mask(self, arrays: Optional[ParticleArrays] = None) -> np.ndarray:
+        """Vectorized ``Particle.is_expired`` over all live particles."""
+        arrays = self.arrays if arrays is None else arrays
+        n = arrays.count
+        x_min, y_min, x_max, y_max = self.bounds
+        margin = EXPIRY_MARGIN
+        position = arrays.position[:n]
+        return (~arrays.alive[:n] |
+                (position[:, 0] < x_min - margin) | (position[:, 0] > x_max + margin) |
+                (position[:, 1] < y_min - margin) | (position[:, 1] > y_max + margin))
+    
+    def clear(self):
+        """Remove all particles."""
+        self.arrays.clear()
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+
+
+class SharedParticleArrays(ParticleArrays):
+    """
+    ``ParticleArrays`` whose numeric fields live in one ``SharedMemory``
+    block (see ``ParticleArrays.layout``), so worker processes can attach
+    by ``shm.name`` and update them in place. Growing moves the particles
+    to a new, larger block. Call ``close`` to free the block; otherwise it
+    is freed when the arrays are garbage collected (or at exit).
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.count = 0
+        self.char: List[str] = []
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        self._release: Optional[weakref.finalize] = None
+        self._allocate(max(1, capacity))
+    
+    def _allocate(self, capacity: int):
+        old, release_old = self.shm, self._release
+        live = ({name: getattr(self, name)[:self.count].copy()
+                 for name in (*self.VECTOR_FIELDS, *self.SCALAR_FIELDS)}
+                if old is not None else {})
+        
+        self.shm = shared_memory.SharedMemory(create=True, size=self.layout(capacity)[1])
+        self._release = weakref.finalize(self, _release_shared_memory, self.shm)
+        self._bind(self.shm.buf, capacity)
+        for name, values in live.items():
+            getattr(self, name)[:self.count] = values
+        if release_old is not None:
+            release_old()
+    
+    def reserve(self, capacity: int):
+        if capacity > self.capacity:
+            self._allocate(max(capacity, self.capacity * 2))
+    
+    def close(self):
+        """Release and unlink the shared block; the storage is unusable afterwards."""
+        if self.shm is None:
+            return
+        for name in (*self.VECTOR_FIELDS, *self.SCALAR_FIELDS):
+            setattr(self, name, None)  # drop buffer exports before closing
+        self._release()
+        self.shm = None
+        self.count = 0
+
+
+def _release_shared_memory(shm: shared_memory.SharedMemory):
+    """Unlink ``shm`` and close it (finalizer: must not reference the owner)."""
+    shm.unlink()
+    try:
+        shm.close()
+    except BufferError:
+        pass  # arrays still export the buffer; the mapping goes with the last one
+
+
+def _step_band(shm_name: str, capacity: int, count: int,
+               generators: Sequence[ForceGenerator], dt: float, substeps: int,
+               method: IntegrationType, max_velocity: float, interpolate: bool) -> int:
+    """Worker: integrate one band in place in its shared-memory block."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        arrays = ParticleArrays.on_buffer(shm.buf, capacity, count)
+        step_arrays(arrays, generators, dt, substeps, method, max_velocity, interpolate)
+        del arrays  # release the buffer exports before closing
+    finally:
+        shm.close()
+    return count
+
+
+class ParallelParticleSystem(ArrayParticleSystem):
+    """
+    ``ArrayParticleSystem`` partitioned into spatial bands, each stepped by
+    its own worker process.
+    
+    Bands are equal-width column ranges of ``bounds`` (precipitation falls
+    mostly vertically, so few particles change band per frame), each stored
+    in a ``SharedParticleArrays``. On ``update`` every worker integrates
+    its band in place; the main process then culls expired particles and
+    migrates those that crossed a band edge. Renderers read the shared
+    arrays directly (``particles``, ``band_arrays``).
+    
+    Force generators are pickled to the workers on every update, so they
+    must be picklable; ``begin_step`` state (e.g. turbulence time) is
+    replayed on the main-process copies afterwards. Below ``min_parallel``
+    live particles the bands are stepped in-process, where dispatch would
+    cost more than it saves. Results match ``ArrayParticleSystem`` per
+    particle; only the order differs.
+    
+    Usage:
+        with ParallelParticleSystem(PhysicsConfig(parallel_workers=4), bounds) as system:
+            system.spawn_many(positions, template=create_snow_particle(0, 0))
+            system.update(1.0)
+    """
+    
+    def __init__(self, config: PhysicsConfig = None,
+                 bounds: Tuple[float, float, float, float] = (0, 0, 100, 50),
+                 capacity: int = 1024, spatial_hash: Optional[SpatialHash] = None,
+                 min_parallel: int = 20000):
+        config = config or PhysicsConfig()
+        self.workers = max(1, config.parallel_workers or os.cpu_count() or 1)
+        x_min, _, x_max, _ = bounds
+        # Interior band edges; band i holds x in [edges[i-1], edges[i])
+        self.edges = np.linspace(x_min, x_max, self.workers + 1)[1:-1]
+        self.band_arrays = [SharedParticleArrays(max(1, capacity // self.workers))
+                            for _ in range(self.workers)]
+        self.min_parallel = min_parallel
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._shutdown: Optional[weakref.finalize] = None
+        
+        # Statistics
+        self.parallel_updates = 0
+        self.inline_updates = 0
+        self.migrated = 0
+        
+        ParticleSystem.__init__(self, config, bounds, pool=ParticlePool(capacity=1),
+                                spatial_hash=spatial_hash)
+    
+    @property
+    def count(self) -> int:
+        return sum(band.count for band in self.band_arrays)
+    
+    @property
+    def particles(self) -> List[ParticleView]:
+        return [view for band in self.band_arrays for view in band.views()]
+    
+    @particles.setter
+    def particles(self, particles: Sequence[Particle]):
+        for band in self.band_arrays:
+            band.clear()
+        for particle in particles:
+            self.spawn(particle)
+    
+    def band_of(self, x) -> np.ndarray:
+        """Band index for each x coordinate (outside the bounds: the edge bands)."""
+        return np.searchsorted(self.edges, x, side='right')
+    
+    def spawn(self, particle: Particle):
+        """Add a particle to the band containing it."""
+        self.band_arrays[int(self.band_of(particle.position.x))].append(particle)
+        self.peak_particle_count = max(self.peak_particle_count, self.count)
+    
+    def emit(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+             **properties) -> ParticleView:
+        """Spawn one particle with the given properties."""
+        particle = self.pool.spawn(x, y, vx, vy, **properties)
+        self.spawn(particle)
+        self.pool.release(particle)
+        band = self.band_arrays[int(self.band_of(x))]
+        return band.view(band.count - 1)
+    
+    def spawn_many(self, positions: np.ndarray, velocities: Optional[np.ndarray] = None,
+                   template: Optional[Particle] = None,
+                   properties: Optional[dict] = None) -> List[slice]:
+        """
+        Add many particles, routed to their bands. Returns the new index
+        slice within each band (see ``ParticleArrays.extend``).
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if velocities is not None:
+            velocities = np.asarray(velocities, dtype=np.float64).reshape(-1, 2)
+        bands = self.band_of(positions[:, 0])
+        
+        slices = []
+        for i, arrays in enumerate(self.band_arrays):
+            rows = np.flatnonzero(bands == i)
+            columns = None
+            if properties:
+                columns = {name: (values[rows] if isinstance(values, np.ndarray)
+                                  else [values[j] for j in rows.tolist()])
+                           for name, values in properties.items()}
+            slices.append(arrays.extend(positions[rows],
+                                        None if velocities is None else velocities[rows],
+                                        template, columns))
+        self.peak_particle_count = max(self.peak_particle_count, self.count)
+        return slices
+    
+    def update(self, dt: float = 1.0):
+        """Step every band (in parallel above ``min_parallel``), then cull and migrate."""
+        self.frame_count += 1
+        config = self.config
+        generators = self.force_generators
+        substeps = self.substeps_for(dt)
+        sub_dt = dt / substeps
+        self.last_substeps = substeps
+        step = (dt, substeps, config.integration, config.max_velocity, config.interpolate)
+        
+        if self.workers > 1 and self.count >= self.min_parallel:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                # Don't leave worker processes behind if close() is never called
+                self._shutdown = weakref.finalize(self, self._executor.shutdown)
+            futures = [self._executor.submit(_step_band, band.shm.name, band.capacity,
+                                             band.count, generators, *step)
+                       for band in self.band_arrays if band.count]
+            for future in futures:
+                future.result()
+            # Workers advanced pickled copies; keep ours in step
+            for _ in range(substeps):
+                for generator in generators:
+                    generator.begin_step(sub_dt)
+            self.parallel_updates += 1
+        else:
+            acceleration_func = (_batch_acceleration(generators, sub_dt)
+                                 if config.integration == IntegrationType.RK4 else None)
+            if config.interpolate:
+                for band in self.band_arrays:
+                    band.last_position[:band.count] = band.position[:band.count]
+            for _ in range(substeps):
+                for generator in generators:
+                    generator.begin_step(sub_dt)
+                for band in self.band_arrays:
+                    _substep_arrays(band, generators, sub_dt, config.integration,
+                                    config.max_velocity, acceleration_func)
+            self.inline_updates += 1
+        
+        # Event indices follow ``particles`` order (bands concatenated)
+        collisions = []
+        offset = 0
+        for band in self.band_arrays:
+            remove, events = self.collision_mask(band, offset)
+            collisions.append(events)
+            offset += band.count
+            if config.bounds_check:
+                remove |= self.expired_mask(band)
+            if remove.any():
+                band.compact(~remove)
+        self.collisions = CollisionEvents.concatenate(collisions)
+        self.migrated = self._migrate()
+        
+        if self.spatial_hash is not None:
+            self.spatial_hash.rebuild(self.particles)
+        
+        self.active_particle_count = self.count
+    
+    def _migrate(self) -> int:
+        """Move particles that crossed a band edge into their new band."""
+        moved = 0
+        for i, arrays in enumerate(self.band_arrays):
+            while arrays.count:
+                bands = self.band_of(arrays.position[:arrays.count, 0])
+                leaving = bands != i
+                if not leaving.any():
+                    break
+                target = int(bands[np.argmax(leaving)])
+                moved += arrays.move_to(self.band_arrays[target], bands == target)
+        return moved
+    
+    def max_speed_bound(self, dt: float) -> float:
+        return max(_max_speed_bound(band, dt) for band in self.band_arrays)
+    
+    def interpolated_positions(self, alpha: float) -> np.ndarray:
+        """Render positions for all bands, in ``particles`` order."""
+        return np.concatenate([
+            band.last_position[:band.count] +
+            (band.position[:band.count] - band.last_position[:band.count]) * alpha
+            for band in self.band_arrays])
+    
+    def clear(self):
+        """Remove all particles."""
+        for band in self.band_arrays:
+            band.clear()
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+    
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats.update({
+            'bands': [band.count for band in self.band_arrays],
+            'migrated': self.migrated,
+            'parallel_updates': self.parallel_updates,
+        })
+        return stats
+    
+    def close(self) -> None:
+        """
+        Shut down the workers and free the shared memory (also done when
+        the system is garbage collected, but not as promptly).
+        """
+        if self._shutdown is not None:
+            self._shutdown()
+            self._shutdown = None
+        self._executor = None
+        for band in self.band_arrays:
+            band.close()
+    
+    def __enter__(self) -> 'ParallelParticleSystem':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def create_particle_system(config: PhysicsConfig = None,
+                           bounds: Tuple[float, float, float, float] = (0, 0, 100, 50),
+                           **kwargs) -> ParticleSystem:
+    """
+    ``ParallelParticleSystem`` when ``config.parallel_workers`` > 1,
+    otherwise a plain ``ParticleSystem``. Extra keyword arguments go to
+    the chosen constructor.
+    """
+    config = config or PhysicsConfig()
+    if config.parallel_workers > 1:
+        return ParallelParticleSystem(config, bounds, **kwargs)
+    return ParticleSystem(config, bounds, **kwargs)
+
+
+class EmitterShape(Enum):
+    """Where an ``Emitter`` places new particles."""
+    POINT = auto()  # all at ``origin``
+    LINE = auto()   # uniformly along origin → origin + extent
+    RECT = auto()   # uniformly inside origin + [0, extent)
+
+
+Distribution = Union[float, str, Tuple[float, float], Sequence, Callable]
+
+
+class Emitter:
+    """
+    Rate-based particle source.
+    
+    ``rate`` is particles per unit of simulation time (per second when
+    ``dt`` is in seconds, per frame for frame-stepped systems). The
+    fractional part carries over between calls, so 0.3 per frame spawns
+    three particles every ten frames rather than none.
+    
+    Spawned attributes come from distributions, drawn once per attribute
+    for the whole batch:
+    - a constant (number or string)
+    - a ``(low, high)`` tuple: uniform in [low, high)
+    - a list: uniform choice among its items
+    - a callable ``f(rng, count)`` returning ``count`` values
+    
+    ``velocity_x`` / ``velocity_y`` give the velocity, ``properties`` maps
+    other particle attributes (``char``, ``mass``, ``max_age``, ...) to
+    distributions.
+    """
+    
+    def __init__(self, shape: EmitterShape = EmitterShape.POINT,
+                 origin: Tuple[float, float] = (0.0, 0.0),
+                 extent: Tuple[float, float] = (0.0, 0.0),
+                 rate: float = 10.0,
+                 velocity_x: Distribution = 0.0,
+                 velocity_y: Distribution = 0.0,
+                 properties: Optional[dict] = None,
+                 seed: Optional[int] = None):
+        self.shape = shape
+        self.origin = origin
+        self.extent = extent
+        self.rate = rate
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+        self.properties = dict(properties or {})
+        self.rng = np.random.default_rng(seed)
+        self._carry = 0.0
+        
+        # Statistics
+        self.emitted = 0
+    
+    def due(self, dt: float) -> int:
+        """Particles owed after ``dt`` more time, keeping the remainder."""
+        self._carry += self.rate * dt
+        count = int(self._carry + 1e-9)  # 0.1 + 0.2 + ... lands just under whole numbers
+        self._carry -= count
+        return count
+    
+    def draw(self, distribution: Distribution, count: int):
+        """``count`` values of one distribution (array, or list for strings)."""
+        if callable(distribution):
+            return distribution(self.rng, count)
+        if isinstance(distribution, tuple):
+            low, high = distribution
+            return self.rng.uniform(low, high, count)
+        if isinstance(distribution, list):
+            picks = self.rng.integers(len(distribution), size=count)
+            if all(isinstance(item, str) for item in distribution):
+                return [distribution[i] for i in picks.tolist()]
+            return np.asarray(distribution)[picks]
+        if isinstance(distribution, str):
+            return [distribution] * count
+        return np.full(count, distribution, dtype=np.float64)
+    
+    def positions(self, count: int) -> np.ndarray:
+        """``count`` spawn positions on the emitter shape, shape (count, 2)."""
+        origin = np.asarray(self.origin, dtype=np.float64)
+        extent = np.asarray(self.extent, dtype=np.float64)
+        if self.shape == EmitterShape.LINE:
+            return origin + self.rng.random(count)[:, np.newaxis] * extent
+        if self.shape == EmitterShape.RECT:
+            return origin + self.rng.random((count, 2)) * extent
+        return np.tile(origin, (count, 1))
+    
+    def sample(self, count: int) -> Tuple[np.ndarray, np.ndarray, dict]:
+        """A batch of ``count`` particles: (positions, velocities, properties)."""
+        velocities = np.empty((count, 2))
+        velocities[:, 0] = self.draw(self.velocity_x, count)
+        velocities[:, 1] = self.draw(self.velocity_y, count)
+        properties = {name: self.draw(distribution, count)
+                      for name, distribution in self.properties.items()}
+        self.emitted += count
+        return self.positions(count), velocities, properties
+    
+    def emit(self, system: ParticleSystem, dt: float) -> int:
+        """Spawn whatever is due after ``dt`` into ``system`` in one batch."""
+        count = self.due(dt)
+        if count:
+            positions, velocities, properties = self.sample(count)
+            system.spawn_many(positions, velocities, properties=properties)
+        return count
+
+
 # Factory functions
-def create_rain_particle(x: float, y: float, wind_x: float = 0) -> Particle:
-    """Create a raindrop particle with appropriate physics."""
+_RAIN_PROPERTIES = dict(
+    mass=0.5,
+    drag_coefficient=0.3,
+    buoyancy_factor=0.0,
+    char='|',
+    max_age=200
+)
+
+_SNOW_PROPERTIES = dict(
+    mass=0.1,
+    drag_coefficient=0.8,  # High drag (fluffy)
+    buoyancy_factor=0.4,   # Significant buoyancy
+    char='*',
+    max_age=400
+)
+
+
+def create_rain_particle(x: float, y: float, wind_x: float = 0,
+                         pool: Optional[ParticlePool] = None) -> Particle:
+    """Create a raindrop particle with appropriate physics (recycled if ``pool`` given)."""
+    if pool is not None:
+        return pool.spawn(x, y, wind_x * 0.5, 1.0, **_RAIN_PROPERTIES)
     return Particle(
         position=Vector2(x, y),
         velocity=Vector2(wind_x * 0.5, 1.0),
-        mass=0.5,
-        drag_coefficient=0.3,
-        buoyancy_factor=0.0,
-        char='|',
-        max_age=200
+        **_RAIN_PROPERTIES
     )
 
 
-def create_snow_particle(x: float, y: float, wind_x: float = 0) -> Particle:
-    """Create a snowflake particle with appropriate physics."""
+def create_snow_particle(x: float, y: float, wind_x: float = 0,
+                         pool: Optional[ParticlePool] = None) -> Particle:
+    """Create a snowflake particle with appropriate physics (recycled if ``pool`` given)."""
+    if pool is not None:
+        return pool.spawn(x, y, wind_x * 0.3, 0.2, **_SNOW_PROPERTIES)
     return Particle(
         position=Vector2(x, y),
         velocity=Vector2(wind_x * 0.3, 0.2),
-        mass=0.1,
-        drag_coefficient=0.8,  # High drag (fluffy)
-        buoyancy_factor=0.4,   # Significant buoyancy
-        char='*',
-        max_age=400
+        **_SNOW_PROPERTIES
     )
@@ -0,0 +1,187 @@
+"""
+Threaded Simulation Runner
+==========================
+Steps a simulation on a background thread and hands the render loop
+immutable snapshots of it.
+
+This module provides:
+- A fixed-rate worker thread (``FixedTimestep`` accumulator, same
+  catch-up cap as the single-threaded loop)
+- Double-buffered snapshot publication after every step: the render
+  thread reads the front slot with a single reference load, never a lock
+- An input queue applied on the worker between steps, with the
+  bookkeeping needed to measure input-to-frame latency
+
+Threading model:
+The worker owns the simulation state - only it calls ``step``. After
+each step it calls ``snapshot``, which must copy whatever
+the renderer needs into objects the worker will not mutate again, and
+publishes the result into the back slot before flipping the front
+index. Code that has to touch live simulation state from another
+thread (rebuilding a scene, modal screens) wraps it in ``paused()``.
+
+CPython's GIL still serializes pure-Python work; what the runner buys
+is that input polling and drawing no longer wait behind a whole batch
+of physics steps, and NumPy-heavy steps overlap with the render loop.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from engine.physics.particles import FixedTimestep
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One published simulation state."""
+    state: Any
+    step: int          # simulation steps taken when it was captured
+    published: float   # perf_counter() at publication
+    alpha: float       # FixedTimestep.alpha at publication
+
+
+class SimulationRunner:
+    """
+    Run ``step(dt)`` at ``hz`` on a worker thread, publishing
+    ``snapshot()`` after every step.
+    
+    Usage:
+        runner = SimulationRunner(world.update, world.snapshot, hz=30.0)
+        with runner:
+            while running:
+                frame = runner.latest()
+                draw(frame.state, runner.alpha(frame))
+                latency.presented(runner.presented(frame))
+    """
+    
+    def __init__(self, step: Callable[[float], None], snapshot: Callable[[], Any],
+                 hz: float = 30.0, dt: float = 1.0, max_steps: int = 5):
+        self.timestep = FixedTimestep(hz=hz, dt=dt, max_steps=max_steps)
+        self._step = step
+        self._snapshot = snapshot
+        
+        # Two slots; the render thread only ever reads _buffers[_front]
+        self._buffers: List[Optional[Snapshot]] = [None, None]
+        self._front = 0
+        
+        # (posted_at, callable) waiting for the worker; (step, posted_at)
+        # applied but not yet shown. deque appends/pops are atomic.
+        self._inputs: deque = deque()
+        self._applied: deque = deque()
+        
+        # Held by the worker while it steps and publishes, and by paused()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+        
+        # Statistics
+        self.steps = 0
+        self.published = 0
+        self.step_time = 0.0  # seconds spent in the last batch of steps
+    
+    # ─── Lifecycle ───────────────────────────────────────────────────────
+    
+    def start(self) -> 'SimulationRunner':
+        """Publish an initial snapshot and start the worker thread."""
+        if self._thread is not None:
+            return self
+        self.timestep.reset()
+        self._publish()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self, timeout: Optional[float] = 1.0):
+        """Stop the worker after its current batch."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def __enter__(self) -> 'SimulationRunner':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    @contextmanager
+    def paused(self):
+        """Hold the worker between batches so live state can be touched safely."""
+        with self._lock:
+            yield self
+            # Don't replay the pause as a burst of catch-up steps
+            self.timestep.reset()
+    
+    # ─── Worker ──────────────────────────────────────────────────────────
+    
+    def _run(self):
+        clock = self.timestep
+        try:
+            while not self._stop.is_set():
+                with self._lock:
+                    steps = clock.tick()
+                    start = time.perf_counter()
+                    for remaining in range(steps - 1, -1, -1):
+                        self._apply_inputs()
+                        self._step(clock.dt)
+                        self.steps += 1
+                        # Publish every step: in a catch-up batch the render
+                        # loop (and input feedback) needn't wait for all of it
+                        self._publish(clock.alpha if remaining == 0 else 0.0)
+                    if steps:
+                        self.step_time = time.perf_counter() - start
+                    wait = clock.until_next()
+                self._stop.wait(wait)
+        except BaseException as error:  # surfaced on the render thread by latest()
+            self.error = error
+    
+    def _apply_inputs(self):
+        inputs = self._inputs
+        while inputs:
+            posted_at, apply = inputs.popleft()
+            apply()
+            self._applied.append((self.steps + 1, posted_at))
+    
+    def _publish(self, alpha: float = 0.0):
+        back = 1 - self._front
+        self._buffers[back] = Snapshot(self._snapshot(), self.steps, time.perf_counter(), alpha)
+        self._front = back
+        self.published += 1
+    
+    # ─── Render-thread API ───────────────────────────────────────────────
+    
+    def latest(self) -> Optional[Snapshot]:
+        """The most recently published snapshot (re-raises a worker failure)."""
+        if self.error is not None:
+            raise self.error
+        return self._buffers[self._front]
+    
+    def alpha(self, snapshot: Snapshot, now: Optional[float] = None) -> float:
+        """Interpolation factor for drawing ``snapshot`` at ``now``, in [0, 1]."""
+        now = time.perf_counter() if now is None else now
+        return min(1.0, snapshot.alpha + (now - snapshot.published) * self.timestep.hz)
+    
+    def post(self, apply: Callable[[], None], now: Optional[float] = None):
+        """Queue ``apply()`` to run on the worker before its next step."""
+        self._inputs.append((time.perf_counter() if now is None else now, apply))
+    
+    def presented(self, snapshot: Snapshot) -> List[float]:
+        """
+        Mark ``snapshot`` as on screen; returns the post times of the
+        inputs it is the first to show (for ``InputLatency.presented``).
+        """
+        shown = []
+        applied = self._applied
+        while applied and applied[0][0] <= snapshot.step:
+            shown.append(applied.popleft()[1])
+        return shown
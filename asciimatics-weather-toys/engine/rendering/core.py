@@ -5,6 +5,8 @@ Terminal rendering system with frame budgeting and performance guards.
 
 This module provides:
 - Frame timing and budget management
+- Particle budgets (caps, spawn rates, trails, noise octaves) that
+  follow the frame budget's quality level
 - Double buffering (conceptual, via asciimatics)
 - Render layer system (background, particles, UI)
 - Performance profiling hooks
@@ -19,6 +21,8 @@ We optimize for:
 - VT100/ANSI compatibility
 """
 from __future__ import annotations
+import math
+import random
 import time
 from typing import Dict, List, Tuple, Optional, Callable, Any
 from dataclasses import dataclass, field
@@ -113,6 +117,68 @@ class RenderStats:
         }
 
 
+@dataclass
+class InputLatency:
+    """
+    Input-to-frame latency: time from an input being read (or posted to
+    a simulation thread) until the first frame showing it reaches the
+    screen.
+    """
+    latencies: List[float] = field(default_factory=list)
+    pending: List[float] = field(default_factory=list)
+    total_inputs: int = 0
+    
+    # Settings
+    sample_window: int = 120  # Inputs to keep for averaging
+    
+    def input(self, timestamp: Optional[float] = None):
+        """Record an input read at ``timestamp`` (default: now)."""
+        self.pending.append(time.perf_counter() if timestamp is None else timestamp)
+    
+    def presented(self, timestamps: Optional[List[float]] = None,
+                  now: Optional[float] = None):
+        """A frame reached the screen: resolve pending inputs plus ``timestamps``."""
+        now = time.perf_counter() if now is None else now
+        shown = self.pending + list(timestamps or ())
+        self.pending = []
+        for timestamp in shown:
+            self.total_inputs += 1
+            self.latencies.append(now - timestamp)
+        
+        # Trim to window
+        if len(self.latencies) > self.sample_window:
+            del self.latencies[:-self.sample_window]
+    
+    @property
+    def avg_ms(self) -> float:
+        """Average input-to-frame latency in ms."""
+        if not self.latencies:
+            return 0
+        return statistics.mean(self.latencies) * 1000
+    
+    @property
+    def percentile_95(self) -> float:
+        """95th percentile input-to-frame latency (ms)."""
+        if len(self.latencies) < 2:
+            return 0
+        sorted_times = sorted(self.latencies)
+        idx = int(len(sorted_times) * 0.95)
+        return sorted_times[idx] * 1000
+    
+    @property
+    def max_ms(self) -> float:
+        return max(self.latencies) * 1000 if self.latencies else 0
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Get latency report."""
+        return {
+            'inputs': self.total_inputs,
+            'avg_ms': round(self.avg_ms, 2),
+            'p95_ms': round(self.percentile_95, 2),
+            'max_ms': round(self.max_ms, 2),
+        }
+
+
 class FrameBudget:
     """
     Frame budget manager for consistent frame rates.
@@ -141,6 +207,9 @@ class FrameBudget:
         # Adaptive quality
         self.quality_level = 1.0  # 1.0 = full quality
         self.overrun_count = 0
+        
+        # Noise grid resolution step per quality threshold (highest first)
+        self.noise_steps: List[Tuple[float, int]] = [(0.8, 1), (0.5, 2), (0.0, 4)]
     
     def begin_frame(self):
         """Start frame timing."""
@@ -171,6 +240,16 @@ class FrameBudget:
         ratio = self.phase_budgets.get(phase_name, 0.1)
         return self.frame_budget_ms * ratio * self.quality_level
     
+    def noise_step(self) -> int:
+        """
+        Cell step for noise field evaluation at the current quality level:
+        1 = every cell, 2/4 = evaluate every 2nd/4th cell and upsample.
+        """
+        for threshold, step in self.noise_steps:
+            if self.quality_level >= threshold:
+                return step
+        return self.noise_steps[-1][1]
+    
     def adjust_quality(self, frame_time_ms: float):
         """Adjust quality level based on frame time."""
         if frame_time_ms > self.frame_budget_ms * 1.2:
@@ -184,13 +263,130 @@ class FrameBudget:
             self.quality_level = min(1.0, self.quality_level + 0.02)
             self.overrun_count = max(0, self.overrun_count - 1)
     
-    def end_frame(self) -> float:
-        """End frame, return total time in ms."""
+    def end_frame(self, extra_ms: float = 0.0) -> float:
+        """
+        End frame, return total time in ms. ``extra_ms`` is per-frame work
+        done outside the timed frame (e.g. a simulation thread's step time)
+        that counts against the budget too.
+        """
         frame_time = (time.perf_counter() - self.frame_start) * 1000
-        self.adjust_quality(frame_time)
+        self.adjust_quality(frame_time + extra_ms)
         return frame_time
 
 
+class ParticleBudget:
+    """
+    Particle spending decisions for a ``FrameBudget``'s quality level.
+    
+    ``update`` reads ``budget.quality_level`` once per frame and derives:
+    - ``particle_limit``: live particle cap (``max_particles`` × quality)
+    - ``spawn_scale``: multiplier for emitter rates
+    - ``trail_length``: motion trail points kept per particle
+    - ``octaves``: noise octave cap (``max_octaves`` × quality, at least 1)
+    - ``noise_step``: noise grid cell step (``FrameBudget.noise_step``)
+    
+    ``thin`` brings live particles back under the cap by dropping a
+    uniform random subset rather than the newest, and at most
+    ``thin_rate`` of them per frame, so a quality drop fades instead of
+    popping.
+    """
+    
+    def __init__(self, budget: FrameBudget, max_particles: int = 2000,
+                 max_octaves: int = 4, thin_rate: float = 0.1,
+                 seed: Optional[int] = None):
+        self.budget = budget
+        self.max_particles = max_particles
+        self.max_octaves = max_octaves
+        self.thin_rate = thin_rate
+        self.rng = random.Random(seed)
+        
+        # Trail points kept per quality threshold (highest first)
+        self.trail_steps: List[Tuple[float, int]] = [(0.9, 3), (0.7, 2), (0.5, 1), (0.0, 0)]
+        
+        # Current decisions
+        self.quality_level = 1.0
+        self.particle_limit = max_particles
+        self.spawn_scale = 1.0
+        self.trail_length = self.trail_steps[0][1]
+        self.octaves = max_octaves
+        self.noise_step = 1
+        
+        # Statistics
+        self.live = 0
+        self.thinned = 0        # removed by the last thin()
+        self.total_thinned = 0
+    
+    def update(self) -> 'ParticleBudget':
+        """Re-derive the decisions from the current quality level."""
+        quality = self.budget.quality_level
+        self.quality_level = quality
+        self.particle_limit = max(1, int(self.max_particles * quality))
+        self.spawn_scale = quality
+        for threshold, length in self.trail_steps:
+            if quality >= threshold:
+                self.trail_length = length
+                break
+        else:
+            self.trail_length = self.trail_steps[-1][1]
+        self.octaves = max(1, int(round(self.max_octaves * quality)))
+        self.noise_step = self.budget.noise_step()
+        return self
+    
+    def thin(self, *populations: list) -> List[list]:
+        """
+        Drop particles from ``populations`` (lists, compacted in place,
+        order kept) until their total is under ``particle_limit``. Every
+        particle goes with the same probability, whichever list holds it.
+        Returns the removed particles per population (e.g. for a pool).
+        """
+        live = sum(len(particles) for particles in populations)
+        removed: List[list] = [[] for _ in populations]
+        self.live = live
+        self.thinned = 0
+        excess = live - self.particle_limit
+        if excess <= 0:
+            return removed
+        
+        chance = min(excess, math.ceil(live * self.thin_rate)) / live
+        roll = self.rng.random
+        for particles, dropped in zip(populations, removed):
+            kept = 0
+            for particle in particles:
+                if roll() < chance:
+                    dropped.append(particle)
+                else:
+                    particles[kept] = particle
+                    kept += 1
+            del particles[kept:]
+            self.thinned += len(dropped)
+        self.total_thinned += self.thinned
+        return removed
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Current decisions."""
+        return {
+            'quality': self.quality_level,
+            'live': self.live,
+            'particle_limit': self.particle_limit,
+            'spawn_scale': self.spawn_scale,
+            'trail_length': self.trail_length,
+            'octaves': self.octaves,
+            'noise_step': self.noise_step,
+            'thinned': self.thinned,
+        }
+    
+    def overlay_lines(self) -> List[str]:
+        """The decisions as debug overlay lines."""
+        return [
+            f"Budget: {self.live}/{self.particle_limit}",
+            f"Spawn: x{self.spawn_scale:.2f}",
+            f"Trail: {self.trail_length}",
+            f"Octaves: {self.octaves}",
+            f"Noise step: {self.noise_step}",
+            f"Thinned: {self.thinned}",
+        ]
+
+
 def profile_function(stats: RenderStats, layer_name: str):
     """Decorator to profile function execution time."""
     def decorator(func: Callable) -> Callable:
@@ -328,6 +524,7 @@ class RenderEngine:
         self.queue = RenderQueue()
         self.stats = RenderStats()
         self.budget = FrameBudget(target_fps)
+        self.particle_budget = ParticleBudget(self.budget)
         
         self.renderers: List[Renderer] = []
     
@@ -360,6 +557,7 @@ class RenderEngine:
         
         # Record stats
         frame_time = self.budget.end_frame()
+        self.particle_budget.update()
         self.stats.record_frame(frame_time / 1000, particle_count)
     
     @property
@@ -381,6 +579,7 @@ class RenderEngine:
             f"P95: {report['p95_ms']:.1f}ms",
             f"Quality: {self.quality_level:.0%}",
             f"Particles: {report['avg_particles']:.0f}",
+            *self.particle_budget.overlay_lines(),
         ]
         
         for i, line in enumerate(lines):
@@ -45,25 +45,47 @@ class Particle:
 
 @dataclass
 class ParticleSystem:
-    """Manages a collection of particles."""
+    """
+    Manages a collection of particles.
+
+    ``surfaces`` holds ground the particles land on: anything with a
+    ``landing_y(x)`` method (e.g. ``engine.physics.FlatGround`` or
+    ``Heightfield``). After each update, ``collisions`` lists the
+    particles that reached one as ``(index, x, vx, vy)``.
+    """
     particles: list = field(default_factory=list)
     gravity: float = 0.0
     wind: float = 0.0
     drag: float = 0.0
+    surfaces: list = field(default_factory=list)
+    collisions: list = field(default_factory=list)
 
     def spawn(self, particle: Particle):
         """Add a new particle to the system."""
         self.particles.append(particle)
 
     def update(self, screen_width: int, screen_height: int):
-        """Update all particles and remove dead ones."""
-        for p in self.particles:
-            p.update(self.gravity, self.wind, self.drag)
-        
-        self.particles = [
-            p for p in self.particles 
-            if p.is_alive(screen_width, screen_height)
-        ]
+        """
+        Update all particles and remove dead ones.
+
+        Dead particles, and those that land on a surface, are compacted
+        out of ``particles`` in place during the same pass (order is
+        kept), so the list object is reused. ``index`` in ``collisions``
+        is the particle's position before the update.
+        """
+        particles = self.particles
+        gravity, wind, drag = self.gravity, self.wind, self.drag
+        surfaces = [surface.landing_y for surface in self.surfaces]
+        collisions = self.collisions = []
+        kept = 0
+        for i, p in enumerate(particles):
+            p.update(gravity, wind, drag)
+            if surfaces and p.y >= min(landing_y(p.x) for landing_y in surfaces):
+                collisions.append((i, p.x, p.vx, p.vy))
+            elif p.is_alive(screen_width, screen_height):
+                particles[kept] = p
+                kept += 1
+        del particles[kept:]
 
     def draw(self, screen):
         """Render all particles to the screen."""
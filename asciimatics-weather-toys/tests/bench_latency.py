@@ -0,0 +1,273 @@
+"""
+Input-to-Frame Latency Benchmarks
+=================================
+Time from an input arriving until the first frame that shows it reaches
+the screen, for the two dashboard loop shapes:
+
+- ``serial``: poll input, run the due physics steps, draw, sleep (the
+  loop ``dashboard_main`` used before ``SimulationRunner``)
+- ``threaded``: physics on a ``SimulationRunner`` thread; the loop polls
+  input and draws the latest snapshot at ``RENDER_FPS``
+
+Inputs arrive at random times. ``ui`` inputs only change what the render
+loop draws; ``sim`` inputs change simulation state (a wind gust), so on
+the threaded loop they travel through ``SimulationRunner.post``. Latency
+is measured from the arrival time, so time spent waiting to be polled
+counts. Results are emitted as JSON so runs on the same machine can be
+compared.
+
+Run standalone:
+    python tests/bench_latency.py                       # table to stdout
+    python tests/bench_latency.py --count 400000        # heavier physics step
+    python tests/bench_latency.py --json results.json   # also write JSON
+    python tests/bench_latency.py --compare base.json   # ratios against a previous run
+
+Or under pytest (quick pass, not collected by default):
+    pytest tests/bench_latency.py
+"""
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engine.physics.particles import (
+    ArrayParticleSystem, PhysicsConfig, GravityForce, DragForce, WindForce,
+    Vector2, FixedTimestep, create_snow_particle
+)
+from engine.physics.simulation import SimulationRunner
+from engine.rendering.core import InputLatency
+from bench_noise import build_report, compare
+
+
+PARTICLE_COUNTS: List[int] = [20_000, 400_000]
+
+PHYSICS_HZ = 30.0
+RENDER_FPS = 30.0
+
+SCENE_BOUNDS: Tuple[float, float, float, float] = (0, 0, 1000, 300)
+GRID_W, GRID_H = 200, 60  # the dashboard's animation pane, roughly
+
+
+class Scene:
+    """A snow scene with a gust-able wind; ``snapshot`` copies what ``render`` reads."""
+
+    def __init__(self, count: int, seed: int = 42):
+        # No culling, so every step moves the same number of particles
+        self.system = ArrayParticleSystem(PhysicsConfig(bounds_check=False),
+                                          SCENE_BOUNDS, capacity=count)
+        self.wind = WindForce(Vector2(0.8, 0.0))
+        self.system.add_force_generator(GravityForce(0.05))
+        self.system.add_force_generator(DragForce(0.02))
+        self.system.add_force_generator(self.wind)
+
+        rng = np.random.default_rng(seed)
+        x_min, y_min, x_max, y_max = SCENE_BOUNDS
+        positions = rng.random((count, 2)) * (x_max - x_min, y_max - y_min) + (x_min, y_min)
+        velocities = rng.normal(0.0, 0.3, (count, 2))
+        self.system.spawn_many(positions, velocities, template=create_snow_particle(0, 0))
+        self.steps = 0
+
+    def step(self, dt: float):
+        self.system.update(dt)
+        self.steps += 1
+
+    def gust(self):
+        self.wind.base_velocity = Vector2(-self.wind.base_velocity.x, 0.0)
+
+    def snapshot(self) -> np.ndarray:
+        arrays = self.system.arrays
+        return arrays.position[:arrays.count].copy()
+
+
+def render(positions: np.ndarray) -> List[str]:
+    """Rasterize into the pane and build its rows, as a terminal draw would."""
+    x_min, y_min, x_max, y_max = SCENE_BOUNDS
+    cols = ((positions[:, 0] - x_min) * (GRID_W / (x_max - x_min))).astype(np.int64) % GRID_W
+    rows = ((positions[:, 1] - y_min) * (GRID_H / (y_max - y_min))).astype(np.int64) % GRID_H
+    grid = np.zeros(GRID_W * GRID_H, dtype=bool)
+    grid[rows * GRID_W + cols] = True
+    return ["".join("*" if cell else " " for cell in row)
+            for row in grid.reshape(GRID_H, GRID_W).tolist()]
+
+
+def arrivals(duration: float, rate: float, seed: int = 7) -> List[Tuple[str, float]]:
+    """Input arrival times (seconds from start), alternating ``ui``/``sim``."""
+    rng = np.random.default_rng(seed)
+    events, at = [], 0.0
+    while True:
+        at += rng.exponential(1.0 / rate)
+        if at >= duration:
+            return events
+        events.append(('ui' if len(events) % 2 == 0 else 'sim', at))
+
+
+def _due(pending: deque, elapsed: float):
+    while pending and pending[0][1] <= elapsed:
+        yield pending.popleft()
+
+
+def _serial_loop(scene: Scene, events: List[Tuple[str, float]], duration: float,
+                 latency: Dict[str, InputLatency]) -> int:
+    """Poll, step, draw, sleep: physics time sits between an input and its frame."""
+    clock = FixedTimestep(hz=PHYSICS_HZ)
+    pending = deque(events)
+    frames = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        for kind, at in _due(pending, time.perf_counter() - start):
+            latency[kind].input(start + at)
+            if kind == 'sim':
+                scene.gust()
+        for _ in range(clock.tick()):
+            scene.step(clock.dt)
+        render(scene.snapshot())
+        for tracker in latency.values():
+            tracker.presented()
+        frames += 1
+        time.sleep(clock.until_next())
+    return frames
+
+
+def _threaded_loop(scene: Scene, events: List[Tuple[str, float]], duration: float,
+                   latency: Dict[str, InputLatency]) -> int:
+    """Physics on a SimulationRunner; the loop only polls and draws snapshots."""
+    interval = 1.0 / RENDER_FPS
+    pending = deque(events)
+    frames = 0
+    with SimulationRunner(scene.step, scene.snapshot, hz=PHYSICS_HZ) as runner:
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            frame_start = time.perf_counter()
+            for kind, at in _due(pending, frame_start - start):
+                if kind == 'sim':
+                    runner.post(scene.gust, now=start + at)
+                else:
+                    latency[kind].input(start + at)
+            frame = runner.latest()
+            render(frame.state)
+            latency['ui'].presented()
+            latency['sim'].presented(runner.presented(frame))
+            frames += 1
+            time.sleep(max(0.0, interval - (time.perf_counter() - frame_start)))
+    return frames
+
+
+LOOPS: Dict[str, Callable] = {
+    'serial': _serial_loop,
+    'threaded': _threaded_loop,
+}
+
+
+def run_benchmarks(counts: List[int] = PARTICLE_COUNTS,
+                   loops: Optional[List[str]] = None,
+                   duration: float = 3.0, input_rate: float = 8.0) -> List[dict]:
+    """
+    Run every loop × particle count for ``duration`` seconds.
+
+    Returns one record per combination and input kind with the latency
+    percentiles, plus the frame and physics rates the loop sustained.
+    """
+    events = arrivals(duration, input_rate)
+    results = []
+
+    for loop in loops or list(LOOPS):
+        for count in counts:
+            scene = Scene(count)
+            scene.step(1.0)  # warm-up (first allocation of the force buffers)
+            scene.steps = 0
+
+            latency = {'ui': InputLatency(sample_window=len(events)),
+                       'sim': InputLatency(sample_window=len(events))}
+            frames = LOOPS[loop](scene, events, duration, latency)
+
+            for kind, tracker in latency.items():
+                results.append({
+                    'loop': loop,
+                    'particles': count,
+                    'input': kind,
+                    **tracker.get_report(),
+                    'fps': frames / duration,
+                    'physics_hz': scene.steps / duration,
+                })
+    return results
+
+
+def _key(record: dict) -> Tuple[str, ...]:
+    return (record['loop'], str(record['particles']), record['input'])
+
+
+def format_table(results: List[dict]) -> str:
+    lines = [f"{'loop':<9} {'particles':>10} {'input':<5} {'inputs':>6} {'avg ms':>8} "
+             f"{'p95 ms':>8} {'max ms':>8} {'fps':>6} {'physics Hz':>10}"]
+    for r in results:
+        lines.append(f"{r['loop']:<9} {r['particles']:>10,} {r['input']:<5} {r['inputs']:>6} "
+                     f"{r['avg_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['max_ms']:>8.1f} "
+                     f"{r['fps']:>6.1f} {r['physics_hz']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark input-to-frame latency")
+    parser.add_argument('--json', metavar='PATH', help="write the JSON report here ('-' for stdout)")
+    parser.add_argument('--compare', metavar='PATH', help="baseline JSON report to compare against")
+    parser.add_argument('--loop', action='append', choices=list(LOOPS),
+                        help="restrict to a loop (repeatable)")
+    parser.add_argument('--count', action='append', type=int,
+                        help="particle count (repeatable, default 20k/400k)")
+    parser.add_argument('--duration', type=float, default=3.0,
+                        help="seconds per measurement")
+    parser.add_argument('--input-rate', type=float, default=8.0,
+                        help="mean inputs per second")
+    args = parser.parse_args(argv)
+
+    report = build_report(run_benchmarks(counts=args.count or PARTICLE_COUNTS,
+                                         loops=args.loop,
+                                         duration=args.duration,
+                                         input_rate=args.input_rate),
+                          benchmark='engine.physics.simulation')
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(report['results']))
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"\nvs {args.compare} (commit {baseline.get('commit')}), avg latency:", file=sys.stderr)
+        for name, ratio in compare(report, baseline, key=_key, metric='avg_ms'):
+            print(f"  {name:<32} {ratio:6.2f}x", file=sys.stderr)
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PYTEST ENTRY POINTS (quick pass on a light scene)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def test_benchmark_report(tmp_path):
+    """Both loops see every input and keep physics stepping."""
+    results = run_benchmarks(counts=[2_000], duration=0.5, input_rate=20.0)
+
+    assert [(r['loop'], r['input']) for r in results] == [
+        ('serial', 'ui'), ('serial', 'sim'), ('threaded', 'ui'), ('threaded', 'sim')]
+    assert all(r['inputs'] > 0 and r['avg_ms'] > 0 and r['physics_hz'] > 0 for r in results)
+
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(build_report(results, benchmark='engine.physics.simulation')))
+    report = json.loads(path.read_text())
+
+    assert [name for name, _ in compare(report, report, key=_key, metric='avg_ms')] == [
+        "/".join(_key(r)) for r in results]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
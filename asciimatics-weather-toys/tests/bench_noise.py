@@ -0,0 +1,237 @@
+"""
+Noise Generator Benchmarks
+==========================
+Throughput (samples/second) of the engine noise generators through their
+scalar ``sample()`` and batched ``sample_grid()`` entry points, at terminal
+sized grids. Results are emitted as JSON so runs on the same machine can be
+compared between commits.
+
+Run standalone:
+    python tests/bench_noise.py                       # table to stdout
+    python tests/bench_noise.py --json results.json   # also write JSON
+    python tests/bench_noise.py --compare base.json   # ratios against a previous run
+
+Or under pytest (quick pass, not collected by default):
+    pytest tests/bench_noise.py
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engine.physics.noise import PerlinNoise, SimplexNoise, FractalNoise, DomainWarp
+
+
+GRID_SIZES: List[Tuple[int, int]] = [(80, 24), (200, 60), (400, 120)]
+
+# Terminal cell spacing in noise units (matches the dashboard cloud band)
+CELL_X = 0.15
+CELL_Y = 0.3
+
+
+def make_generators(seed: int = 42) -> Dict[str, object]:
+    """The generators under test, built the way the dashboard builds them."""
+    return {
+        'perlin': PerlinNoise(seed),
+        'simplex': SimplexNoise(seed),
+        'fractal': FractalNoise(PerlinNoise(seed)),
+        'domain_warp': DomainWarp(FractalNoise(PerlinNoise(seed)), warp_strength=4.0),
+    }
+
+
+def _scalar_pass(generator, xs: List[float], ys: List[float]) -> Callable[[], None]:
+    sample = generator.sample
+
+    def run():
+        for y in ys:
+            for x in xs:
+                sample(x, y)
+    return run
+
+
+def _grid_pass(generator, xs: List[float], ys: List[float]) -> Callable[[], None]:
+    xs_array = np.asarray(xs)
+    ys_array = np.asarray(ys)
+
+    def run():
+        generator.sample_grid(xs_array, ys_array)
+    return run
+
+
+ENTRY_POINTS: Dict[str, Callable] = {
+    'scalar': _scalar_pass,
+    'grid': _grid_pass,
+}
+
+
+def time_pass(run: Callable[[], None], min_time: float, max_repeats: int) -> float:
+    """Best wall time of one pass, repeating until ``min_time`` has elapsed."""
+    best = float('inf')
+    elapsed = 0.0
+    repeats = 0
+    while repeats < max_repeats and (repeats == 0 or elapsed < min_time):
+        start = time.perf_counter()
+        run()
+        duration = time.perf_counter() - start
+        best = min(best, duration)
+        elapsed += duration
+        repeats += 1
+    return best
+
+
+def run_benchmarks(sizes: List[Tuple[int, int]] = GRID_SIZES,
+                   generators: Optional[List[str]] = None,
+                   entry_points: Optional[List[str]] = None,
+                   min_time: float = 0.2, max_repeats: int = 20) -> List[dict]:
+    """
+    Benchmark every generator × entry point × grid size.
+
+    Returns one record per combination with the best-of-N pass time and
+    the resulting samples/second.
+    """
+    available = make_generators()
+    results = []
+
+    for name in generators or list(available):
+        generator = available[name]
+        for entry in entry_points or list(ENTRY_POINTS):
+            for width, height in sizes:
+                xs = [x * CELL_X for x in range(width)]
+                ys = [y * CELL_Y for y in range(height)]
+                run = ENTRY_POINTS[entry](generator, xs, ys)
+                run()  # warm-up (caches, lazy allocations)
+
+                seconds = time_pass(run, min_time, max_repeats)
+                samples = width * height
+                results.append({
+                    'generator': name,
+                    'entry_point': entry,
+                    'grid': f"{width}x{height}",
+                    'samples': samples,
+                    'seconds': seconds,
+                    'samples_per_sec': samples / seconds if seconds > 0 else float('inf'),
+                })
+    return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              cwd=Path(__file__).resolve().parent,
+                              capture_output=True, text=True,
+                              check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: List[dict], benchmark: str = 'engine.physics.noise') -> dict:
+    """Wrap results with the metadata needed to compare runs."""
+    return {
+        'benchmark': benchmark,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def _noise_key(record: dict) -> Tuple[str, ...]:
+    return (record['generator'], record['entry_point'], record['grid'])
+
+
+def compare(report: dict, baseline: dict,
+            key: Callable[[dict], Tuple[str, ...]] = _noise_key,
+            metric: str = 'samples_per_sec') -> List[Tuple[str, float]]:
+    """Throughput ratio (current / baseline) for each matching record."""
+    previous = {key(r): r[metric] for r in baseline.get('results', [])}
+    ratios = []
+    for record in report['results']:
+        before = previous.get(key(record))
+        if before:
+            ratios.append(("/".join(key(record)), record[metric] / before))
+    return ratios
+
+
+def format_table(results: List[dict]) -> str:
+    lines = [f"{'generator':<12} {'entry':<7} {'grid':<8} {'samples/s':>14} {'ms/pass':>10}"]
+    for r in results:
+        lines.append(f"{r['generator']:<12} {r['entry_point']:<7} {r['grid']:<8} "
+                     f"{r['samples_per_sec']:>14,.0f} {r['seconds'] * 1000:>10.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine noise generators")
+    parser.add_argument('--json', metavar='PATH', help="write the JSON report here ('-' for stdout)")
+    parser.add_argument('--compare', metavar='PATH', help="baseline JSON report to compare against")
+    parser.add_argument('--generator', action='append', choices=list(make_generators()),
+                        help="restrict to a generator (repeatable)")
+    parser.add_argument('--entry', action='append', choices=list(ENTRY_POINTS),
+                        help="restrict to an entry point (repeatable)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="minimum seconds spent per measurement")
+    args = parser.parse_args(argv)
+
+    report = build_report(run_benchmarks(generators=args.generator,
+                                         entry_points=args.entry,
+                                         min_time=args.min_time))
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(report['results']))
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"\nvs {args.compare} (commit {baseline.get('commit')}):", file=sys.stderr)
+        for name, ratio in compare(report, baseline):
+            print(f"  {name:<32} {ratio:6.2f}x", file=sys.stderr)
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PYTEST ENTRY POINTS (quick pass on the smallest grid)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def test_benchmark_report(tmp_path):
+    """Every generator/entry point produces a positive throughput."""
+    results = run_benchmarks(sizes=GRID_SIZES[:1], min_time=0.0, max_repeats=1)
+
+    assert len(results) == len(make_generators()) * len(ENTRY_POINTS)
+    assert all(r['samples'] == 80 * 24 and r['samples_per_sec'] > 0 for r in results)
+
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(build_report(results)))
+    report = json.loads(path.read_text())
+
+    assert report['results'] == results
+    assert [name for name, _ in compare(report, report)] == [
+        f"{r['generator']}/{r['entry_point']}/{r['grid']}" for r in results]
+
+
+def test_grid_outpaces_scalar():
+    """The batched grid path must stay ahead of per-sample calls."""
+    results = run_benchmarks(sizes=GRID_SIZES[:1], generators=['perlin'],
+                             min_time=0.0, max_repeats=3)
+    rate = {r['entry_point']: r['samples_per_sec'] for r in results}
+
+    assert rate['grid'] > rate['scalar']
+
+
+if __name__ == '__main__':
+    sys.exit(main())
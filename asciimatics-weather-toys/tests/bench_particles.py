@@ -0,0 +1,170 @@
+"""
+Particle Backend Benchmarks
+===========================
+Frame time of ``ArrayParticleSystem`` (single process) against
+``ParallelParticleSystem`` (band-parallel worker processes over shared
+memory) for a snowstorm-like scene at 10k, 100k and 1M particles. Results
+are emitted as JSON so runs on the same machine can be compared.
+
+Run standalone:
+    python tests/bench_particles.py                       # table to stdout
+    python tests/bench_particles.py --workers 8           # worker processes
+    python tests/bench_particles.py --json results.json   # also write JSON
+    python tests/bench_particles.py --compare base.json   # ratios against a previous run
+
+Or under pytest (quick pass, not collected by default):
+    pytest tests/bench_particles.py
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engine.physics.particles import (
+    ArrayParticleSystem, ParallelParticleSystem, PhysicsConfig,
+    GravityForce, DragForce, WindForce, Vector2, create_snow_particle
+)
+from bench_noise import time_pass, build_report, compare
+
+
+PARTICLE_COUNTS: List[int] = [10_000, 100_000, 1_000_000]
+
+# A 4K terminal with a tiny font is roughly 1000 x 300 cells
+SCENE_BOUNDS: Tuple[float, float, float, float] = (0, 0, 1000, 300)
+
+
+def build_scene(backend: str, count: int, workers: int, seed: int = 42):
+    """Heavy snow over ``SCENE_BOUNDS`` on the requested backend."""
+    # No culling, so every pass steps the same number of particles
+    config = PhysicsConfig(bounds_check=False, parallel_workers=workers)
+    if backend == 'parallel':
+        system = ParallelParticleSystem(config, SCENE_BOUNDS, capacity=count, min_parallel=0)
+    else:
+        system = ArrayParticleSystem(config, SCENE_BOUNDS, capacity=count)
+    system.add_force_generator(GravityForce(0.05))
+    system.add_force_generator(DragForce(0.02))
+    system.add_force_generator(WindForce(Vector2(0.8, 0.0)))
+
+    rng = np.random.default_rng(seed)
+    x_min, y_min, x_max, y_max = SCENE_BOUNDS
+    positions = rng.random((count, 2)) * (x_max - x_min, y_max - y_min) + (x_min, y_min)
+    velocities = rng.normal(0.0, 0.3, (count, 2))
+    system.spawn_many(positions, velocities, template=create_snow_particle(0, 0))
+    return system
+
+
+BACKENDS: Dict[str, str] = {
+    'array': "ArrayParticleSystem, one process",
+    'parallel': "ParallelParticleSystem, one band per worker",
+}
+
+
+def run_benchmarks(counts: List[int] = PARTICLE_COUNTS,
+                   backends: Optional[List[str]] = None,
+                   workers: Optional[int] = None,
+                   min_time: float = 0.5, max_repeats: int = 20) -> List[dict]:
+    """
+    Benchmark every backend × particle count.
+
+    Returns one record per combination with the best-of-N frame time and
+    the resulting particles/second.
+    """
+    workers = workers or os.cpu_count() or 1
+    results = []
+
+    for backend in backends or list(BACKENDS):
+        for count in counts:
+            system = build_scene(backend, count, workers)
+            try:
+                run = lambda: system.update(1.0)
+                run()  # warm-up (worker start-up, first attach)
+
+                seconds = time_pass(run, min_time, max_repeats)
+                results.append({
+                    'backend': backend,
+                    'particles': count,
+                    'workers': workers if backend == 'parallel' else 1,
+                    'seconds': seconds,
+                    'particles_per_sec': count / seconds if seconds > 0 else float('inf'),
+                })
+            finally:
+                if backend == 'parallel':
+                    system.close()
+    return results
+
+
+def _key(record: dict) -> Tuple[str, ...]:
+    return (record['backend'], str(record['particles']), f"{record['workers']}w")
+
+
+def format_table(results: List[dict]) -> str:
+    lines = [f"{'backend':<9} {'particles':>10} {'workers':>8} {'ms/frame':>10} {'particles/s':>14}"]
+    for r in results:
+        lines.append(f"{r['backend']:<9} {r['particles']:>10,} {r['workers']:>8} "
+                     f"{r['seconds'] * 1000:>10.2f} {r['particles_per_sec']:>14,.0f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark particle backends")
+    parser.add_argument('--json', metavar='PATH', help="write the JSON report here ('-' for stdout)")
+    parser.add_argument('--compare', metavar='PATH', help="baseline JSON report to compare against")
+    parser.add_argument('--backend', action='append', choices=list(BACKENDS),
+                        help="restrict to a backend (repeatable)")
+    parser.add_argument('--count', action='append', type=int,
+                        help="particle count (repeatable, default 10k/100k/1M)")
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help="minimum seconds spent per measurement")
+    args = parser.parse_args(argv)
+
+    report = build_report(run_benchmarks(counts=args.count or PARTICLE_COUNTS,
+                                         backends=args.backend,
+                                         workers=args.workers,
+                                         min_time=args.min_time),
+                          benchmark='engine.physics.particles')
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(report['results']))
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print(f"\nvs {args.compare} (commit {baseline.get('commit')}):", file=sys.stderr)
+        for name, ratio in compare(report, baseline, key=_key, metric='particles_per_sec'):
+            print(f"  {name:<32} {ratio:6.2f}x", file=sys.stderr)
+    return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PYTEST ENTRY POINTS (quick pass at the smallest count)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def test_benchmark_report(tmp_path):
+    """Both backends produce a positive throughput and a comparable report."""
+    results = run_benchmarks(counts=PARTICLE_COUNTS[:1], workers=2,
+                             min_time=0.0, max_repeats=1)
+
+    assert [r['backend'] for r in results] == list(BACKENDS)
+    assert all(r['particles'] == 10_000 and r['particles_per_sec'] > 0 for r in results)
+
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(build_report(results, benchmark='engine.physics.particles')))
+    report = json.loads(path.read_text())
+
+    assert [name for name, _ in compare(report, report, key=_key, metric='particles_per_sec')] == [
+        "/".join(_key(r)) for r in results]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,20 +8,32 @@ Or: python -m pytest tests/ -v --cov=engine
 """
 import sys
 import math
+import pickle
 import time
+import tracemalloc
 import pytest
+import numpy as np
 from unittest.mock import Mock, MagicMock
 
 # Add parent to path for imports
 sys.path.insert(0, '..')
 
 from engine.physics.noise import (
-    PerlinNoise, SimplexNoise, FractalNoise, DomainWarp, NoiseConfig
+    PerlinNoise, SimplexNoise, FractalNoise, DomainWarp, NoiseConfig,
+    SimplexNoise3D, ScrollingFieldCache, NoiseAtlas, NoiseSliceCache,
+    CurlNoiseField, ParallelGridSampler, VectorField
 )
 from engine.physics.particles import (
     Vector2, Particle, ParticleSystem, PhysicsConfig,
-    GravityForce, DragForce, WindForce, IntegrationType
+    GravityForce, DragForce, WindForce, TurbulenceForce, IntegrationType,
+    ForceGenerator, ArrayParticleSystem, ParticlePool, FusedForce, FieldForce,
+    SpatialHash, Emitter, EmitterShape, FixedTimestep, ParticleArrays,
+    SharedParticleArrays, ParallelParticleSystem, create_particle_system,
+    CollisionSurface, FlatGround, CollisionEvents,
+    create_rain_particle, create_snow_particle
 )
+from engine.physics.ground import Heightfield, PUDDLE_GLYPHS
+from engine.physics.simulation import SimulationRunner
 from engine.physics.atmosphere import (
     AtmosphericModel, AtmosphericState, StabilityClass,
     WindModel, calculate_wind_chill, calculate_heat_index
@@ -31,7 +43,8 @@ from engine.personality.core import (
     PersonalityConfig, DialogueBank
 )
 from engine.rendering.core import (
-    RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer
+    RenderStats, FrameBudget, ParticleBudget, RenderQueue, RenderCommand, RenderLayer,
+    InputLatency, RenderEngine
 )
 
 
@@ -150,6 +163,495 @@ class TestFractalNoise:
         assert len(diffs_1) == len(diffs_4)
 
 
+class TestBatchedNoise:
+    """Test vectorized grid/point sampling."""
+    
+    XS = [x * 0.37 - 20.0 for x in range(40)]
+    YS = [y * 0.53 - 7.0 for y in range(12)]
+    
+    def _assert_grid_matches_scalar(self, gen):
+        grid = gen.sample_grid(self.XS, self.YS)
+        assert grid.shape == (len(self.YS), len(self.XS))
+        for row, y in enumerate(self.YS):
+            for col, x in enumerate(self.XS):
+                assert grid[row, col] == gen.sample(x, y)
+    
+    def test_perlin_grid_bit_compatible(self):
+        """Batched Perlin must reproduce scalar samples exactly."""
+        self._assert_grid_matches_scalar(PerlinNoise(seed=42))
+    
+    def test_simplex_grid_bit_compatible(self):
+        self._assert_grid_matches_scalar(SimplexNoise(seed=42))
+    
+    def test_fractal_grid_bit_compatible(self):
+        self._assert_grid_matches_scalar(FractalNoise(PerlinNoise(seed=42)))
+    
+    def test_domain_warp_grid_bit_compatible(self):
+        self._assert_grid_matches_scalar(DomainWarp(FractalNoise(), warp_strength=4.0))
+    
+    def test_domain_warp_stacks_warp_passes(self):
+        """Each warp pass should be a single batched fractal call."""
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        calls = []
+        original = fractal.sample_array
+        fractal.sample_array = lambda x, y: calls.append(x.shape) or original(x, y)
+        
+        DomainWarp(fractal).sample_grid(self.XS, self.YS)
+        
+        grid_shape = (len(self.YS), len(self.XS))
+        assert calls == [(2,) + grid_shape, (2,) + grid_shape, grid_shape]
+    
+    def test_sample_many(self):
+        """Point batches return one value per point."""
+        noise = PerlinNoise(seed=42)
+        points = list(zip(self.XS, reversed(self.XS)))
+        values = noise.sample_many(points)
+        
+        assert values.shape == (len(points),)
+        assert list(values) == [noise.sample(x, y) for x, y in points]
+    
+    def test_fractal_octave_override(self):
+        """Keyword overrides are honoured by batched entry points."""
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        grid = fractal.sample_grid(self.XS, self.YS, octaves=2)
+        
+        assert grid[3, 5] == fractal.sample(self.XS[5], self.YS[3], octaves=2)
+
+
+class TestScrollingFieldCache:
+    """Test incremental scrolling field cache."""
+    
+    ROWS = [0.6, 0.9, 1.2, 1.5]
+    
+    def _cache(self, **kwargs):
+        return ScrollingFieldCache(FractalNoise(PerlinNoise(seed=42)).sample_array,
+                                   column_step=0.15, **kwargs)
+    
+    def test_incremental_matches_rebuild(self):
+        """Shifted strip should equal a freshly evaluated one."""
+        scrolling = self._cache()
+        offset = 0.0
+        for _ in range(50):
+            offset += 0.02
+            strip = scrolling.get(offset, 80, self.ROWS)
+        
+        fresh = self._cache().get(offset, 80, self.ROWS)
+        assert (strip == fresh).all()
+        assert scrolling.rebuilds == 1
+    
+    def test_steady_state_cost(self):
+        """Scrolling should only evaluate newly exposed columns."""
+        scrolling = self._cache()
+        scrolling.get(0.0, 200, self.ROWS)
+        initial = scrolling.evaluated_cells
+        
+        scrolling.get(0.15 * 3, 200, self.ROWS)
+        
+        assert scrolling.evaluated_cells - initial == 3 * len(self.ROWS)
+    
+    def test_invalidation(self):
+        """Width, key or explicit invalidation should rebuild."""
+        scrolling = self._cache()
+        scrolling.get(0.0, 80, self.ROWS, key="rain")
+        scrolling.get(0.0, 100, self.ROWS, key="rain")
+        scrolling.get(0.0, 100, self.ROWS, key="snow")
+        scrolling.invalidate()
+        strip = scrolling.get(0.0, 100, self.ROWS, key="snow")
+        
+        assert scrolling.rebuilds == 4
+        assert strip.shape == (len(self.ROWS), 100)
+    
+    def test_refresh_interval(self):
+        scrolling = self._cache(refresh_interval=5)
+        for _ in range(10):
+            scrolling.get(0.0, 40, self.ROWS)
+        
+        assert scrolling.rebuilds == 2
+
+
+class TestNoiseAtlas:
+    """Test pre-baked tileable noise atlas."""
+    
+    def test_tiles_seamlessly(self):
+        """Samples one period apart should be identical."""
+        atlas = NoiseAtlas(seed=42, resolution=64, period=4, octaves=3)
+        
+        for x, y in [(0.3, 0.7), (1.9, 3.2), (3.99, 0.01)]:
+            assert abs(atlas.sample(x, y) - atlas.sample(x + 4, y - 8)) < 1e-9
+        
+        # No seam across the wrap edge
+        assert abs(atlas.sample(3.999, 1.0) - atlas.sample(0.0, 1.0)) < 0.01
+    
+    def test_batched_matches_scalar(self):
+        atlas = NoiseAtlas(seed=42, resolution=64, period=4, octaves=3)
+        xs = [x * 0.37 - 5.0 for x in range(30)]
+        ys = [y * 0.41 for y in range(10)]
+        grid = atlas.sample_grid(xs, ys)
+        
+        for row, y in enumerate(ys):
+            for col, x in enumerate(xs):
+                assert abs(grid[row, col] - atlas.sample(x, y)) < 1e-9
+    
+    def test_resembles_fractal(self):
+        """Inside the first tile the atlas approximates fBm with the same seed."""
+        atlas = NoiseAtlas(seed=42, resolution=256, period=8, octaves=4)
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        
+        for x, y in [(0.5, 0.5), (2.3, 4.1), (5.7, 1.9)]:
+            assert abs(atlas.sample(x, y) - fractal.sample(x, y)) < 0.05
+    
+    def test_persistence(self, tmp_path):
+        """Second load should reuse the baked texture from disk."""
+        baked = NoiseAtlas.load_or_bake(tmp_path, seed=7, resolution=32, period=4)
+        files = list(tmp_path.iterdir())
+        loaded = NoiseAtlas.load_or_bake(tmp_path, seed=7, resolution=32, period=4)
+        
+        assert [f.name for f in files] == [baked.cache_key]
+        assert (loaded.texture == baked.texture).all()
+    
+    def test_corrupt_cache_rebakes(self, tmp_path):
+        params = dict(seed=7, resolution=32, period=4)
+        (tmp_path / NoiseAtlas(**params).cache_key).write_bytes(b"garbage")
+        
+        atlas = NoiseAtlas.load_or_bake(tmp_path, **params)
+        
+        assert atlas.texture.shape == (32, 32)
+
+
+class TestCurlNoise:
+    """Test analytic-gradient Perlin and curl-noise fields."""
+    
+    POINTS = [(0.3, 0.7), (1.9, -3.2), (12.25, 5.5), (-7.77, 0.01)]
+    
+    def test_gradient_matches_finite_difference(self):
+        noise = PerlinNoise(seed=42)
+        h = 1e-6
+        
+        for x, y in self.POINTS:
+            value, dx, dy = noise.sample_with_gradient(x, y)
+            
+            assert value == noise.sample(x, y)
+            assert abs(dx - (noise.sample(x + h, y) - noise.sample(x - h, y)) / (2 * h)) < 1e-5
+            assert abs(dy - (noise.sample(x, y + h) - noise.sample(x, y - h)) / (2 * h)) < 1e-5
+    
+    def test_batched_gradient_matches_scalar(self):
+        noise = PerlinNoise(seed=42)
+        xs, ys = zip(*self.POINTS)
+        values, dxs, dys = noise.sample_with_gradient_array(xs, ys)
+        
+        for i, (x, y) in enumerate(self.POINTS):
+            assert (values[i], dxs[i], dys[i]) == noise.sample_with_gradient(x, y)
+    
+    def test_divergence_free(self):
+        """Curl of a potential has (numerically) zero divergence."""
+        field = CurlNoiseField(PerlinNoise(seed=42), octaves=3, scale=0.1)
+        h = 1e-4
+        
+        for x, y in self.POINTS:
+            div = (
+                (field.velocity(x + h, y)[0] - field.velocity(x - h, y)[0]) +
+                (field.velocity(x, y + h)[1] - field.velocity(x, y - h)[1])
+            ) / (2 * h)
+            assert abs(div) < 1e-6
+    
+    def test_velocity_array(self):
+        field = CurlNoiseField(PerlinNoise(seed=42), scale=0.1, strength=2.0)
+        xs, ys = zip(*self.POINTS)
+        vx, vy = field.velocity_array(xs, ys, t=0.5)
+        
+        for i, (x, y) in enumerate(self.POINTS):
+            ex, ey = field.velocity(x, y, t=0.5)
+            assert abs(vx[i] - ex) < 1e-12 and abs(vy[i] - ey) < 1e-12
+    
+    def test_usable_as_turbulence_func(self):
+        field = CurlNoiseField(PerlinNoise(seed=42), scale=0.1)
+        wind = WindForce(turbulence_func=field)
+        p = Particle(position=Vector2(50, 25))
+        
+        wind.apply(p, 1.0)
+        
+        assert p._accumulated_force.magnitude > 0
+
+
+class TestSimplexNoise3D:
+    """Test 3D simplex noise and time-slice caching."""
+    
+    def test_range_and_determinism(self):
+        n1 = SimplexNoise3D(seed=42)
+        n2 = SimplexNoise3D(seed=42)
+        values = [n1.sample(x * 0.31, y * 0.27, z * 0.5)
+                  for x in range(20) for y in range(20) for z in range(5)]
+        
+        assert values == [n2.sample(x * 0.31, y * 0.27, z * 0.5)
+                          for x in range(20) for y in range(20) for z in range(5)]
+        assert min(values) >= -1.0 and max(values) <= 1.0
+        assert min(values) < -0.3 and max(values) > 0.3
+    
+    def test_time_evolves_field(self):
+        """Changing t should change the field smoothly."""
+        noise = SimplexNoise3D(seed=42)
+        
+        assert noise.sample(1.3, 2.7, 0.0) != noise.sample(1.3, 2.7, 0.5)
+        assert abs(noise.sample(1.3, 2.7, 0.0) - noise.sample(1.3, 2.7, 0.001)) < 0.01
+    
+    def test_batched_bit_compatible(self):
+        """Vectorized path must cover all six tetrahedra identically."""
+        noise = SimplexNoise3D(seed=42)
+        xs = [x * 0.37 - 5.0 for x in range(25)]
+        ys = [y * 0.41 - 2.0 for y in range(25)]
+        
+        for z in (-1.7, 0.0, 3.3):
+            grid = noise.sample_grid(xs, ys, z)
+            for row, y in enumerate(ys):
+                for col, x in enumerate(xs):
+                    assert grid[row, col] == noise.sample(x, y, z)
+    
+    def test_slice_cache_accuracy(self):
+        noise = SimplexNoise3D(seed=42)
+        cache = NoiseSliceCache(noise, cell_size=0.1)
+        
+        for x, y in [(0.05, 0.05), (-3.33, 1.27), (12.345, -6.789)]:
+            assert abs(cache(x, y, 1.0) - noise.sample(x, y, 1.0)) < 0.02
+    
+    def test_slice_cache_cost_independent_of_particles(self):
+        """Many lookups in one frame should reuse the same tiles."""
+        cache = NoiseSliceCache(SimplexNoise3D(seed=42), cell_size=0.1, tile_size=16)
+        
+        for i in range(2000):
+            cache(1.0 + (i % 100) * 0.01, 1.0 + (i // 100) * 0.01, 0.5)
+        
+        assert cache.slices == 1
+        assert cache.evaluated_points <= 4 * 17 * 17
+        
+        cache(1.0, 1.0, 0.6)
+        assert cache.slices == 2
+    
+    def test_turbulence_time_independent_of_particle_count(self):
+        """Turbulence time should advance per step, not per particle."""
+        for count in (1, 50):
+            turbulence = TurbulenceForce(NoiseSliceCache(), time_scale=0.1)
+            system = ParticleSystem(PhysicsConfig(substeps=2), bounds=(0, 0, 100, 100))
+            system.add_force_generator(turbulence)
+            for i in range(count):
+                system.spawn(Particle(position=Vector2(i, 50)))
+            
+            system.update(1.0)
+            
+            assert abs(turbulence.time - 0.1) < 1e-12
+            assert turbulence.noise_func.slices == 2
+
+
+class TestOctaveLOD:
+    """Test frequency-aware octave level of detail."""
+    
+    def test_no_footprint_is_unchanged(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        
+        assert fractal.visible_octaves(4, 2.0) == 4
+        assert fractal.sample(1.3, 2.7, footprint=None) == fractal.sample(1.3, 2.7)
+    
+    def test_nyquist_culling(self):
+        """Octaves finer than two samples per feature are skipped."""
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        
+        # Features per sample at footprint 0.15: 0.15, 0.3, 0.6, 1.2
+        assert fractal.visible_octaves(4, 2.0, footprint=0.15) == 2
+        assert fractal.visible_octaves(4, 2.0, footprint=0.01) == 4
+        assert fractal.visible_octaves(4, 2.0, footprint=10.0) == 1
+    
+    def test_culled_sample_equals_truncated_sum(self):
+        """Culling drops high octaves but keeps the full normalization."""
+        base = PerlinNoise(seed=42)
+        fractal = FractalNoise(base)
+        x, y = 3.3, 1.7
+        
+        expected = (base.sample(x, y) + 0.5 * base.sample(2 * x, 2 * y)) / 1.875
+        
+        assert abs(fractal.sample(x, y, footprint=0.15) - expected) < 1e-12
+    
+    def test_grid_lod_from_spacing(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        xs = [x * 0.15 for x in range(20)]
+        ys = [y * 0.3 for y in range(4)]
+        
+        grid = fractal.sample_grid(xs, ys, lod=True)
+        
+        assert grid[2, 7] == fractal.sample(xs[7], ys[2], footprint=0.15)
+    
+    def test_grid_lod_scales_with_step(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        xs = [x * 0.15 for x in range(20)]
+        ys = [y * 0.3 for y in range(5)]
+        
+        grid = fractal.sample_grid(xs, ys, lod=True, step=2)
+        
+        assert grid[2, 8] == fractal.sample(xs[8], ys[2], footprint=0.3)
+    
+    def test_quality_caps_octaves(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        
+        fractal.set_quality(0.5)
+        assert fractal.visible_octaves(4, 2.0) == 2
+        
+        fractal.set_quality(1.0)
+        assert fractal.max_octaves is None
+
+
+class TestUpsampledGrid:
+    """Test reduced-resolution evaluation with bilinear upsampling."""
+    
+    XS = [x * 0.15 for x in range(41)]
+    YS = [y * 0.3 for y in range(13)]
+    
+    def test_coarse_samples_exact(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        full = fractal.sample_grid(self.XS, self.YS)
+        
+        for step in (2, 3, 4):
+            coarse = fractal.sample_grid(self.XS, self.YS, step=step)
+            assert coarse.shape == full.shape
+            assert (coarse[::step, ::step] == full[::step, ::step]).all()
+            # Last row/column is always evaluated
+            assert (coarse[-1, -1] == full[-1, -1])
+    
+    def test_interpolates_between_samples(self):
+        """Midpoints should be the average of their neighbours."""
+        noise = PerlinNoise(seed=42)
+        full = noise.sample_grid(self.XS, self.YS)
+        half = noise.sample_grid(self.XS, self.YS, step=2)
+        
+        assert abs(half[0, 1] - (full[0, 0] + full[0, 2]) / 2) < 1e-12
+        assert abs(half[1, 0] - (full[0, 0] + full[2, 0]) / 2) < 1e-12
+    
+    def test_step_one_is_full_resolution(self):
+        noise = PerlinNoise(seed=42)
+        
+        assert (noise.sample_grid(self.XS, self.YS, step=1) ==
+                noise.sample_grid(self.XS, self.YS)).all()
+    
+    def test_degenerate_axes(self):
+        noise = PerlinNoise(seed=42)
+        grid = noise.sample_grid([0.3], self.YS, step=4)
+        
+        assert grid.shape == (len(self.YS), 1)
+        assert grid[4, 0] == noise.sample(0.3, self.YS[4])
+
+
+class TestVectorField:
+    """Test per-frame sampled vector field grids."""
+    
+    @staticmethod
+    def _field(cell_size=2.0):
+        curl = CurlNoiseField(PerlinNoise(seed=42), octaves=3, scale=0.02)
+        field = VectorField(curl.velocity_array, bounds=(10, 0, 90, 30), cell_size=cell_size)
+        field.update(0.5)
+        return curl, field
+    
+    def test_exact_at_nodes(self):
+        curl, field = self._field()
+        
+        for x, y in [(10, 0), (14, 6), (90, 30)]:
+            u, v = curl.velocity(x, y, 0.5)
+            fu, fv = field.sample(x, y)
+            assert abs(fu - u) < 1e-12 and abs(fv - v) < 1e-12
+    
+    def test_interpolates_smooth_field(self):
+        curl, field = self._field()
+        xs = [11.3 + i * 0.77 for i in range(100)]
+        ys = [(i * 0.37) % 29 for i in range(100)]
+        
+        exact_u, _ = curl.velocity_array(np.array(xs), np.array(ys), 0.5)
+        grid_u, _ = field.sample_array(xs, ys)
+        
+        rms = np.sqrt(np.mean((exact_u - grid_u) ** 2) / np.mean(exact_u ** 2))
+        assert rms < 0.1
+    
+    def test_scalar_matches_batched_and_clamps(self):
+        _, field = self._field(cell_size=3.0)
+        points = [(-20, -5), (10, 0), (33.3, 17.1), (89.9, 29.9), (200, 100)]
+        
+        u, v = field.sample_array([p[0] for p in points], [p[1] for p in points])
+        assert [field.sample(*p) for p in points] == list(zip(u.tolist(), v.tolist()))
+        assert field.sample(-20, -5) == field.sample(10, 0)
+    
+    def test_cost_independent_of_particles(self):
+        _, field = self._field()
+        nodes = field.rows * field.columns
+        
+        for i in range(1000):
+            field.sample(i % 80 + 10, i % 30)
+        
+        assert field.evaluated_nodes == nodes
+        assert field.updates == 1
+    
+    def test_field_force_backends_agree(self):
+        _, field = self._field()
+        systems = (ParticleSystem(PhysicsConfig(bounds_check=False)),
+                   ArrayParticleSystem(PhysicsConfig(bounds_check=False)))
+        for system in systems:
+            system.add_force_generator(FieldForce(field, strength=2.0))
+            system.add_force_generator(WindForce(turbulence_func=field))
+            for i in range(20):
+                system.spawn(Particle(position=Vector2(12 + i * 3.7, i * 1.3)))
+            system.update(1.0)
+        
+        assert systems[0].force_generators[1].turbulence_many == field.sample_array
+        state = lambda s: sorted((p.position.x, p.position.y) for p in s.particles)
+        assert state(systems[0]) == pytest.approx(state(systems[1]), abs=1e-12)
+
+
+class TestParallelGrid:
+    """Test picklable generators and row-parallel grid evaluation."""
+    
+    XS = [x * 0.05 for x in range(120)]
+    YS = [y * 0.1 for y in range(40)]
+    
+    def test_generators_pickle_compactly(self):
+        for noise in (PerlinNoise(seed=7), SimplexNoise(seed=7), SimplexNoise3D(seed=7)):
+            data = pickle.dumps(noise)
+            clone = pickle.loads(data)
+            
+            assert len(data) < 1024
+            assert clone._perm == noise._perm
+            assert (clone._perm_array == noise._perm_array).all()
+        
+        perlin = PerlinNoise(seed=7)
+        assert pickle.loads(pickle.dumps(perlin)).sample(1.3, 2.7) == perlin.sample(1.3, 2.7)
+    
+    def test_composite_generators_pickle(self):
+        warp = DomainWarp(FractalNoise(SimplexNoise(seed=3)))
+        clone = pickle.loads(pickle.dumps(warp))
+        
+        assert (clone.sample_grid(self.XS[:10], self.YS[:5]) ==
+                warp.sample_grid(self.XS[:10], self.YS[:5])).all()
+    
+    def test_bands_cover_rows(self):
+        sampler = ParallelGridSampler(max_workers=3, min_band_rows=4)
+        
+        assert sampler.bands(40) == [(0, 13), (13, 27), (27, 40)]
+        assert sampler.bands(5) == [(0, 5)]
+    
+    def test_small_grid_runs_inline(self):
+        noise = PerlinNoise(seed=42)
+        sampler = ParallelGridSampler(max_workers=2)
+        
+        grid = sampler.sample_grid(noise, self.XS, self.YS)
+        
+        assert sampler.inline_calls == 1
+        assert sampler._executor is None
+        assert (grid == noise.sample_grid(self.XS, self.YS)).all()
+    
+    def test_parallel_matches_inline(self):
+        fractal = FractalNoise(PerlinNoise(seed=42))
+        
+        with ParallelGridSampler(max_workers=2, min_cells=0) as sampler:
+            grid = sampler.sample_grid(fractal, self.XS, self.YS, lod=True)
+            
+            assert sampler.parallel_calls == 1
+        
+        assert (grid == fractal.sample_grid(self.XS, self.YS, lod=True)).all()
+
+
 class TestParticle:
     """Test particle physics."""
     
@@ -214,6 +716,60 @@ class TestParticle:
         assert not p.alive
 
 
+class TestInPlaceVectors:
+    """Test slotted vectors/particles and allocation-free stepping."""
+    
+    def test_slots(self):
+        assert not hasattr(Vector2(), '__dict__')
+        assert not hasattr(Particle(), '__dict__')
+        assert Vector2(1, 2) == Vector2(1, 2)
+    
+    def test_mutators(self):
+        v = Vector2(1, 2)
+        
+        assert v.iadd(Vector2(1, 1)) is v and v == Vector2(2, 3)
+        assert v.iscale(2) is v and v == Vector2(4, 6)
+        assert v.add_scaled(Vector2(1, -1), 0.5) is v and v == Vector2(4.5, 5.5)
+        assert v.set(0, 1) is v and v == Vector2(0, 1)
+    
+    @staticmethod
+    def _traced_after(step, system, frames=5):
+        """Bytes allocated during ``frames`` steps that are still live, and the peak."""
+        step(system)  # warm-up
+        tracemalloc.start()
+        try:
+            tracemalloc.clear_traces()
+            for _ in range(frames):
+                step(system)
+            return tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    
+    def test_update_does_not_allocate(self):
+        system = ParticleSystem(PhysicsConfig(bounds_check=False), bounds=(0, 0, 100, 100))
+        for generator in (GravityForce(0.01), DragForce(0.02), WindForce(Vector2(0.1, 0)),
+                          TurbulenceForce(lambda x, y, t: 0.1)):
+            system.add_force_generator(generator)
+        for i in range(200):
+            system.spawn(create_rain_particle(i % 100, 10))
+        
+        def operator_step(s):
+            # Pre-in-place style: every update rebinds fresh Vector2s
+            for p in s.particles:
+                p.velocity = p.velocity + p.acceleration * 1.0
+                p.position = p.position + p.velocity * 1.0
+        
+        before, _ = self._traced_after(operator_step, system)
+        vectors = [(p.position, p.velocity) for p in system.particles]
+        after, peak = self._traced_after(lambda s: s.update(1.0), system)
+        
+        assert before > 200 * 2 * 40  # two fresh vectors per particle kept live
+        assert after < 200  # a stray float or two, nothing per particle
+        assert peak < 1024
+        assert all(p.position is position and p.velocity is velocity
+                   for p, (position, velocity) in zip(system.particles, vectors))
+
+
 class TestParticleSystem:
     """Test particle system."""
     
@@ -244,6 +800,873 @@ class TestParticleSystem:
         system.update(1.0)
         
         assert len(system.particles) == 0
+    
+    @pytest.mark.parametrize("fused", [True, False])
+    def test_cull_during_integration(self, fused):
+        """Expired particles are compacted out in place, survivors keep their order."""
+        config = PhysicsConfig(gravity=0.0, fused_forces=fused, substeps=3)
+        system = ParticleSystem(config, bounds=(0, 0, 100, 100))
+        system.add_force_generator(GravityForce(0.0))
+        specs = [(50, 50, 0, dict()), (104, 50, 2.0, dict()),   # crosses x_max + margin
+                 (10, 10, 0, dict(max_age=3)), (20, 20, 0, dict()),
+                 (-4.5, 30, 0, dict()), (30, 30, 0, dict(max_age=4))]
+        for x, y, vx, props in specs:
+            system.emit(x, y, vx, **props)
+        particles = system.particles
+        expected = [p for p in particles if p.max_age != 3 and p.position.x < 100]
+        
+        system.update(1.0)
+        
+        assert system.particles is particles
+        assert [id(p) for p in particles] == [id(p) for p in expected]
+        assert not any(p.is_expired(system.bounds) for p in particles)
+        assert system.pool.get_stats()['in_use'] == 4
+
+
+class TestFusedForceKernel:
+    """Test the compiled force kernel against per-generator dispatch."""
+    
+    class Push(ForceGenerator):
+        """Custom generator without fused source (generic fallback)."""
+        def apply(self, particle, dt):
+            particle.apply_impulse(Vector2(0.01, 0))
+            particle.apply_force(Vector2(0.02, -0.01))
+    
+    class Lift(ForceGenerator):
+        """Custom generator supplying its own fused source."""
+        def __init__(self, lift):
+            self.lift = lift
+        
+        def apply(self, particle, dt):
+            particle.apply_force(Vector2(0, -self.lift * particle.mass))
+        
+        def fused_source(self):
+            return FusedForce(setup="{v}l = {gen}.lift",
+                              body="fy += -{v}l * p.mass")
+    
+    def _system(self, fused, integration=IntegrationType.SEMI_IMPLICIT):
+        config = PhysicsConfig(integration=integration, substeps=2,
+                               max_velocity=3.0, fused_forces=fused)
+        system = ParticleSystem(config, bounds=(0, 0, 100, 50))
+        for generator in (GravityForce(0.5), DragForce(0.02), self.Push(), self.Lift(0.2),
+                          WindForce(Vector2(0.3, 0),
+                                    turbulence_func=lambda x, y: (0.1 * math.sin(x), 0.0)),
+                          TurbulenceForce(lambda x, y, t: math.sin(x + y + t))):
+            system.add_force_generator(generator)
+        for i in range(50):
+            system.spawn(create_rain_particle(i * 2.0, i % 7 * 5.0, wind_x=i % 3 - 1))
+        return system
+    
+    @pytest.mark.parametrize("integration", [IntegrationType.SEMI_IMPLICIT,
+                                             IntegrationType.VERLET])
+    def test_matches_generic_path(self, integration):
+        fused = self._system(True, integration)
+        generic = self._system(False, integration)
+        
+        for _ in range(20):
+            fused.update(1.0)
+            generic.update(1.0)
+        
+        state = lambda s: [(p.position, p.velocity, p.age) for p in s.particles]
+        assert len(fused.particles) > 0
+        assert state(fused) == state(generic)
+    
+    def test_recompiles_on_generator_change(self):
+        system = self._system(True)
+        kernel = system.force_kernel()
+        
+        assert system.force_kernel() is kernel
+        system.add_force_generator(GravityForce(0.1))
+        assert system.force_kernel() is not kernel
+        assert "_gen6.apply(p, dt)" not in system.force_kernel().source
+        assert "_gen2.apply(p, dt)" in system.force_kernel().source
+    
+    def test_parameters_read_each_step(self):
+        system = ParticleSystem(PhysicsConfig(), bounds=(0, 0, 100, 100))
+        gravity = GravityForce(0.0)
+        system.add_force_generator(gravity)
+        system.spawn(Particle(position=Vector2(50, 50)))
+        
+        system.update(1.0)
+        assert system.particles[0].velocity.y == 0
+        gravity.gravity = 1.0
+        system.update(1.0)
+        assert system.particles[0].velocity.y == 1.0
+    
+    def test_subclass_apply_override_not_inlined(self):
+        class Heavy(GravityForce):
+            def apply(self, particle, dt):
+                particle.apply_force(Vector2(0, 20 * self.gravity * particle.mass))
+        
+        velocities = []
+        for fused in (True, False):
+            system = ParticleSystem(PhysicsConfig(gravity=0.0, fused_forces=fused),
+                                    bounds=(0, 0, 100, 100))
+            system.add_force_generator(Heavy(0.5))
+            system.spawn(Particle(position=Vector2(50, 50)))
+            system.update(1.0)
+            velocities.append(system.particles[0].velocity.y)
+        
+        assert velocities == [10.0, 10.0]
+
+
+class TestRK4AndAdaptiveSubsteps:
+    """Test RK4 integration and CFL-bounded substep selection."""
+    
+    class Spring(ForceGenerator):
+        """Harmonic oscillator about the origin: F = -k·x."""
+        def __init__(self, k=1.0):
+            self.k = k
+        
+        def apply(self, particle, dt):
+            particle.apply_force(particle.position * -self.k)
+    
+    def _oscillate(self, integration, steps=100, dt=0.1):
+        config = PhysicsConfig(integration=integration, bounds_check=False, max_velocity=100)
+        system = ParticleSystem(config)
+        system.add_force_generator(self.Spring())
+        system.spawn(Particle(position=Vector2(1.0, 0.0)))
+        for _ in range(steps):
+            system.update(dt)
+        return abs(system.particles[0].position.x - math.cos(steps * dt))
+    
+    def test_rk4_accuracy(self):
+        """RK4 tracks x = cos(t) far better than first-order methods."""
+        rk4_error = self._oscillate(IntegrationType.RK4)
+        
+        assert rk4_error < 1e-4
+        assert rk4_error * 100 < self._oscillate(IntegrationType.SEMI_IMPLICIT)
+    
+    def test_rk4_exact_for_constant_force(self):
+        p = Particle(position=Vector2(0, 0), velocity=Vector2(1, 0))
+        p.apply_force(Vector2(0, 2))
+        p.integrate(0.5, IntegrationType.RK4)
+        
+        # x = v·t, y = ½·a·t²
+        assert p.position == Vector2(0.5, 0.25)
+        assert p.velocity == Vector2(1, 1)
+        assert p.age == 1
+    
+    def test_rk4_array_backend_matches(self):
+        config = PhysicsConfig(integration=IntegrationType.RK4, bounds_check=False,
+                               max_velocity=100)
+        systems = (ParticleSystem(config), ArrayParticleSystem(config))
+        for system in systems:
+            system.add_force_generator(GravityForce(0.5))
+            system.add_force_generator(DragForce(0.05))
+            system.spawn(Particle(position=Vector2(5, 5), velocity=Vector2(3, -1)))
+            for _ in range(10):
+                system.update(0.5)
+        
+        objects, arrays = (s.particles[0] for s in systems)
+        assert (objects.position, objects.velocity) == (arrays.position, arrays.velocity)
+    
+    def test_adaptive_substeps(self):
+        config = PhysicsConfig(adaptive_substeps=True, max_substeps=6, max_step_distance=0.5)
+        system = ParticleSystem(config, bounds=(0, 0, 100, 100))
+        
+        system.spawn(Particle(position=Vector2(50, 50), velocity=Vector2(0.1, 0)))
+        system.update(1.0)
+        assert system.get_stats()['substeps'] == 1  # calm drift: one step
+        
+        system.spawn(Particle(position=Vector2(50, 10), velocity=Vector2(0, 1.2)))
+        system.update(1.0)
+        assert system.last_substeps == 3  # ceil(1.2 / 0.5)
+        
+        system.spawn(Particle(position=Vector2(10, 10), velocity=Vector2(9, 0)))
+        system.update(1.0)
+        assert system.last_substeps == 6  # capped at max_substeps
+    
+    def test_fixed_substeps_by_default(self):
+        system = ArrayParticleSystem(PhysicsConfig(substeps=2))
+        system.spawn(Particle(velocity=Vector2(9, 0)))
+        system.update(1.0)
+        
+        assert system.last_substeps == 2
+
+
+class TestParticlePool:
+    """Test free-list particle recycling."""
+    
+    def test_spawn_resets_recycled_particle(self):
+        pool = ParticlePool(capacity=1)
+        p = pool.spawn(5, 6, 1, 0, mass=2.0, char='*', max_age=3)
+        p.age = 7
+        p.alive = False
+        p.apply_force(Vector2(1, 1))
+        pool.release(p)
+        
+        q = pool.spawn(1, 2)
+        
+        assert q is p
+        assert q.position == Vector2(1, 2) and q.prev_position == Vector2(1, 2)
+        assert q.velocity == Vector2(0, 0)
+        assert (q.mass, q.inverse_mass, q.char, q.age, q.max_age, q.alive) == (1.0, 1.0, '·', 0, -1, True)
+        assert pool.get_stats()['hits'] == 2
+    
+    def test_misses_and_high_water(self):
+        pool = ParticlePool(capacity=2)
+        particles = [pool.spawn(0, 0) for _ in range(3)]
+        for p in particles:
+            pool.release(p)
+        
+        stats = pool.get_stats()
+        assert (stats['hits'], stats['misses'], stats['high_water']) == (2, 1, 3)
+        assert stats['in_use'] == 0
+        assert stats['available'] == 2  # capacity bounds the free list
+    
+    def test_system_recycles_expired(self):
+        system = ParticleSystem(PhysicsConfig(), bounds=(0, 0, 100, 100),
+                                pool=ParticlePool(capacity=4))
+        first = [system.emit(10, 10, max_age=2) for _ in range(4)]
+        particles = system.particles
+        
+        system.update(1.0)
+        system.update(1.0)
+        assert system.particles == [] and system.particles is particles
+        
+        again = create_rain_particle(50, 50, pool=system.pool)
+        assert any(again is p for p in first)
+        assert again.char == '|' and again.age == 0
+        
+        stats = system.get_stats()
+        assert stats['pool_hits'] == 5
+        assert stats['pool_misses'] == 0
+        assert stats['pool_high_water'] == 4
+    
+    def test_caller_owned_particles_not_recycled(self):
+        system = ParticleSystem(PhysicsConfig(), bounds=(0, 0, 100, 100),
+                                pool=ParticlePool(capacity=4))
+        mine = Particle(Vector2(10, 10), max_age=1)
+        system.spawn(mine)
+        system.emit(20, 20, max_age=1)
+        system.update(1.0)
+        assert system.particles == []
+        assert system.pool.in_use == 0
+        
+        reused = [system.emit(30, 30) for _ in range(5)]
+        assert not any(p is mine for p in reused)
+        assert mine.position == Vector2(10, 10)
+        assert system.pool.in_use == 5
+        
+        system.clear()
+        system.pool.release(reused[0])  # already returned: ignored
+        assert system.pool.in_use == 0
+    
+    def test_array_system_emit(self):
+        system = ArrayParticleSystem(bounds=(0, 0, 100, 100))
+        view = system.emit(3, 4, 1, 0, char='+')
+        system.emit(5, 6)
+        
+        assert (view.position, view.char) == (Vector2(3, 4), '+')
+        assert system.get_stats()['pool_misses'] == 0
+
+
+class TestArrayParticleSystem:
+    """Test the structure-of-arrays particle backend."""
+    
+    @staticmethod
+    def _systems(integration):
+        config = PhysicsConfig(integration=integration, substeps=2, max_velocity=3.0)
+        systems = (ParticleSystem(config, bounds=(0, 0, 100, 50)),
+                   ArrayParticleSystem(config, bounds=(0, 0, 100, 50), capacity=4))
+        for system in systems:
+            system.add_force_generator(GravityForce(0.5))
+            system.add_force_generator(DragForce(0.02))
+            system.add_force_generator(WindForce(
+                Vector2(0.3, 0), turbulence_func=lambda x, y: (0.1 * math.sin(x), 0.0)))
+        return systems
+    
+    @staticmethod
+    def _state(system):
+        return sorted((p.position.x, p.position.y, p.velocity.x, p.velocity.y, p.age, p.char)
+                      for p in system.particles)
+    
+    @pytest.mark.parametrize("integration", [IntegrationType.SEMI_IMPLICIT,
+                                             IntegrationType.VERLET])
+    def test_matches_object_backend(self, integration):
+        """Same forces and integrator give bit-identical particles."""
+        objects, arrays = self._systems(integration)
+        
+        for frame in range(40):
+            for i in range(4):
+                factory = create_rain_particle if i % 2 else create_snow_particle
+                p = factory(frame * 2.5 % 100, i * 3.0, wind_x=i - 1.5)
+                objects.spawn(p)
+                arrays.spawn(p)
+            objects.update(1.0)
+            arrays.update(1.0)
+        
+        assert arrays.active_particle_count == objects.active_particle_count
+        assert self._state(arrays) == self._state(objects)
+    
+    def test_views_write_through(self):
+        system = ArrayParticleSystem(bounds=(0, 0, 100, 100))
+        system.spawn(Particle(position=Vector2(10, 10), char='*'))
+        
+        view = system.particles[0]
+        view.velocity = Vector2(2, 0)
+        view.char = '+'
+        system.update(1.0)
+        
+        p = system.particles[0]
+        assert p.position.x == 12
+        assert p.char == '+'
+        assert system.arrays.to_particle(0).velocity.x == 2
+    
+    def test_generic_generator_fallback(self):
+        """Generators without apply_batch run per particle through views."""
+        class Push(ForceGenerator):
+            def apply(self, particle, dt):
+                particle.apply_force(Vector2(particle.mass, 0))
+        
+        system = ArrayParticleSystem(bounds=(0, 0, 100, 100))
+        system.add_force_generator(Push())
+        system.spawn(Particle(position=Vector2(50, 50), mass=2.0))
+        system.update(1.0)
+        
+        assert system.particles[0].velocity.x == 1.0
+    
+    def test_spawn_many_and_removal(self):
+        system = ArrayParticleSystem(PhysicsConfig(bounds_check=True),
+                                     bounds=(0, 0, 100, 100), capacity=8)
+        positions = [(x, 50) for x in range(0, 200, 10)]
+        system.spawn_many(positions, template=Particle(max_age=3))
+        
+        assert system.arrays.capacity >= 20
+        system.update(1.0)
+        
+        # x > 105 is out of bounds
+        assert sorted(p.position.x for p in system.particles) == list(range(0, 110, 10))
+        
+        for _ in range(2):
+            system.update(1.0)
+        assert system.active_particle_count == 0
+        assert system.get_stats()['peak'] == 20
+
+
+class TestSpatialHash:
+    """Test the uniform-grid particle index."""
+    
+    def _points(self):
+        return [Particle(position=Vector2(x, y)) for x, y in
+                [(0.5, 0.5), (1.2, 0.9), (5.0, 5.0), (5.9, 5.1), (20.0, 3.0)]]
+    
+    def test_queries_match_brute_force(self):
+        particles = self._points()
+        grid = SpatialHash(cell_size=1.0)
+        grid.update(particles)
+        
+        assert len(grid) == 5
+        assert grid.count(5, 5) == 2 and grid.count(9, 9) == 0
+        assert grid.counts() == {(0, 0): 1, (1, 0): 1, (5, 5): 2, (20, 3): 1}
+        assert grid.in_cell(0, 0) == [particles[0]]
+        assert {id(p) for p in grid.in_row(5.7)} == {id(particles[2]), id(particles[3])}
+        assert {id(p) for p in grid.in_rect(0, 0, 2, 1)} == {id(particles[0]), id(particles[1])}
+        assert len(grid.in_rect(-math.inf, 3, math.inf, math.inf)) == 3
+        
+        for x, y, r in [(5.5, 5.0, 0.6), (0, 0, 2.0), (10, 4, 10.0), (3, 3, 0.1)]:
+            expected = {id(p) for p in particles
+                        if (p.position.x - x) ** 2 + (p.position.y - y) ** 2 <= r * r}
+            assert {id(p) for p in grid.near(x, y, r)} == expected
+    
+    def test_incremental_update(self):
+        particles = self._points()
+        grid = SpatialHash(cell_size=2.0)
+        grid.update(particles)
+        
+        particles[0].position.x = 0.9   # same cell
+        particles[2].position.x = 9.0   # new cell
+        gone = particles.pop()
+        grid.update(particles)
+        
+        assert grid.moves == 1
+        assert len(grid) == 4 and grid.in_rect(18, 0, 22, 6) == []
+        assert grid.counts() == {(0, 0): 2, (4, 2): 1, (2, 2): 1}
+        
+        grid.remove(particles[1])
+        grid.remove(gone)  # not present: no-op
+        assert grid.counts() == {(0, 0): 1, (4, 2): 1, (2, 2): 1}
+    
+    def test_system_keeps_hash_current(self):
+        system = ParticleSystem(PhysicsConfig(gravity=0.0, air_resistance=0.0),
+                                bounds=(0, 0, 20, 20), spatial_hash=SpatialHash())
+        system.add_force_generator(GravityForce(0.0))
+        fast = system.emit(2.5, 2.5, vx=1.0)
+        still = system.emit(10.5, 10.5)
+        doomed = system.emit(3.5, 3.5, max_age=1)
+        assert system.spatial_hash.count(3, 3) == 1
+        
+        system.update(1.0)
+        grid = system.spatial_hash
+        
+        assert grid.in_cell(3, 2) == [fast] and grid.in_cell(10, 10) == [still]
+        assert doomed not in grid.in_cell(3, 3)
+        assert grid.count(3, 3) == 0 and len(grid) == 2
+        
+        system.clear()
+        assert len(system.spatial_hash) == 0
+    
+    def test_array_system_hash(self):
+        system = ArrayParticleSystem(PhysicsConfig(gravity=0.0, air_resistance=0.0),
+                                     bounds=(0, 0, 20, 20), spatial_hash=SpatialHash())
+        system.spawn_many([(1.5, 1.5), (1.7, 1.2), (8.5, 4.5)])
+        system.update(1.0)
+        
+        assert system.spatial_hash.counts() == {(1, 1): 2, (8, 4): 1}
+        assert [p.position.x for p in system.spatial_hash.in_row(4.0)] == [8.5]
+
+
+class TestEmitter:
+    """Test rate-based batch emitters."""
+    
+    def test_fractional_rate_accumulates(self):
+        emitter = Emitter(rate=0.3)
+        counts = [emitter.due(1.0) for _ in range(10)]
+        
+        assert sum(counts) == 3 and max(counts) == 1
+        assert Emitter(rate=30.0).due(0.5) == 15
+    
+    def test_shapes(self):
+        line = Emitter(EmitterShape.LINE, origin=(10, 3), extent=(20, 0), seed=1)
+        rect = Emitter(EmitterShape.RECT, origin=(0, 2), extent=(5, 3), seed=1)
+        point = Emitter(origin=(4, 4))
+        
+        xy = line.positions(500)
+        assert xy.shape == (500, 2)
+        assert (xy[:, 1] == 3).all() and 10 <= xy[:, 0].min() and xy[:, 0].max() < 30
+        xy = rect.positions(500)
+        assert 0 <= xy[:, 0].min() and xy[:, 0].max() < 5
+        assert 2 <= xy[:, 1].min() and xy[:, 1].max() < 5
+        assert (point.positions(3) == 4).all()
+    
+    def test_distributions(self):
+        emitter = Emitter(velocity_x=0.5, velocity_y=(1.0, 2.0), seed=7,
+                          properties={'char': ['|', ':'], 'mass': [0.5, 2.0],
+                                      'colour': 4, 'max_age': lambda rng, n: rng.integers(5, 10, n)})
+        positions, velocities, props = emitter.sample(200)
+        
+        assert (velocities[:, 0] == 0.5).all()
+        assert 1.0 <= velocities[:, 1].min() and velocities[:, 1].max() < 2.0
+        assert set(props['char']) == {'|', ':'} and isinstance(props['char'], list)
+        assert set(props['mass'].tolist()) == {0.5, 2.0}
+        assert (props['colour'] == 4).all()
+        assert 5 <= props['max_age'].min() and props['max_age'].max() < 10
+        assert emitter.emitted == 200
+    
+    def test_seeded_batches_repeat(self):
+        def batch():
+            emitter = Emitter(EmitterShape.RECT, extent=(10, 10), velocity_x=(-1, 1), seed=3)
+            return emitter.sample(16)
+        
+        first, second = batch(), batch()
+        assert np.array_equal(first[0], second[0]) and np.array_equal(first[1], second[1])
+    
+    @pytest.mark.parametrize("system_type", [ParticleSystem, ArrayParticleSystem])
+    def test_emit_into_system(self, system_type):
+        system = system_type(PhysicsConfig(), bounds=(0, 0, 100, 100))
+        emitter = Emitter(EmitterShape.LINE, origin=(10, 0), extent=(50, 0), rate=2.5,
+                          velocity_y=(1.0, 2.0), seed=5,
+                          properties={'char': ['*'], 'mass': (0.5, 1.5), 'max_age': 9})
+        
+        assert emitter.emit(system, 1.0) == 2
+        assert emitter.emit(system, 1.0) == 3
+        
+        particles = system.particles
+        assert len(particles) == 5
+        for p in particles:
+            assert p.char == '*' and p.max_age == 9
+            assert 10 <= p.position.x < 60 and p.position.y == 0
+            assert p.inverse_mass == pytest.approx(1.0 / p.mass)
+            assert 0.5 <= p.mass < 1.5 and 1.0 <= p.velocity.y < 2.0
+    
+    def test_spawn_many_template_and_properties(self):
+        system = ParticleSystem(PhysicsConfig(), pool=ParticlePool(capacity=2))
+        spawned = system.spawn_many([(1, 2), (3, 4), (5, 6)], [(0, 1)] * 3,
+                                    template=Particle(char='+', drag_coefficient=0.1),
+                                    properties={'colour': [1, 2, 3]})
+        
+        assert [p.colour for p in spawned] == [1, 2, 3]
+        assert all(p.char == '+' and p.drag_coefficient == 0.1 for p in spawned)
+        assert spawned[2].position == Vector2(5, 6) and spawned[2].velocity == Vector2(0, 1)
+        assert system.pool.get_stats()['misses'] == 1
+    
+    @pytest.mark.parametrize("backend", [ParticleSystem, ArrayParticleSystem])
+    def test_spawn_many_template_velocity(self, backend):
+        system = backend(PhysicsConfig(), bounds=(0, 0, 100, 100))
+        template = Particle(velocity=Vector2(1, 2), char='+')
+        
+        system.spawn_many([(1, 2), (3, 4)], template=template)
+        
+        assert [p.velocity.as_tuple() for p in system.particles] == [(1.0, 2.0)] * 2
+        assert all(p.char == '+' for p in system.particles)
+
+
+class TestFixedTimestep:
+    """Test the fixed-step accumulator and render interpolation."""
+    
+    def test_steps_and_alpha(self):
+        clock = FixedTimestep(hz=10.0)
+        
+        assert clock.advance(0.05) == 0 and clock.alpha == pytest.approx(0.5)
+        assert clock.advance(0.26) == 3 and clock.alpha == pytest.approx(0.1)
+        assert clock.steps == 3
+    
+    def test_slow_frame_is_capped(self):
+        clock = FixedTimestep(hz=10.0, max_steps=4)
+        
+        assert clock.advance(1.05) == 4
+        assert clock.dropped == pytest.approx(0.6)
+        assert clock.alpha == pytest.approx(0.5)
+    
+    def test_tick_and_until_next(self):
+        clock = FixedTimestep(hz=20.0)
+        
+        assert clock.tick(now=100.0) == 0
+        assert clock.tick(now=100.12) == 2
+        assert clock.until_next(now=100.12) == pytest.approx(0.03)
+        assert clock.until_next(now=100.2) == 0.0
+    
+    def test_simulation_speed_independent_of_frame_rate(self):
+        def run(frame_time, frames):
+            system = ParticleSystem(PhysicsConfig(bounds_check=False))
+            system.add_force_generator(GravityForce(0.1))
+            system.emit(0, 0)
+            clock = FixedTimestep(hz=30.0, dt=1.0)
+            for _ in range(frames):
+                system.advance(clock, frame_time)
+            return system.particles[0].position.y, system.frame_count
+        
+        # One simulated second rendered at 60, 30 and 15 FPS
+        results = [run(1 / 60, 60), run(1 / 30, 30), run(1 / 15, 15)]
+        assert {frames for _, frames in results} == {30}
+        assert results[0][0] == results[1][0] == results[2][0]
+    
+    @pytest.mark.parametrize("system_type", [ParticleSystem, ArrayParticleSystem])
+    def test_interpolated_positions(self, system_type):
+        system = system_type(PhysicsConfig(gravity=0.0, interpolate=True))
+        system.add_force_generator(GravityForce(0.0))
+        system.emit(10, 10, vx=2.0, vy=-1.0)
+        
+        assert [tuple(p) for p in system.interpolated_positions(0.5)] == [(10.0, 10.0)]
+        system.update(1.0)
+        
+        assert [tuple(p) for p in system.interpolated_positions(0.0)] == [(10.0, 10.0)]
+        assert [tuple(p) for p in system.interpolated_positions(0.5)] == [(11.0, 9.5)]
+        assert [tuple(p) for p in system.interpolated_positions(1.0)] == [(12.0, 9.0)]
+
+
+class TestParallelParticleSystem:
+    """Test the band-parallel shared-memory backend."""
+    
+    BOUNDS = (0, 0, 90, 30)
+    
+    def _scene(self, system):
+        system.add_force_generator(GravityForce(0.3))
+        system.add_force_generator(DragForce(0.05))
+        system.add_force_generator(WindForce(Vector2(2.0, 0.0)))
+        rng = np.random.default_rng(11)
+        positions = rng.random((600, 2)) * (90, 30)
+        velocities = rng.normal(0.0, 2.0, (600, 2))
+        system.spawn_many(positions, velocities, template=create_rain_particle(0, 0),
+                          properties={'colour': rng.integers(0, 8, 600)})
+        return system
+    
+    @staticmethod
+    def _state(arrays_list):
+        rows = np.concatenate([np.column_stack([a.position[:a.count], a.velocity[:a.count],
+                                                a.colour[:a.count], a.age[:a.count]])
+                               for a in arrays_list])
+        return rows[np.lexsort(rows.T[::-1])]
+    
+    @pytest.mark.parametrize("min_parallel", [0, 10 ** 9])
+    def test_matches_array_backend(self, min_parallel):
+        config = PhysicsConfig(parallel_workers=3, substeps=2)
+        reference = self._scene(ArrayParticleSystem(config, self.BOUNDS))
+        
+        with self._scene(ParallelParticleSystem(config, self.BOUNDS, capacity=64,
+                                                min_parallel=min_parallel)) as system:
+            for _ in range(5):
+                reference.update(1.0)
+                system.update(1.0)
+            
+            assert system.parallel_updates == (5 if min_parallel == 0 else 0)
+            assert system.active_particle_count == reference.active_particle_count
+            assert np.array_equal(self._state(system.band_arrays), self._state([reference.arrays]))
+            
+            # Every particle sits in the band covering its x
+            for i, band in enumerate(system.band_arrays):
+                assert (system.band_of(band.position[:band.count, 0]) == i).all()
+    
+    def test_migration_and_routing(self):
+        config = PhysicsConfig(gravity=0.0, parallel_workers=2, bounds_check=False)
+        with ParallelParticleSystem(config, (0, 0, 100, 10)) as system:
+            system.add_force_generator(GravityForce(0.0))
+            system.spawn_many([(10, 5), (49, 5), (90, 5)], [(0, 0), (2, 0), (0, 0)],
+                              properties={'char': ['a', 'b', 'c']})
+            
+            assert system.get_stats()['bands'] == [2, 1]
+            system.update(1.0)
+            
+            assert system.migrated == 1
+            assert system.get_stats()['bands'] == [1, 2]
+            assert sorted(p.char for p in system.band_arrays[1].views()) == ['b', 'c']
+            assert system.interpolated_positions(1.0).shape == (3, 2)
+    
+    def test_shared_arrays_grow_and_close(self):
+        arrays = SharedParticleArrays(capacity=2)
+        first = arrays.shm.name
+        for x in range(5):
+            arrays.append(Particle(position=Vector2(x, 0)))
+        name = arrays.shm.name
+        
+        attached = ParticleArrays.on_buffer(arrays.shm.buf, arrays.capacity, arrays.count)
+        assert arrays.capacity >= 5
+        assert attached.position[:5, 0].tolist() == [0, 1, 2, 3, 4]
+        del attached
+        
+        arrays.close()
+        from multiprocessing import shared_memory
+        for freed in (first, name):
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=freed)
+    
+    def test_unclosed_system_frees_shared_memory(self):
+        import gc
+        from multiprocessing import shared_memory
+        system = ParallelParticleSystem(PhysicsConfig(parallel_workers=2), (0, 0, 10, 10))
+        system.spawn_many([(1, 1), (8, 1)])
+        names = [band.shm.name for band in system.band_arrays]
+        
+        del system
+        gc.collect()
+        
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+    
+    def test_factory_opt_in(self):
+        assert type(create_particle_system(PhysicsConfig())) is ParticleSystem
+        
+        system = create_particle_system(PhysicsConfig(parallel_workers=2), (0, 0, 10, 10))
+        try:
+            assert isinstance(system, ParallelParticleSystem) and len(system.band_arrays) == 2
+        finally:
+            system.close()
+
+
+class TestSimulationRunner:
+    """Test the threaded simulation runner and its snapshot buffers."""
+    
+    class Counter:
+        def __init__(self):
+            self.value = 0
+            self.bonus = 0
+        
+        def step(self, dt):
+            self.value += 1
+        
+        def snapshot(self):
+            return (self.value, self.bonus)
+    
+    @staticmethod
+    def _wait_for(condition, timeout=2.0):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            assert time.perf_counter() < deadline, "timed out"
+            time.sleep(0.002)
+    
+    def test_publishes_snapshots(self):
+        world = self.Counter()
+        with SimulationRunner(world.step, world.snapshot, hz=200.0) as runner:
+            first = runner.latest()
+            assert first.state == (0, 0) and first.step == 0
+            
+            self._wait_for(lambda: runner.latest().step >= 3)
+            frame = runner.latest()
+            
+            # The state is the copy taken at publication, not the live value
+            assert frame.state[0] == frame.step
+            assert 0.0 <= runner.alpha(frame) <= 1.0
+            assert runner.alpha(frame, now=frame.published + 1.0) == 1.0
+            with pytest.raises(AttributeError):
+                frame.state = None
+        
+        assert not runner.running
+        assert runner.published == runner.steps + 1
+    
+    def test_post_and_latency(self):
+        world = self.Counter()
+        latency = InputLatency()
+        with SimulationRunner(world.step, world.snapshot, hz=200.0) as runner:
+            posted_at = time.perf_counter()
+            runner.post(lambda: setattr(world, 'bonus', 1), now=posted_at)
+            assert runner.presented(runner.latest()) == []
+            
+            self._wait_for(lambda: runner.latest().state[1] == 1)
+            frame = runner.latest()
+            latency.presented(runner.presented(frame))
+            
+            assert runner.presented(frame) == []
+        
+        assert latency.total_inputs == 1
+        assert latency.latencies[0] > 0
+    
+    def test_paused_holds_worker(self):
+        world = self.Counter()
+        with SimulationRunner(world.step, world.snapshot, hz=500.0) as runner:
+            self._wait_for(lambda: world.value > 0)
+            with runner.paused():
+                held = world.value
+                time.sleep(0.03)
+                assert world.value == held
+            self._wait_for(lambda: world.value > held)
+    
+    def test_worker_error_reraised(self):
+        def explode(dt):
+            raise RuntimeError("boom")
+        
+        runner = SimulationRunner(explode, lambda: None, hz=500.0).start()
+        try:
+            self._wait_for(lambda: runner.error is not None)
+            with pytest.raises(RuntimeError, match="boom"):
+                runner.latest()
+        finally:
+            runner.stop()
+
+
+class TestHeightfield:
+    """Test the ground accumulation heightfield."""
+    
+    def test_deposit_batches_and_clamps(self):
+        ground = Heightfield(5, x0=10, max_height=2.0, amount=0.5)
+        captured = ground.deposit([10.2, 10.9, 12.5, 12.5, 12.5, 12.5, 12.5, 9.0, 15.0])
+        
+        assert captured == 7  # 9.0 and 15.0 are off the strip
+        assert ground.heights.tolist() == [1.0, 0.0, 2.0, 0.0, 0.0]
+        assert ground.impacts == 9
+        
+        wrapped = Heightfield(5, x0=10, wrap=True)
+        wrapped.deposit([9.0, 15.0], amounts=np.array([1.0, 2.0]))
+        assert wrapped.heights.tolist() == [2.0, 0.0, 0.0, 0.0, 1.0]
+    
+    def test_capture_probability(self):
+        ground = Heightfield(1, max_height=1e9, capture=0.25, seed=3)
+        captured = ground.deposit(np.zeros(4000))
+        
+        assert 900 < captured < 1100
+        assert ground.heights[0] == captured
+    
+    def test_evaporation_and_melt(self):
+        ground = Heightfield(4, evaporation=1.0, evaporation_amount=0.25, melt=0.5)
+        ground.heights[:] = [0.5, 1.0, 2.0, 0.0]
+        ground.step()
+        
+        assert ground.heights.tolist() == [0.0, 0.25, 1.25, 0.0]
+        
+        # No evaporation configured: no RNG draw, no change
+        still = Heightfield(4)
+        still.heights[:] = 1.0
+        still.step()
+        assert still.heights.tolist() == [1.0] * 4
+    
+    @pytest.mark.parametrize("wrap", [False, True])
+    def test_avalanche_conserves_and_relaxes(self, wrap):
+        ground = Heightfield(9, max_height=100, repose=1.0, wrap=wrap)
+        ground.heights[4] = 12.0
+        
+        ground.avalanche(iterations=200)
+        
+        assert ground.heights.sum() == pytest.approx(12.0)
+        assert (ground.heights >= 0).all()
+        slopes = np.abs(np.diff(ground.heights))
+        assert slopes.max() <= 1.0 + 1e-6
+        assert ground.heights[4] == ground.heights.max()
+    
+    def test_rendering(self):
+        ground = Heightfield(6, base_y=20, max_height=10)
+        ground.heights[:] = [0, 1.5, 3, 9, 0, 2]
+        
+        assert ground.glyph_row(PUDDLE_GLYPHS) == " ~∿≋ ≈"
+        assert ground.stacked_rows("#")[:3] == [" ### #", "  ## #", "  ##  "]
+        assert Heightfield.runs(ground.glyph_row()) == [(1, "░▓█"), (5, "▒")]
+        assert ground.surface_y([0.5, 3.2, 7.0]).tolist() == [20, 11, 20]
+
+
+class TestCollisionSurfaces:
+    """Test ground collision events from the integration pass."""
+    
+    BOUNDS = (0, 0, 40, 30)
+    
+    def _ground(self):
+        ground = Heightfield(40, base_y=25, max_height=10)
+        ground.heights[10:20] = 4.0
+        return ground
+    
+    def _scene(self, system):
+        rng = np.random.default_rng(5)
+        positions = rng.random((300, 2)) * (40, 26)
+        velocities = np.column_stack([rng.normal(0.0, 0.5, 300), rng.uniform(0.5, 3.0, 300)])
+        system.spawn_many(positions, velocities, template=create_rain_particle(0, 0))
+        system.add_surface(self._ground())
+        return system
+    
+    @pytest.mark.parametrize("fused", [True, False])
+    def test_object_path_reports_and_removes_hits(self, fused):
+        system = ParticleSystem(PhysicsConfig(fused_forces=fused), bounds=self.BOUNDS)
+        system.add_surface(FlatGround(10))
+        for y, vy in ((9.5, 1.0), (5.0, 0.0), (9.8, 0.5)):
+            system.emit(3.0, y, 0.0, vy)
+        available = system.pool.available
+        
+        system.update(1.0)
+        events = system.collisions
+        
+        assert isinstance(events, CollisionEvents)
+        assert events.index.tolist() == [0, 2]
+        assert events.x.tolist() == [3.0, 3.0]
+        assert events.velocity.tolist() == [[0.0, 1.0], [0.0, 0.5]]
+        assert [p.position.y for p in system.particles] == [5.0]
+        assert system.pool.available == available + 2  # hits go back to the pool
+        
+        system.update(1.0)
+        assert len(system.collisions) == 0
+    
+    @pytest.mark.parametrize("backend", [ArrayParticleSystem, ParallelParticleSystem])
+    def test_array_backends_match_object_path(self, backend):
+        config = PhysicsConfig(parallel_workers=2)
+        reference = self._scene(ParticleSystem(config, self.BOUNDS))
+        system = self._scene(backend(config, self.BOUNDS))
+        try:
+            for _ in range(3):
+                reference.update(1.0)
+                system.update(1.0)
+                
+                expected = np.column_stack([reference.collisions.x, reference.collisions.velocity])
+                actual = np.column_stack([system.collisions.x, system.collisions.velocity])
+                assert len(expected) > 0
+                np.testing.assert_allclose(actual[np.lexsort(actual.T[::-1])],
+                                           expected[np.lexsort(expected.T[::-1])])
+                assert system.active_particle_count == reference.active_particle_count
+            # Event indices are rows of ``particles`` before the update
+            assert (system.collisions.index < 300).all()
+        finally:
+            if backend is ParallelParticleSystem:
+                system.close()
+    
+    def test_surfaces(self):
+        ground = self._ground()
+        xs = [0.5, 12.0, 19.99, 39.5]
+        
+        assert isinstance(ground, CollisionSurface)
+        assert [ground.landing_y(x) for x in xs] == ground.surface_y(xs).tolist() == [25, 21, 21, 25]
+        
+        # Several surfaces: the highest at each x wins
+        system = ParticleSystem(bounds=self.BOUNDS)
+        system.add_surface(ground)
+        system.add_surface(FlatGround(23))
+        landing_y = system.landing_func()
+        assert [landing_y(x) for x in xs] == [23, 21, 21, 23]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -398,6 +1821,33 @@ class TestRenderStats:
         assert 'avg_particles' in report
 
 
+class TestInputLatency:
+    """Test input-to-frame latency tracking."""
+    
+    def test_pending_inputs_resolve_on_present(self):
+        latency = InputLatency()
+        latency.input(timestamp=1.0)
+        latency.input(timestamp=1.5)
+        latency.presented(now=2.0)
+        latency.presented([1.9], now=2.0)
+        
+        assert latency.latencies == pytest.approx([1.0, 0.5, 0.1])
+        assert latency.pending == []
+        
+        report = latency.get_report()
+        assert report['inputs'] == 3
+        assert report['max_ms'] == 1000.0
+        assert report['avg_ms'] == pytest.approx(533.33, abs=0.01)
+    
+    def test_window_trims_oldest(self):
+        latency = InputLatency(sample_window=4)
+        for i in range(10):
+            latency.presented([float(i)], now=10.0)
+        
+        assert latency.total_inputs == 10
+        assert latency.latencies == [4.0, 3.0, 2.0, 1.0]
+
+
 class TestFrameBudget:
     """Test frame budgeting."""
     
@@ -433,6 +1883,87 @@ class TestFrameBudget:
             budget.adjust_quality(50)  # 50ms >> 16ms
         
         assert budget.quality_level < initial_quality
+    
+    def test_extra_work_counts_against_budget(self):
+        """Time spent outside the frame (simulation steps) lowers quality too."""
+        budget = FrameBudget(target_fps=60)
+        
+        for _ in range(20):
+            budget.begin_frame()
+            frame_time = budget.end_frame(extra_ms=50)
+        
+        assert frame_time < 50
+        assert budget.quality_level < 1.0
+
+
+class TestNoiseStep:
+    """Test quality-driven noise resolution selection."""
+    
+    def test_step_follows_quality(self):
+        budget = FrameBudget(target_fps=30)
+        
+        assert budget.noise_step() == 1
+        budget.quality_level = 0.6
+        assert budget.noise_step() == 2
+        budget.quality_level = 0.3
+        assert budget.noise_step() == 4
+
+
+class TestParticleBudget:
+    """Test quality-driven particle budgets."""
+    
+    def test_decisions_follow_quality(self):
+        frame_budget = FrameBudget(target_fps=30)
+        budget = ParticleBudget(frame_budget, max_particles=1000, max_octaves=5)
+        
+        assert budget.update().get_report() == {
+            'quality': 1.0, 'live': 0, 'particle_limit': 1000, 'spawn_scale': 1.0,
+            'trail_length': 3, 'octaves': 5, 'noise_step': 1, 'thinned': 0}
+        
+        frame_budget.quality_level = 0.6
+        budget.update()
+        assert (budget.particle_limit, budget.spawn_scale, budget.trail_length,
+                budget.octaves, budget.noise_step) == (600, 0.6, 1, 3, 2)
+        
+        frame_budget.quality_level = 0.3
+        budget.update()
+        assert (budget.particle_limit, budget.trail_length, budget.octaves,
+                budget.noise_step) == (300, 0, 2, 4)
+    
+    def test_thinning_is_uniform_and_gradual(self):
+        frame_budget = FrameBudget(target_fps=30)
+        budget = ParticleBudget(frame_budget, max_particles=10000, thin_rate=0.1, seed=4)
+        frame_budget.quality_level = 0.3
+        budget.update()
+        old, new = list(range(6000)), list(range(6000, 10000))
+        
+        removed_old, removed_new = budget.thin(old, new)
+        
+        # At most thin_rate of the live particles per call, from both lists alike
+        assert budget.thinned == len(removed_old) + len(removed_new)
+        assert 900 < budget.thinned < 1100
+        assert len(removed_old) / 6000 == pytest.approx(len(removed_new) / 4000, abs=0.02)
+        assert old == sorted(set(range(6000)) - set(removed_old))
+        
+        for _ in range(30):
+            budget.thin(old, new)
+        assert len(old) + len(new) <= 3000
+        assert budget.thin(old, new) == [[], []]
+    
+    def test_debug_overlay_shows_decisions(self):
+        screen = Mock(width=80, height=24)
+        engine = RenderEngine(screen)
+        engine.stats.record_frame(0.02, 10)
+        engine.particle_budget.live = 42
+        
+        engine.draw_debug_overlay()
+        
+        rows = {}
+        for cmd in engine.queue.get_sorted():
+            rows.setdefault(cmd.y, []).append(cmd.char)
+        text = ["".join(chars) for _, chars in sorted(rows.items())]
+        assert "Budget: 42/2000" in text
+        assert "Octaves: 4" in text
 
 
 class TestRenderQueue:
@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from asciimatics.screen import Screen
 from lib.particles import Particle, ParticleSystem
+from engine.physics.particles import FlatGround
 
 
 # Rain characters - different intensities
@@ -22,6 +23,7 @@ def rain_demo(screen):
     """Main rain animation loop."""
     system = ParticleSystem(gravity=0.05, wind=0.02, drag=0.01)
     splashes = ParticleSystem(gravity=0.02, drag=0.1)
+    system.surfaces.append(FlatGround(screen.height - 2))
     
     intensity = 3  # Drops per frame
     
@@ -47,24 +49,22 @@ def rain_demo(screen):
             )
             system.spawn(drop)
         
-        # Check for splashes (drops hitting bottom)
-        for p in system.particles:
-            if p.y >= screen.height - 2:
-                # Create splash particles
-                for _ in range(random.randint(1, 3)):
-                    splash = Particle(
-                        x=p.x,
-                        y=screen.height - 1,
-                        vx=random.uniform(-0.5, 0.5),
-                        vy=random.uniform(-0.3, -0.1),
-                        char=random.choice(SPLASH_CHARS),
-                        colour=Screen.COLOUR_WHITE,
-                        max_age=random.randint(5, 15)
-                    )
-                    splashes.spawn(splash)
-        
         # Update physics
         system.update(screen.width, screen.height)
+        
+        # Splash where drops hit the bottom this frame
+        for _, x, _, _ in system.collisions:
+            for _ in range(random.randint(1, 3)):
+                splash = Particle(
+                    x=x,
+                    y=screen.height - 1,
+                    vx=random.uniform(-0.5, 0.5),
+                    vy=random.uniform(-0.3, -0.1),
+                    char=random.choice(SPLASH_CHARS),
+                    colour=Screen.COLOUR_WHITE,
+                    max_age=random.randint(5, 15)
+                )
+                splashes.spawn(splash)
         splashes.update(screen.width, screen.height)
         
         # Clear and draw
@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from asciimatics.screen import Screen
 from lib.particles import Particle, ParticleSystem
+from engine.physics.ground import Heightfield
 
 
 # Snowflake characters
@@ -39,7 +40,10 @@ def snow_demo(screen):
     
     intensity = 2
     wind_strength = 0.0
-    accumulation = [0] * screen.width  # Snow pile height at each x
+    # Snow pile height at each x: 2% of landing flakes stick, steep piles slump
+    ground = Heightfield(screen.width, base_y=screen.height - 1,
+                         max_height=screen.height // 3, capture=0.02,
+                         repose=1.0, wrap=True)
     
     while True:
         ev = screen.get_key()
@@ -54,7 +58,7 @@ def snow_demo(screen):
         if ev == Screen.KEY_RIGHT:
             wind_strength = min(wind_strength + 0.02, 0.2)
         if ev == ord("r") or ev == ord("R"):
-            accumulation = [0] * screen.width  # Reset snow
+            ground.reset()  # Reset snow
         
         system.wind = wind_strength
         
@@ -75,29 +79,32 @@ def snow_demo(screen):
             system.spawn(flake)
         
         # Check for accumulation
-        new_particles = []
-        for p in system.particles:
-            ground_level = screen.height - 1 - accumulation[int(p.x) % screen.width]
+        cover = ground.levels().tolist()
+        flakes = system.particles
+        landed = []
+        kept = 0
+        for p in flakes:
+            ground_level = screen.height - 1 - cover[int(p.x) % screen.width]
             if p.y >= ground_level:
-                # Accumulate snow (slowly)
-                if random.random() < 0.02:  # 2% chance to add to pile
-                    idx = int(p.x) % screen.width
-                    accumulation[idx] = min(accumulation[idx] + 1, screen.height // 3)
+                landed.append(p.x)  # Accumulates slowly (see capture)
             elif p.is_alive(screen.width, screen.height):
                 p.update(system.gravity, system.wind, system.drag)
-                new_particles.append(p)
+                flakes[kept] = p
+                kept += 1
+        del flakes[kept:]
         
-        system.particles = new_particles
+        if landed:
+            ground.deposit(landed)
+        ground.step()
         
         # Clear and draw
         screen.clear_buffer(Screen.COLOUR_BLACK, Screen.A_NORMAL, Screen.COLOUR_BLACK)
         
         # Draw accumulated snow
-        for x in range(screen.width):
-            pile_height = accumulation[x]
-            for y in range(pile_height):
-                screen.print_at("█", x, screen.height - 1 - y, 
-                              colour=Screen.COLOUR_WHITE)
+        for depth, row in enumerate(ground.stacked_rows()):
+            for x, text in Heightfield.runs(row):
+                screen.print_at(text, x, screen.height - 1 - depth,
+                                colour=Screen.COLOUR_WHITE)
         
         # Draw falling snow
         for p in system.particles:
@@ -15,6 +15,7 @@ import random
 import math
 import time
 import json
+import copy
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -24,26 +25,38 @@ from asciimatics.exceptions import ResizeScreenError
 from lib.weather_api import get_weather, WeatherCondition, WeatherData, search_and_fetch_weather
 from lib.particles import Particle, ParticleSystem
 from collections import deque
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, NamedTuple
+
+import numpy as np
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🧠 PROFESSIONAL WEATHER ENGINE - Modular Architecture
 # ═══════════════════════════════════════════════════════════════════════════════
-from engine.physics.noise import PerlinNoise as EnginePerlinNoise, FractalNoise, SimplexNoise, DomainWarp
+from engine.physics.noise import (
+    PerlinNoise as EnginePerlinNoise, FractalNoise, SimplexNoise, DomainWarp,
+    ScrollingFieldCache, CurlNoiseField, VectorField
+)
 from engine.physics.particles import (
     Vector2, Particle as EngineParticle, ParticleSystem as EngineParticleSystem,
-    PhysicsConfig, GravityForce, DragForce, WindForce, IntegrationType
+    PhysicsConfig, GravityForce, DragForce, WindForce, IntegrationType, ParticlePool,
+    Emitter, EmitterShape, SpatialHash
 )
 from engine.physics.atmosphere import (
     AtmosphericModel, AtmosphericState, StabilityClass,
     calculate_wind_chill, calculate_heat_index
 )
-from engine.rendering.core import RenderStats, FrameBudget, RenderQueue, RenderCommand, RenderLayer
+from engine.physics.ground import Heightfield, PUDDLE_GLYPHS, DRIFT_GLYPHS
+from engine.physics.simulation import SimulationRunner
+from engine.rendering.core import (
+    RenderStats, FrameBudget, ParticleBudget, RenderQueue, RenderCommand, RenderLayer,
+    InputLatency
+)
 from engine.personality.core import PersonalityEngine, Mood, PersonalityConfig
 
 # Global performance monitoring
 _render_stats = RenderStats()
 _frame_budget = FrameBudget(target_fps=30)
+_input_latency = InputLatency()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -55,6 +68,9 @@ GRAVITY = 0.5
 AIR_RESISTANCE = 0.02
 TURBULENCE_SCALE = 0.15
 WIND_GUST_FREQUENCY = 0.01
+PHYSICS_HZ = 30.0  # Fixed simulation steps per second (one update() each)
+RENDER_FPS = 30.0  # Render/input loop rate when physics runs on its own thread
+MAX_PARTICLES = 3000  # Live particle cap at full quality (ParticleBudget)
 
 
 class PerlinNoise:
@@ -74,6 +90,7 @@ class PerlinNoise:
         self.perm = list(range(256))
         random.shuffle(self.perm)
         self.perm += self.perm
+        self._perm_array = np.array(self.perm, dtype=np.intp)
     
     @staticmethod
     def fade(t: float) -> float:
@@ -116,26 +133,88 @@ class PerlinNoise:
             amplitude *= persistence
             frequency *= lacunarity
         return total / max_value
+    
+    def noise_array(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized noise() over coordinate arrays (same values as the scalar path)."""
+        perm = self._perm_array
+        x0, y0 = np.trunc(x), np.trunc(y)
+        xi = x0.astype(np.intp) & 255
+        yi = y0.astype(np.intp) & 255
+        xf, yf = x - x0, y - y0
+        u, v = self.fade(xf), self.fade(yf)
+        
+        aa = perm[perm[xi] + yi]
+        ab = perm[perm[xi] + yi + 1]
+        ba = perm[perm[xi + 1] + yi]
+        bb = perm[perm[xi + 1] + yi + 1]
+        
+        x1 = self.lerp(u, self._grad_array(aa, xf, yf), self._grad_array(ba, xf - 1, yf))
+        x2 = self.lerp(u, self._grad_array(ab, xf, yf - 1), self._grad_array(bb, xf - 1, yf - 1))
+        return self.lerp(v, x1, x2)
+    
+    @staticmethod
+    def _grad_array(hash_val: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        h = hash_val & 3
+        u = np.where(h < 2, x, y)
+        v = np.where(h < 2, y, x)
+        return np.where(h & 1, -u, u) + np.where(h & 2, -v, v)
+    
+    def octave_noise_array(self, x: np.ndarray, y: np.ndarray, octaves: int = 4,
+                           persistence: float = 0.5, lacunarity: float = 2.0) -> np.ndarray:
+        """Vectorized octave_noise() - one array pass per octave."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        total, frequency, amplitude, max_value = 0, 1, 1, 0
+        for _ in range(octaves):
+            total = total + self.noise_array(x * frequency, y * frequency) * amplitude
+            max_value += amplitude
+            amplitude *= persistence
+            frequency *= lacunarity
+        return total / max_value
 
 
 class TurbulenceField:
     """
-    Dynamic atmospheric turbulence using Perlin noise.
+    Dynamic atmospheric turbulence using curl noise.
     "Wind doesn't just blow in a straight line. It swirls, it eddies,
     it makes your umbrella useless. This simulates that chaos." - Stormy
     """
     
-    def __init__(self, seed: int = None):
-        self.noise = PerlinNoise(seed)
+    def __init__(self, seed: int = None,
+                 bounds: Optional[Tuple[float, float, float, float]] = None,
+                 cell_size: float = 2.0):
+        # Divergence-free swirl: both components from one analytic-gradient
+        # pass; strength matches the old two-field octave noise magnitude
+        self.curl = CurlNoiseField(
+            EnginePerlinNoise(seed=seed or int(time.time())),
+            octaves=3, scale=0.02, strength=TURBULENCE_SCALE * 0.2
+        )
         self.time_offset = 0
+        
+        # With bounds, the field is evaluated once per frame on a coarse grid
+        # and particles read it bilinearly (cost ∝ screen cells, not particles)
+        self.grid = None
+        if bounds is not None:
+            self.grid = VectorField(self.curl.velocity_array, bounds, cell_size)
+            self.grid.update(self.time_offset)
     
     def update(self):
         self.time_offset += 0.01
+        if self.grid is not None:
+            self.grid.update(self.time_offset)
     
     def get_turbulence(self, x: float, y: float) -> Tuple[float, float]:
-        tx = self.noise.octave_noise(x * 0.02 + self.time_offset, y * 0.02, octaves=3)
-        ty = self.noise.octave_noise(x * 0.02, y * 0.02 + self.time_offset + 100, octaves=3)
-        return tx * TURBULENCE_SCALE, ty * TURBULENCE_SCALE
+        if self.grid is not None:
+            return self.grid.sample(x, y)
+        return self.curl.velocity(x, y, self.time_offset)
+    
+    def get_turbulence_many(self, xs: List[float], ys: List[float]) -> Tuple[List[float], List[float]]:
+        """Turbulence for a whole particle batch in one vectorized pass."""
+        if self.grid is not None:
+            tx, ty = self.grid.sample_array(xs, ys)
+        else:
+            tx, ty = self.curl.velocity_array(xs, ys, self.time_offset)
+        return tx.tolist(), ty.tolist()
 
 
 class WindGustSystem:
@@ -258,18 +337,26 @@ class PhysicsParticle:
     def __init__(self, x: float, y: float, char: str, colour: int,
                  vx: float = 0, vy: float = 0, mass: float = 1.0,
                  lifetime: int = -1, buoyancy: float = 0):
+        self.trail: deque = deque(maxlen=3)
+        self.reset(x, y, char, colour, vx, vy, mass, lifetime, buoyancy)
+    
+    def reset(self, x: float, y: float, char: str, colour: int,
+              vx: float = 0, vy: float = 0, mass: float = 1.0,
+              lifetime: int = -1, buoyancy: float = 0):
+        """Re-initialize in place so a ParticlePool can recycle this particle."""
         self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y
         self.vx, self.vy = vx, vy
         self.char, self.colour = char, colour
         self.mass = mass
         self.lifetime = lifetime
         self.age = 0
         self.buoyancy = buoyancy
-        self.trail: deque = deque(maxlen=3)
-        self.collided = False
+        self.trail.clear()
     
     def update(self, wind_x: float, wind_y: float, turb_x: float, turb_y: float):
         self.trail.append((int(self.x), int(self.y)))
+        self.prev_x, self.prev_y = self.x, self.y
         
         # Wind and turbulence
         self.vx += wind_x + turb_x
@@ -1494,6 +1581,11 @@ class EasterEggManager:
             self.frame_timer = 0
             self.creature_frame = (self.creature_frame + 1) % len(self.active_creature["frames"])
         
+        # Row is picked once, here, so snapshot copies all draw it in place
+        if not hasattr(self, '_y'):
+            frame = self.active_creature["frames"][self.creature_frame]
+            self._y = random.randint(6, self.height - len(frame) - 4)
+        
         # Remove if off screen
         if self.creature_x > self.ax + self.aw - 5:
             self.active_creature = None
@@ -1534,6 +1626,27 @@ class EasterEggManager:
 # 🌦️ DASHBOARD CLASS  
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class SceneFrame(NamedTuple):
+    """
+    Immutable copy of the simulated state the dashboard draws, so the
+    render loop can draw one while the physics thread steps the next.
+    """
+    frame: int
+    cloud_time: float
+    flash_intensity: float
+    lightning_active: bool
+    drops: tuple       # (prev_x, prev_y, x, y, char, colour, trail) per visible physics particle
+    drifters: tuple    # (x, y, char, colour) per drifting particle
+    bolts: tuple       # LightningBolt copies (segments are never mutated)
+    easter_eggs: 'EasterEggManager'
+    ground: str        # accumulation glyph per column (Heightfield.glyph_row)
+    octaves: int       # cloud noise octave cap (ParticleBudget)
+    noise_step: int    # cloud warp grid step (ParticleBudget)
+    budget: tuple      # ParticleBudget.overlay_lines() for the debug overlay
+    comment: str
+    achievement_display_timer: int
+
+
 class WeatherDashboard:
     """The main Stormy weather dashboard."""
     
@@ -1579,8 +1692,10 @@ class WeatherDashboard:
         self.quip_mode = False
         
         # 🧠 ADVANCED PHYSICS SYSTEMS - "The brain behind the beauty"
-        # Initialize turbulence field for realistic wind patterns
-        self.turbulence = TurbulenceField()
+        # Initialize turbulence field for realistic wind patterns, sampled
+        # per frame over the animation area
+        self.turbulence = TurbulenceField(
+            bounds=(self.animation_start_x, 0, self.width, self.height))
         
         # Wind gust system with base wind from actual weather
         wind_rad = math.radians(self.weather.wind_direction)
@@ -1633,7 +1748,8 @@ class WeatherDashboard:
             gravity=GRAVITY,
             air_resistance=AIR_RESISTANCE,
             integration=IntegrationType.SEMI_IMPLICIT,
-            max_velocity=10.0
+            max_velocity=10.0,
+            adaptive_substeps=True  # Drift scenes: 1 step; storms: as many as stability needs
         )
         self.engine_particle_system = EngineParticleSystem(
             self.engine_physics_config,
@@ -1652,20 +1768,43 @@ class WeatherDashboard:
         # ═══════════════════════════════════════════════════════════════════
         self.render_stats = _render_stats
         self.frame_budget = _frame_budget
+        self.input_latency = _input_latency
         self.render_queue = RenderQueue()  # Layered rendering queue
         # Advanced noise generators for organic effects
         self.simplex_noise = SimplexNoise(seed=int(time.time()))
         self.domain_warp = DomainWarp(FractalNoise(), warp_strength=4.0)  # For warped cloud shapes
+        # Particle cap, spawn rate, trail length and cloud octaves follow
+        # the frame budget's quality level; 'd' shows the current decisions
+        self.particle_budget = ParticleBudget(
+            self.frame_budget, max_particles=MAX_PARTICLES,
+            max_octaves=self.domain_warp.noise.config.octaves)
+        self.show_debug = False
+        # Cloud band scrolls with cloud_time: cache it, evaluating only newly exposed columns
+        self.cloud_cache = ScrollingFieldCache(self._cloud_field, column_step=0.15)
+        self.cloud_step = 1  # warp evaluated every Nth cell (FrameBudget.noise_step)
+        self.cloud_octaves = 3  # detail octaves (capped by ParticleBudget.octaves)
         
         # Advanced lightning bolts (branching fractals)
         self.lightning_bolts: List[LightningBolt] = []
         self.flash_intensity = 0
         
-        # Physics-based particles (separate from simple particle system)
+        # Physics-based particles (separate from simple particle system),
+        # recycled through a free list instead of reallocated every spawn
         self.physics_particles: List[PhysicsParticle] = []
-        
-        # Ground accumulation (rain puddles / snow drifts)
-        self.ground_accumulation = [0] * self.animation_width
+        self.physics_particle_pool = ParticlePool(
+            capacity=256, factory=lambda: PhysicsParticle(0, 0, ".", 0))
+        # Terminal-cell index of the drops, refiled incrementally each step;
+        # snapshots copy only the drops inside the animation area
+        self.drop_index = SpatialHash(position=lambda p: (p.x, p.y))
+        
+        # Ground accumulation (rain puddles / snow drifts): half a cell per
+        # landing drop, occasional evaporation, and drifts that slump
+        is_snow = weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        self.ground = Heightfield(
+            self.animation_width, x0=self.animation_start_x, base_y=self.height - 3,
+            max_height=5, amount=0.5, evaporation=0.005, evaporation_amount=0.1,
+            repose=1.0 if is_snow else None, wrap=True)
+        self.ground_glyphs = DRIFT_GLYPHS if is_snow else PUDDLE_GLYPHS
         
         # Easter egg creatures - rare supernatural visitors!
         self.easter_eggs = EasterEggManager(
@@ -1758,10 +1897,41 @@ class WeatherDashboard:
             self.particle_chars = [".", "'"]
             self.particle_colour = Theme.MUTED
             self.spawn_rate = 1
+        
+        # Emitters: one batch (one RNG draw per attribute) per frame
+        snowing = c in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW)
+        chars = list(self.particle_chars) or ["."]
+        left, right = self.animation_start_x + 2, self.width - 3
+        
+        # Physics precipitation along the top edge; same average rate as
+        # spawn_rate // 2 every other frame, carried fractionally
+        self.precip_emitter = Emitter(
+            EmitterShape.LINE, origin=(left, 3), extent=(right - left, 0),
+            rate=(self.spawn_rate // 2) / 2,
+            velocity_x=(-0.2, 0.2) if snowing else (-0.3, 0.3),
+            velocity_y=(0.1, 0.4) if snowing else (1.0, 2.5),
+            properties={'char': chars})
+        
+        # Drifting particles: wisps enter from the left edge, everything
+        # else falls from a band under the top
+        if c in (WeatherCondition.CLOUDY, WeatherCondition.PARTLY_CLOUDY,
+                 WeatherCondition.CLEAR, WeatherCondition.FOG):
+            self.drift_emitter = Emitter(
+                EmitterShape.LINE, origin=(left, 4), extent=(0, self.height - 10),
+                rate=self.spawn_rate, velocity_x=(0.3, 0.8), velocity_y=(-0.05, 0.05),
+                properties={'char': chars})
+        else:
+            wind = self.particles.wind * 3
+            self.drift_emitter = Emitter(
+                EmitterShape.RECT, origin=(left, 2), extent=(right - left, 3),
+                rate=self.spawn_rate, velocity_x=(wind - 0.15, wind + 0.15),
+                velocity_y=(0.4, 1.4),
+                properties={'char': chars, '_drift': (0, 6.28)} if snowing else {'char': chars})
 
     def update(self):
         """Update animation state with advanced physics."""
         self.frame += 1
+        budget = self.particle_budget.update()
         
         # ═══════════════════════════════════════════════════════════════════
         # 🧠 UPDATE ADVANCED PHYSICS SYSTEMS
@@ -1776,28 +1946,36 @@ class WeatherDashboard:
         # ═══════════════════════════════════════════════════════════════════
         # ⚛️ UPDATE ENGINE PARTICLE SYSTEM (engine.physics.particles)
         # ═══════════════════════════════════════════════════════════════════
-        self.frame_budget.begin_frame()
         self.engine_particle_system.update(1.0)  # Uses Vector2, forces, integrators
-        frame_ms = self.frame_budget.end_frame()
-        self.render_stats.record_frame(frame_ms / 1000.0, self.engine_particle_system.active_particle_count)
         
         # Update legacy physics particles (kept for compatibility)
-        for p in self.physics_particles:
-            turb_x, turb_y = self.turbulence.get_turbulence(p.x, p.y)
+        turb_xs, turb_ys = self.turbulence.get_turbulence_many(
+            [p.x for p in self.physics_particles],
+            [p.y for p in self.physics_particles]
+        )
+        # Expired particles, and drops reaching the ground line, are removed
+        # (in place, back to the pool) in the same pass that moves them;
+        # landings are deposited as one batch
+        particles = self.physics_particles
+        release = self.physics_particle_pool.release
+        ground_y = self.ground.base_y
+        landed = []
+        kept = 0
+        for p, turb_x, turb_y in zip(particles, turb_xs, turb_ys):
             p.update(wind_x, wind_y, turb_x, turb_y)
             
             # Ground accumulation for rain/snow
-            if p.y >= self.height - 3 and not p.collided:
-                idx = int(p.x - self.animation_start_x) % self.animation_width
-                if 0 <= idx < len(self.ground_accumulation):
-                    self.ground_accumulation[idx] = min(5, self.ground_accumulation[idx] + 0.5)
-                    p.collided = True
-        
-        # Remove expired physics particles
-        self.physics_particles = [
-            p for p in self.physics_particles 
-            if not p.is_expired(self.width, self.height)
-        ]
+            if p.y >= ground_y:
+                landed.append(p.x)
+                release(p)
+            elif p.is_expired(self.width, self.height):
+                release(p)
+            else:
+                particles[kept] = p
+                kept += 1
+        del particles[kept:]
+        if landed:
+            self.ground.deposit(landed)
         
         # Update lightning bolts (branching fractals)
         for bolt in self.lightning_bolts:
@@ -1808,10 +1986,8 @@ class WeatherDashboard:
         if self.flash_intensity > 0:
             self.flash_intensity *= 0.7
         
-        # Ground accumulation evaporation
-        for i in range(len(self.ground_accumulation)):
-            if random.random() < 0.005:
-                self.ground_accumulation[i] = max(0, self.ground_accumulation[i] - 0.1)
+        # Ground accumulation evaporation (and drift settling for snow)
+        self.ground.step()
         
         # ═══════════════════════════════════════════════════════════════════
         # STORMY'S PERSONALITY UPDATES
@@ -1841,53 +2017,37 @@ class WeatherDashboard:
         )
         
         # Spawn physics-based particles for precipitation
-        if is_precipitation and self.frame % 2 == 0:
-            for _ in range(self.spawn_rate // 2):
-                x = random.uniform(self.animation_start_x + 2, self.width - 3)
-                char = random.choice(self.particle_chars) if self.particle_chars else "."
-                
-                if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
-                    # Light, floaty snow
-                    p = PhysicsParticle(x, 3, char, Theme.SNOW,
-                                       vx=random.uniform(-0.2, 0.2),
-                                       vy=random.uniform(0.1, 0.4),
-                                       mass=0.2, buoyancy=0.3)
-                else:
-                    # Heavier rain
-                    p = PhysicsParticle(x, 3, char, Theme.FROST,
-                                       vx=random.uniform(-0.3, 0.3),
-                                       vy=random.uniform(1.0, 2.5),
-                                       mass=0.6)
-                self.physics_particles.append(p)
+        # (one frame at the budgeted rate)
+        count = self.precip_emitter.due(budget.spawn_scale) if is_precipitation else 0
+        if count:
+            positions, velocities, properties = self.precip_emitter.sample(count)
+            if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
+                colour, mass, buoyancy = Theme.SNOW, 0.2, 0.3   # Light, floaty snow
+            else:
+                colour, mass, buoyancy = Theme.FROST, 0.6, 0    # Heavier rain
+            spawn = self.physics_particle_pool.spawn
+            for (x, y), (vx, vy), char in zip(positions.tolist(), velocities.tolist(),
+                                              properties['char']):
+                self.physics_particles.append(
+                    spawn(x, y, char, colour, vx=vx, vy=vy, mass=mass, buoyancy=buoyancy))
         
         # Regular particles for drifting effects
-        for _ in range(self.spawn_rate):
-            if self.particle_chars:
-                if is_drifter:
-                    p = Particle(
-                        x=self.animation_start_x + 2,
-                        y=random.uniform(4, self.height - 6),
-                        vx=random.uniform(0.3, 0.8),
-                        vy=random.uniform(-0.05, 0.05),
-                        char=random.choice(self.particle_chars),
-                        colour=self.particle_colour
-                    )
-                    p._horiz = True
-                else:
-                    p = Particle(
-                        x=random.uniform(self.animation_start_x + 2, self.width - 3),
-                        y=random.uniform(2, 5),
-                        vx=self.particles.wind * 3 + random.uniform(-0.15, 0.15),
-                        vy=random.uniform(0.4, 1.4),
-                        char=random.choice(self.particle_chars),
-                        colour=self.particle_colour
-                    )
-                    p._horiz = False
-                    if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
-                        p._drift = random.uniform(0, 6.28)
+        count = self.drift_emitter.due(budget.spawn_scale) if self.particle_chars else 0
+        if count:
+            positions, velocities, properties = self.drift_emitter.sample(count)
+            drifts = properties['_drift'].tolist() if '_drift' in properties else None
+            for i, ((x, y), (vx, vy), char) in enumerate(zip(
+                    positions.tolist(), velocities.tolist(), properties['char'])):
+                p = Particle(x=x, y=y, vx=vx, vy=vy, char=char, colour=self.particle_colour)
+                p._horiz = is_drifter
+                if drifts is not None:
+                    p._drift = drifts[i]
                 self.particles.spawn(p)
         
-        for p in self.particles.particles:
+        # Move and clip in one pass, compacting the list in place
+        drifting = self.particles.particles
+        kept = 0
+        for p in drifting:
             if hasattr(p, '_drift'):
                 p.x += 0.3 * math.sin(p.age * 0.07 + p._drift)
             if getattr(p, '_horiz', False):
@@ -1896,11 +2056,16 @@ class WeatherDashboard:
                 p.age += 1
             else:
                 p.update(self.particles.gravity, self.particles.wind, 0)
+            if 3 <= p.y < self.height - 2 and self.animation_start_x < p.x < self.width - 1:
+                drifting[kept] = p
+                kept += 1
+        del drifting[kept:]
         
-        self.particles.particles = [
-            p for p in self.particles.particles
-            if 3 <= p.y < self.height - 2 and self.animation_start_x < p.x < self.width - 1
-        ]
+        # Over the cap: thin both populations uniformly at random
+        thinned, _ = budget.thin(self.physics_particles, drifting)
+        for p in thinned:
+            self.physics_particle_pool.release(p)
+        self.drop_index.update(self.physics_particles)
         
         # ═══════════════════════════════════════════════════════════════════
         # 🌩️ ADVANCED LIGHTNING SYSTEM (Branching fractals)
@@ -1929,19 +2094,51 @@ class WeatherDashboard:
         self.easter_eggs.try_spawn(self.weather.condition, hour)
         self.easter_eggs.update()
 
-    def draw(self):
-        """Draw the dashboard with layer-timed rendering."""
+    def snapshot(self) -> SceneFrame:
+        """Copy the state ``draw`` reads; safe to hand to another thread."""
+        budget = self.particle_budget
+        trail = budget.trail_length
+        ax, aw = self.animation_start_x, self.animation_width
+        visible = self.drop_index.in_rect(ax + 1, 2, ax + aw - 1, self.height - 2)
+        return SceneFrame(
+            frame=self.frame,
+            cloud_time=self.cloud_time,
+            flash_intensity=self.flash_intensity,
+            lightning_active=self.lightning_active,
+            drops=tuple((p.prev_x, p.prev_y, p.x, p.y, p.char, p.colour,
+                         tuple(p.trail)[-trail:] if trail else ())
+                        for p in visible),
+            drifters=tuple((p.x, p.y, p.char, p.colour) for p in self.particles.particles),
+            bolts=tuple(copy.copy(bolt) for bolt in self.lightning_bolts),
+            easter_eggs=copy.copy(self.easter_eggs),
+            ground=self.ground.glyph_row(self.ground_glyphs),
+            octaves=budget.octaves,
+            noise_step=budget.noise_step,
+            budget=tuple(budget.overlay_lines()),
+            comment=self.current_comment,
+            achievement_display_timer=self.achievement_display_timer,
+        )
+    
+    def draw(self, alpha: float = 1.0, scene: Optional[SceneFrame] = None):
+        """
+        Draw the dashboard with layer-timed rendering. ``alpha`` places
+        moving particles between their previous and current physics step;
+        ``scene`` is a published snapshot (default: the live state).
+        """
         import time as _time
         
+        if scene is None:
+            scene = self.snapshot()
+        
         # Clear render queue for this frame
         self.render_queue.clear()
         
         # Background flash based on lightning intensity
-        if self.flash_intensity > 0.7:
+        if scene.flash_intensity > 0.7:
             bg = Screen.COLOUR_WHITE
-        elif self.flash_intensity > 0.3:
+        elif scene.flash_intensity > 0.3:
             bg = Theme.SUN
-        elif self.lightning_active:
+        elif scene.lightning_active:
             bg = Theme.SUN
         else:
             bg = Screen.COLOUR_BLACK
@@ -1949,12 +2146,12 @@ class WeatherDashboard:
         
         # Layer 1: UI Background (sidebar)
         _t0 = _time.perf_counter()
-        self._draw_sidebar()
+        self._draw_sidebar(scene.comment)
         self.render_stats.record_layer("sidebar", _time.perf_counter() - _t0)
         
         # Layer 2: Animation (particles, weather, etc)
         _t0 = _time.perf_counter()
-        self._draw_animation()
+        self._draw_animation(scene, alpha)
         self.render_stats.record_layer("animation", _time.perf_counter() - _t0)
         
         # Layer 3: UI Foreground (footer)
@@ -1963,7 +2160,7 @@ class WeatherDashboard:
         self.render_stats.record_layer("footer", _time.perf_counter() - _t0)
         
         # Achievement popup
-        if self.achievement_display_timer > 0 and self.new_achievements:
+        if scene.achievement_display_timer > 0 and self.new_achievements:
             self._draw_achievement_popup()
     
     def _draw_box(self, x: int, y: int, w: int, h: int, title: str = "", colour=Theme.FROST):
@@ -1979,7 +2176,7 @@ class WeatherDashboard:
             tx = x + (w - len(t)) // 2
             self.screen.print_at(t, tx, y, colour=Theme.SUN)
     
-    def _draw_sidebar(self):
+    def _draw_sidebar(self, comment: str):
         """Draw the info sidebar."""
         sw = self.sidebar_width
         
@@ -2075,7 +2272,6 @@ class WeatherDashboard:
         y += 1
         
         # Snarky comment (wrapped)
-        comment = self.current_comment
         words = comment.split()
         lines = []
         current_line = ""
@@ -2121,7 +2317,7 @@ class WeatherDashboard:
         self.screen.print_at(f"  {now}", 1, self.height - 3, colour=Theme.SNOW)
         self.screen.print_at(f"  {achievements_count} achievements | {streak} day streak", 1, self.height - 2, colour=Theme.SUN)
     
-    def _draw_animation(self):
+    def _draw_animation(self, scene: SceneFrame, alpha: float = 1.0):
         """Draw the animation area with advanced physics visualization."""
         ax = self.animation_start_x
         aw = self.animation_width
@@ -2140,53 +2336,50 @@ class WeatherDashboard:
             WeatherCondition.FOG
         ):
             cloud_chars = ["█", "▓", "▒", "░"]
-            for y in range(2, 6):
-                for x in range(ax + 2, ax + aw - 2):
-                    # Use domain warping for more organic cloud shapes
-                    # Domain warp samples create swirling, flowing cloud patterns
-                    base_x = (x - ax) * 0.15 + self.cloud_time
-                    base_y = y * 0.3
-                    
-                    # Add warped displacement for organic feel
-                    warp_offset = self.domain_warp.sample(base_x * 0.5, base_y * 0.5) * 0.5
-                    
-                    noise_val = self.cloud_noise.octave_noise(
-                        base_x + warp_offset,
-                        base_y + warp_offset * 0.3,
-                        octaves=3
-                    )
-                    
-                    # Threshold based on weather intensity
-                    threshold = -0.3 if self.weather.condition in (
-                        WeatherCondition.THUNDERSTORM, WeatherCondition.HEAVY_RAIN
-                    ) else 0.0
-                    
+            
+            # Threshold based on weather intensity
+            threshold = -0.3 if self.weather.condition in (
+                WeatherCondition.THUNDERSTORM, WeatherCondition.HEAVY_RAIN
+            ) else 0.0
+            
+            # Flash colour during lightning
+            if scene.flash_intensity > 0.5:
+                colour = Screen.COLOUR_WHITE
+            elif scene.lightning_active:
+                colour = Theme.SUN
+            else:
+                colour = Theme.MUTED if self.weather.condition == WeatherCondition.THUNDERSTORM else Screen.COLOUR_WHITE
+            
+            # Cloud band from the scroll cache (only newly exposed columns are sampled)
+            xs = list(range(ax + 2, ax + aw - 2))
+            ys = list(range(2, 6))
+            self.domain_warp.noise.max_octaves = scene.octaves
+            self.cloud_step = scene.noise_step
+            self.cloud_octaves = min(3, scene.octaves)
+            noise_vals = self.cloud_cache.get(
+                scene.cloud_time, len(xs), [y * 0.3 for y in ys],
+                key=(self.weather.condition, self.domain_warp.noise.max_octaves, self.cloud_step)
+            )
+            
+            for row, y in enumerate(ys):
+                for col, noise_val in enumerate(noise_vals[row].tolist()):
                     if noise_val > threshold:
                         char_idx = min(3, max(0, int((noise_val + 0.5) * 3)))
-                        char = cloud_chars[char_idx]
-                        
-                        # Flash colour during lightning
-                        if self.flash_intensity > 0.5:
-                            colour = Screen.COLOUR_WHITE
-                        elif self.lightning_active:
-                            colour = Theme.SUN
-                        else:
-                            colour = Theme.MUTED if self.weather.condition == WeatherCondition.THUNDERSTORM else Screen.COLOUR_WHITE
-                        
-                        self.screen.print_at(char, x, y, colour=colour)
+                        self.screen.print_at(cloud_chars[char_idx], xs[col], y, colour=colour)
         
         # ═══════════════════════════════════════════════════════════════════
         # 🌧️ PHYSICS-BASED PARTICLES (with trails)
         # ═══════════════════════════════════════════════════════════════════
-        for p in self.physics_particles:
+        for prev_x, prev_y, x, y, char, p_colour, trail in scene.drops:
             try:
-                px, py = int(p.x), int(p.y)
+                px = int(prev_x + (x - prev_x) * alpha)
+                py = int(prev_y + (y - prev_y) * alpha)
                 if ax + 1 <= px < ax + aw - 1 and 2 <= py < self.height - 2:
-                    colour = Theme.SUN if self.lightning_active and random.random() > 0.3 else p.colour
-                    self.screen.print_at(p.char, px, py, colour=colour)
+                    colour = Theme.SUN if scene.lightning_active and random.random() > 0.3 else p_colour
+                    self.screen.print_at(char, px, py, colour=colour)
                     
                     # Draw faint trail for motion blur effect
-                    for i, (tx, ty) in enumerate(p.trail):
+                    for i, (tx, ty) in enumerate(trail):
                         if ax + 1 <= tx < ax + aw - 1 and 2 <= ty < self.height - 2:
                             trail_colour = Screen.COLOUR_BLUE if i == 0 else Screen.COLOUR_BLACK
                             self.screen.print_at("·", tx, ty, colour=trail_colour)
@@ -2194,53 +2387,76 @@ class WeatherDashboard:
                 pass
         
         # Regular particles (for drifting effects)
-        for p in self.particles.particles:
+        for x, y, char, p_colour in scene.drifters:
             try:
-                px, py = int(p.x), int(p.y)
+                px, py = int(x), int(y)
                 if ax + 1 <= px < ax + aw - 1 and 2 <= py < self.height - 2:
-                    colour = Theme.SUN if self.lightning_active and random.random() > 0.3 else p.colour
-                    self.screen.print_at(p.char, px, py, colour=colour)
+                    colour = Theme.SUN if scene.lightning_active and random.random() > 0.3 else p_colour
+                    self.screen.print_at(char, px, py, colour=colour)
             except:
                 pass
         
         # ═══════════════════════════════════════════════════════════════════
         # ⚡ BRANCHING LIGHTNING (Fractal pathfinding)
         # ═══════════════════════════════════════════════════════════════════
-        for bolt in self.lightning_bolts:
+        for bolt in scene.bolts:
             bolt.draw(self.screen, ax)
         
         # Old lightning fallback
-        if self.lightning_active and not self.lightning_bolts:
+        if scene.lightning_active and not scene.bolts:
             self._draw_lightning()
         
         # Easter egg creatures (rare visitors!)
-        self.easter_eggs.draw(self.screen, self.lightning_active)
+        scene.easter_eggs.draw(self.screen, scene.lightning_active)
         
         # ═══════════════════════════════════════════════════════════════════
         # 🌊 GROUND ACCUMULATION (Puddles / Snow drifts)
         # ═══════════════════════════════════════════════════════════════════
-        ground_char = "▓" if self.lightning_active else "▒"
-        for i, x in enumerate(range(ax + 1, ax + aw - 1)):
-            self.screen.print_at(ground_char, x, self.height - 2, colour=Theme.MUTED)
-            
-            # Show accumulation
-            if i < len(self.ground_accumulation):
-                level = int(self.ground_accumulation[i])
-                if level > 0:
-                    if self.weather.condition in (WeatherCondition.SNOW, WeatherCondition.HEAVY_SNOW):
-                        # Snow drifts
-                        acc_chars = ["·", "░", "▒", "▓", "█"]
-                        acc_char = acc_chars[min(level, 4)]
-                        self.screen.print_at(acc_char, x, self.height - 3, colour=Theme.SNOW)
-                    else:
-                        # Rain puddles
-                        acc_chars = ["·", "~", "≈", "∿", "≋"]
-                        acc_char = acc_chars[min(level, 4)]
-                        self.screen.print_at(acc_char, x, self.height - 3, colour=Theme.FROST)
+        ground_char = "▓" if scene.lightning_active else "▒"
+        self.screen.print_at(ground_char * (aw - 2), ax + 1, self.height - 2, colour=Theme.MUTED)
+        
+        # Show accumulation, one print per run of glyphs
+        colour = Theme.SNOW if self.ground_glyphs is DRIFT_GLYPHS else Theme.FROST
+        for col, text in Heightfield.runs(scene.ground[:aw - 2]):
+            self.screen.print_at(text, ax + 1 + col, self.height - 3, colour=colour)
         
         # Location label in animation area
         loc = f"{self.weather.location}"
         self.screen.print_at(loc[:aw-4], ax + 3, self.height - 4, colour=Theme.SNOW)
+        
+        if self.show_debug:
+            self._draw_debug_overlay(scene)
+    
+    def _draw_debug_overlay(self, scene: SceneFrame):
+        """Frame budget, input latency and the particle budget's decisions, top right."""
+        report = self.render_stats.get_report()
+        latency = self.input_latency.get_report()
+        lines = [
+            f"Frame: {report['avg_ms']:.1f}ms",
+            f"Input: {latency['avg_ms']:.0f}ms (p95 {latency['p95_ms']:.0f})",
+            f"Quality: {self.frame_budget.quality_level:.0%}",
+            *scene.budget,
+        ]
+        width = max(len(line) for line in lines)
+        x = self.animation_start_x + self.animation_width - width - 2
+        for i, line in enumerate(lines):
+            self.screen.print_at(line.ljust(width), x, 1 + i, colour=Theme.MUTED)
+    
+    def _cloud_field(self, base_x: np.ndarray, base_y: np.ndarray) -> np.ndarray:
+        """Batched cloud density: domain warp for swirling shapes, octave noise for detail."""
+        # Add warped displacement for organic feel (octaves finer than the
+        # evaluated cells are skipped; under load only every cloud_step-th
+        # cell is evaluated and the rest upsampled)
+        step = self.cloud_step
+        footprint = self.cloud_cache.column_step * 0.5 * step
+        warp_offset = self.domain_warp.sample_grid(
+            base_x[0] * 0.5, base_y[:, 0] * 0.5, step=step, footprint=footprint
+        ) * 0.5
+        return self.cloud_noise.octave_noise_array(
+            base_x + warp_offset,
+            base_y + warp_offset * 0.3,
+            octaves=self.cloud_octaves
+        )
     
     def _draw_lightning(self):
         """Draw lightning bolt."""
@@ -2282,7 +2498,7 @@ class WeatherDashboard:
     
     def _draw_footer(self):
         """Draw footer bar."""
-        footer = " [S]earch Location | [R]efresh | [A]chievements | [Q]uit "
+        footer = " [S]earch Location | [R]efresh | [A]chievements | [D]ebug | [Q]uit "
         fx = max(0, (self.width - len(footer)) // 2)
         
         # Background bar
@@ -2495,54 +2711,89 @@ def dashboard_main(screen: Screen):
     
     dashboard = WeatherDashboard(screen, weather)
     last_fetch = time.time()
-    
-    while True:
-        ev = screen.get_key()
-        
-        if ev in (ord('q'), ord('Q'), Screen.KEY_ESCAPE):
-            return
-        
-        if ev in (ord('r'), ord('R')):
-            weather = get_weather(use_cache=False)
-            if weather:
-                dashboard = WeatherDashboard(screen, weather)
-                last_fetch = time.time()
-        
-        if ev in (ord('a'), ord('A')):
-            draw_achievements_screen(screen, dashboard.stormy)
-            # Redraw dashboard after returning
-            dashboard.draw()
-        
-        if ev in (ord('f'), ord('F')):
-            try:
-                from weather_live import weather_live
-                weather_live(screen)
-            except:
-                pass
-            dashboard = WeatherDashboard(screen, weather)
-        
-        # Location search - press S or / to search any city
-        if ev in (ord('s'), ord('S'), ord('/')):
-            new_weather = location_search_screen(screen)
-            if new_weather:
-                weather = new_weather
-                dashboard = WeatherDashboard(screen, weather)
-                last_fetch = time.time()
-        
-        # Auto-refresh every 5 minutes
-        if time.time() - last_fetch > 300:
-            new_weather = get_weather(use_cache=False)
-            if new_weather:
-                weather = new_weather
+    frame_interval = 1.0 / RENDER_FPS
+    
+    # Physics runs on its own thread at a fixed rate and publishes
+    # snapshots; this loop only polls input and draws the latest one, so
+    # a slow physics step no longer holds up key handling (and vice versa)
+    def simulate(dashboard: WeatherDashboard) -> SimulationRunner:
+        return SimulationRunner(lambda dt: dashboard.update(), dashboard.snapshot,
+                                hz=PHYSICS_HZ).start()
+    
+    runner, simulated = simulate(dashboard), dashboard
+    debug = False
+    try:
+        while True:
+            frame_start = time.perf_counter()
+            ev = screen.get_key()
+            if ev is not None:
+                _input_latency.input(frame_start)
+            
+            if ev in (ord('q'), ord('Q'), Screen.KEY_ESCAPE):
+                return
+            
+            if ev in (ord('r'), ord('R')):
+                weather = get_weather(use_cache=False)
+                if weather:
+                    dashboard = WeatherDashboard(screen, weather)
+                    last_fetch = time.time()
+            
+            if ev in (ord('d'), ord('D')):
+                debug = not debug
+            
+            if ev in (ord('a'), ord('A')):
+                with runner.paused():
+                    draw_achievements_screen(screen, dashboard.stormy)
+                    # Redraw dashboard after returning
+                    dashboard.draw()
+            
+            if ev in (ord('f'), ord('F')):
+                runner.stop()
+                try:
+                    from weather_live import weather_live
+                    weather_live(screen)
+                except:
+                    pass
                 dashboard = WeatherDashboard(screen, weather)
-                last_fetch = time.time()
-        
-        dashboard.update()
-        dashboard.draw()
-        screen.refresh()
-        
-        time.sleep(0.033)
-
+            
+            # Location search - press S or / to search any city
+            if ev in (ord('s'), ord('S'), ord('/')):
+                with runner.paused():
+                    new_weather = location_search_screen(screen)
+                if new_weather:
+                    weather = new_weather
+                    dashboard = WeatherDashboard(screen, weather)
+                    last_fetch = time.time()
+            
+            # Auto-refresh every 5 minutes
+            if time.time() - last_fetch > 300:
+                new_weather = get_weather(use_cache=False)
+                if new_weather:
+                    weather = new_weather
+                    dashboard = WeatherDashboard(screen, weather)
+                    last_fetch = time.time()
+            
+            # A rebuilt dashboard gets its own simulation thread
+            if dashboard is not simulated:
+                runner.stop()
+                runner, simulated = simulate(dashboard), dashboard
+            
+            # Draw the latest snapshot, interpolated into the step in progress;
+            # its cost plus the simulation step's drives the quality level
+            # the particle budget follows
+            _frame_budget.begin_frame()
+            frame = runner.latest()
+            dashboard.show_debug = debug
+            dashboard.draw(runner.alpha(frame), frame.state)
+            screen.refresh()
+            frame_ms = _frame_budget.end_frame(runner.step_time * 1000)
+            _render_stats.record_frame(frame_ms / 1000.0,
+                                       len(frame.state.drops) + len(frame.state.drifters))
+            _input_latency.presented(runner.presented(frame))
+            
+            time.sleep(max(0.0, frame_interval - (time.perf_counter() - frame_start)))
+    finally:
+        runner.stop()
 
 def main():
     print("\033[2J\033[H")
@@ -11,11 +11,15 @@ import math
 import time
 from datetime import datetime
 
+import numpy as np
 from asciimatics.screen import Screen
 from asciimatics.exceptions import ResizeScreenError
 
 from lib.weather_api import get_weather, WeatherCondition, WeatherData
 from lib.particles import Particle, ParticleSystem
+from engine.physics.particles import Emitter, EmitterShape, FlatGround
+from engine.physics.ground import Heightfield
+from engine.physics.noise import NoiseAtlas
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -39,6 +43,8 @@ STAR_CHARS = ["·", ".", "+", "*", "✦", "✧"]
 class WeatherAnimation:
     """Base class for weather animations."""
     
+    cloud_atlas = None  # NoiseAtlas shared by every cloud layer, loaded on first use
+    
     def __init__(self, screen: Screen, weather: WeatherData):
         self.screen = screen
         self.weather = weather
@@ -50,6 +56,41 @@ class WeatherAnimation:
         """Update animation state."""
         self.frame += 1
     
+    def emit(self, emitter: Emitter, system: ParticleSystem, colour: int) -> int:
+        """
+        Spawn this frame's batch from ``emitter`` into ``system``. Emitter
+        properties other than ``char`` are set as particle attributes.
+        """
+        count = emitter.due(1.0)
+        if count:
+            self.spawn_batch(system, *emitter.sample(count), colour)
+        return count
+    
+    def spawn_batch(self, system: ParticleSystem, positions, velocities,
+                    properties: dict, colour: int):
+        """Spawn one particle per row of an ``Emitter.sample`` batch."""
+        chars = properties.pop('char')
+        extras = {name: values.tolist() for name, values in properties.items()}
+        for i, ((x, y), (vx, vy)) in enumerate(zip(positions.tolist(), velocities.tolist())):
+            p = Particle(x=x, y=y, vx=vx, vy=vy, char=chars[i], colour=colour)
+            for name, values in extras.items():
+                setattr(p, name, values[i])
+            system.spawn(p)
+    
+    def cloud_cover(self, rows, drift: float, coverage: float = 0.8) -> np.ndarray:
+        """
+        Which cells of ``rows`` are cloud this frame: the densest
+        ``coverage`` of a pre-baked ``NoiseAtlas`` band, scrolled ``drift``
+        noise units per frame. One batched texture lookup per frame; the
+        atlas is baked once and then loaded from disk.
+        """
+        if WeatherAnimation.cloud_atlas is None:
+            WeatherAnimation.cloud_atlas = NoiseAtlas.load_or_bake(period=32, octaves=3)
+        xs = np.arange(self.width) * 0.15 + self.frame * drift
+        ys = np.asarray(rows, dtype=np.float64) * 0.5
+        density = WeatherAnimation.cloud_atlas.sample_grid(xs, ys)
+        return density >= np.quantile(density, 1.0 - coverage)
+    
     def draw(self):
         """Draw the animation."""
         pass
@@ -134,6 +175,13 @@ class RainAnimation(WeatherAnimation):
         super().__init__(screen, weather)
         self.rain = ParticleSystem(gravity=0.05, drag=0.01)
         self.splashes = ParticleSystem(gravity=0.02, drag=0.1)
+        # Drops end on the ground line; each hit throws up 1-2 splashes
+        self.rain.surfaces.append(FlatGround(self.height - 1))
+        self.splash_emitter = Emitter(
+            EmitterShape.POINT, origin=(0, self.height - 1), rate=0,
+            velocity_x=(-0.4, 0.4), velocity_y=(-0.3, -0.1),
+            properties={'char': ["·", "°"],
+                        'max_age': lambda rng, count: rng.integers(5, 11, count)})
         
         # Calculate intensity from weather data
         self.intensity = self._calculate_intensity()
@@ -144,6 +192,11 @@ class RainAnimation(WeatherAnimation):
         self.rain.wind = self.wind
         
         self.chars = HEAVY_RAIN_CHARS if weather.condition == WeatherCondition.HEAVY_RAIN else RAIN_CHARS
+        self.emitter = Emitter(
+            EmitterShape.RECT, origin=(-10, -3), extent=(self.width + 20, 3),
+            rate=self.intensity,
+            velocity_x=(self.wind * 3 - 0.1, self.wind * 3 + 0.1), velocity_y=(1.2, 2.0),
+            properties={'char': self.chars})
     
     def _calculate_intensity(self) -> int:
         """Calculate rain intensity from weather data."""
@@ -163,36 +216,23 @@ class RainAnimation(WeatherAnimation):
         super().update()
         
         # Spawn rain drops
-        for _ in range(self.intensity):
-            char = random.choice(self.chars)
-            drop = Particle(
-                x=random.uniform(-10, self.width + 10),
-                y=random.uniform(-3, 0),
-                vx=self.wind * 3 + random.uniform(-0.1, 0.1),
-                vy=random.uniform(1.2, 2.0),
-                char=char,
-                colour=Screen.COLOUR_CYAN
-            )
-            self.rain.spawn(drop)
-        
-        # Check for splashes
-        for p in self.rain.particles:
-            if p.y >= self.height - 2:
-                for _ in range(random.randint(1, 2)):
-                    splash = Particle(
-                        x=p.x,
-                        y=self.height - 1,
-                        vx=random.uniform(-0.4, 0.4),
-                        vy=random.uniform(-0.3, -0.1),
-                        char=random.choice(["·", "°"]),
-                        colour=Screen.COLOUR_WHITE,
-                        max_age=random.randint(5, 10)
-                    )
-                    self.splashes.spawn(splash)
+        self.emit(self.emitter, self.rain, Screen.COLOUR_CYAN)
         
         self.rain.update(self.width, self.height)
+        self._splash(self.rain.collisions)
         self.splashes.update(self.width, self.height)
     
+    def _splash(self, collisions: list):
+        """Splash particles where this frame's drops hit, as one batch."""
+        if not collisions:
+            return
+        emitter = self.splash_emitter
+        xs = np.array([x for _, x, _, _ in collisions])
+        xs = np.repeat(xs, emitter.rng.integers(1, 3, len(xs)))
+        positions, velocities, properties = emitter.sample(len(xs))
+        positions[:, 0] = xs
+        self.spawn_batch(self.splashes, positions, velocities, properties, Screen.COLOUR_WHITE)
+    
     def draw(self):
         self.screen.clear_buffer(Screen.COLOUR_BLACK, Screen.A_NORMAL, Screen.COLOUR_BLACK)
         
@@ -205,11 +245,12 @@ class RainAnimation(WeatherAnimation):
         self.draw_info_bar()
     
     def _draw_clouds(self):
-        """Draw cloud layer at top."""
-        for y in range(1, 4):
-            for x in range(self.width):
-                if random.random() < 0.8:
-                    char = "▓" if y == 2 else "░"
+        """Draw cloud layer at top, drifting with the wind."""
+        rows = range(1, 4)
+        for y, cover in zip(rows, self.cloud_cover(rows, 0.01 + self.wind * 0.02).tolist()):
+            char = "▓" if y == 2 else "░"
+            for x, cloud in enumerate(cover):
+                if cloud:
                     self.screen.print_at(char, x, y, colour=Screen.COLOUR_WHITE)
 
 
@@ -219,7 +260,10 @@ class SnowAnimation(WeatherAnimation):
     def __init__(self, screen: Screen, weather: WeatherData):
         super().__init__(screen, weather)
         self.snow = ParticleSystem(gravity=0.01, drag=0.0)
-        self.accumulation = [0] * self.width
+        # Snow cover: 1.5% of landing flakes stick, steep piles slump
+        self.ground = Heightfield(self.width, base_y=self.height - 1,
+                                  max_height=self.height // 4, capture=0.015,
+                                  repose=1.0, wrap=True)
         
         # Calculate intensity
         self.intensity = 3 if weather.condition == WeatherCondition.SNOW else 8
@@ -230,27 +274,24 @@ class SnowAnimation(WeatherAnimation):
         wind_dir = 1 if 0 <= weather.wind_direction <= 180 else -1
         self.wind = (weather.wind_speed_mph / 150) * wind_dir
         self.snow.wind = self.wind
+        
+        # Flakes along the top edge, each with its own sinusoidal drift phase
+        self.emitter = Emitter(
+            EmitterShape.LINE, origin=(0, 0), extent=(self.width, 0),
+            rate=self.intensity, velocity_x=(-0.1, 0.1), velocity_y=(0.2, 0.5),
+            properties={'char': SNOW_CHARS, '_drift_phase': (0, 2 * math.pi)})
     
     def update(self):
         super().update()
         
-        for _ in range(self.intensity):
-            char = random.choice(SNOW_CHARS)
-            flake = Particle(
-                x=random.uniform(0, self.width),
-                y=0,
-                vx=random.uniform(-0.1, 0.1),
-                vy=random.uniform(0.2, 0.5),
-                char=char,
-                colour=Screen.COLOUR_WHITE
-            )
-            # Add sinusoidal drift
-            flake._drift_phase = random.uniform(0, 2 * math.pi)
-            self.snow.spawn(flake)
+        self.emit(self.emitter, self.snow, Screen.COLOUR_WHITE)
         
         # Update with drift
-        new_particles = []
-        for p in self.snow.particles:
+        cover = self.ground.levels().tolist()
+        flakes = self.snow.particles
+        landed = []
+        kept = 0
+        for p in flakes:
             # Sinusoidal drift
             if hasattr(p, '_drift_phase'):
                 drift = 0.3 * math.sin(p.age * 0.1 + p._drift_phase)
@@ -258,24 +299,25 @@ class SnowAnimation(WeatherAnimation):
             
             p.update(self.snow.gravity, self.snow.wind, self.snow.drag)
             
-            # Check for accumulation
-            ground_level = self.height - 1 - self.accumulation[int(p.x) % self.width]
-            if p.y >= ground_level:
-                if random.random() < 0.015:
-                    idx = int(p.x) % self.width
-                    self.accumulation[idx] = min(self.accumulation[idx] + 1, self.height // 4)
+            # Landed on the snow cover?
+            if p.y >= self.height - 1 - cover[int(p.x) % self.width]:
+                landed.append(p.x)
             elif p.is_alive(self.width, self.height):
-                new_particles.append(p)
+                flakes[kept] = p
+                kept += 1
+        del flakes[kept:]
         
-        self.snow.particles = new_particles
+        if landed:
+            self.ground.deposit(landed)
+        self.ground.step()
     
     def draw(self):
         self.screen.clear_buffer(Screen.COLOUR_BLACK, Screen.A_NORMAL, Screen.COLOUR_BLACK)
         
         # Draw snow accumulation
-        for x in range(self.width):
-            for y in range(self.accumulation[x]):
-                self.screen.print_at("█", x, self.height - 1 - y, colour=Screen.COLOUR_WHITE)
+        for depth, row in enumerate(self.ground.stacked_rows()):
+            for x, text in Heightfield.runs(row):
+                self.screen.print_at(text, x, self.height - 1 - depth, colour=Screen.COLOUR_WHITE)
         
         # Draw falling snow
         for p in self.snow.particles:
@@ -306,6 +348,11 @@ class ThunderstormAnimation(WeatherAnimation):
         
         # Lightning probability based on conditions
         self.lightning_chance = 0.03
+        
+        self.emitter = Emitter(
+            EmitterShape.RECT, origin=(-20, -5), extent=(self.width + 40, 5),
+            rate=self.intensity, velocity_y=(1.5, 2.5),
+            properties={'char': HEAVY_RAIN_CHARS})
     
     def update(self):
         super().update()
@@ -313,17 +360,10 @@ class ThunderstormAnimation(WeatherAnimation):
         # Gusty wind
         self.rain.wind = self.wind + random.uniform(-0.08, 0.08)
         
-        # Spawn rain
-        for _ in range(self.intensity):
-            drop = Particle(
-                x=random.uniform(-20, self.width + 20),
-                y=random.uniform(-5, 0),
-                vx=self.rain.wind * 4 + random.uniform(-0.2, 0.2),
-                vy=random.uniform(1.5, 2.5),
-                char=random.choice(HEAVY_RAIN_CHARS),
-                colour=Screen.COLOUR_CYAN
-            )
-            self.rain.spawn(drop)
+        # Spawn rain (drops follow this frame's gust)
+        gust = self.rain.wind * 4
+        self.emitter.velocity_x = (gust - 0.2, gust + 0.2)
+        self.emit(self.emitter, self.rain, Screen.COLOUR_CYAN)
         
         # Random lightning
         if random.random() < self.lightning_chance:
@@ -369,9 +409,10 @@ class ThunderstormAnimation(WeatherAnimation):
         
         # Draw storm clouds
         cloud_char = "▓" if self.flash_timer > 0 else "░"
-        for y in range(1, 5):
-            for x in range(self.width):
-                if random.random() < 0.8:
+        rows = range(1, 5)
+        for y, cover in zip(rows, self.cloud_cover(rows, 0.02 + self.wind * 0.02).tolist()):
+            for x, cloud in enumerate(cover):
+                if cloud:
                     self.screen.print_at(cloud_char, x, y, colour=Screen.COLOUR_WHITE)
         
         self.rain.draw(self.screen)